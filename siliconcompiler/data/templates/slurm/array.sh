@@ -0,0 +1,11 @@
+#!/bin/bash
+
+case "${SLURM_ARRAY_TASK_ID}" in
+{%- for script, log in tasks %}
+    {{ loop.index0 }})
+        exec {{ script }} > {{ log }} 2>&1
+        ;;
+{%- endfor %}
+esac
+
+exit 1
@@ -6,4 +6,5 @@ python3 -m siliconcompiler.scheduler.run_node \
     -step {{ step }} \
     -index {{ index }} \
     -cwd ${PWD} \
-    -cachedir {{ cachedir }}
+    -cachedir {{ cachedir }} \
+    -unset_scheduler
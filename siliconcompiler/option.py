@@ -253,6 +253,21 @@ class OptionSchema(BaseSchema):
                 compilation. The hash values are stored in the hashvalue
                 field of the individual parameters."""))
 
+        schema.insert(
+            'compactmanifest',
+            Parameter(
+                'bool',
+                scope=Scope.JOB,
+                shorthelp="Option: compact node manifests",
+                switch="-compactmanifest <bool>",
+                example=["cli: -compactmanifest",
+                         "api: chip.set('compactmanifest', True)"],
+                help="""
+                Writes the input and output manifests of the nodes as compact manifests,
+                which only contain the values of the parameters and rely on the schema
+                classes for the help and the other static fields of the parameters.
+                The manifest of the job is always written as a complete manifest."""))
+
         schema.insert(
             'nodisplay',
             Parameter(
@@ -532,3 +547,85 @@ class OptionSchema(BaseSchema):
                 help="""
                 Maximum number of concurrent nodes to run in a job. If not set this will default
                 to the number of cpu cores available."""))
+
+        schema.insert(
+            'scheduler', 'policy',
+            Parameter(
+                '<ordered,criticalpath>',
+                defvalue='ordered',
+                scope=Scope.JOB,
+                shorthelp="Option: scheduling policy",
+                switch="-scheduler_policy <str>",
+                example=["cli: -scheduler_policy criticalpath",
+                         "api: chip.set('scheduler', 'policy', 'criticalpath')"],
+                help="""
+                Order in which nodes which are ready to run are started.
+
+                * ordered: nodes are started in step and index order.
+                * criticalpath: nodes with the longest estimated remaining path to
+                  the end of the flow are started first. Runtimes are estimated from
+                  the tasktime metrics of the jobs in the history and from the
+                  runtimes recorded in the build directory by previous runs. When a
+                  node is waiting for cores to become available, only nodes which
+                  are expected to finish before then are started ahead of it.
+                """))
+
+        schema.insert(
+            'scheduler', 'maxmemory',
+            Parameter(
+                'int',
+                unit='MB',
+                scope=Scope.JOB,
+                shorthelp="Option: maximum memory of local nodes",
+                switch="-maxmemory <int>",
+                example=["cli: -maxmemory 64000",
+                         "api: chip.set('scheduler', 'maxmemory', 64000)"],
+                help="""
+                Memory budget, specified in MB, for the nodes running on the local
+                machine. A node is only started if the estimated peak memory of the
+                running nodes and of the new node stays within the budget, unless no
+                other node is running. The peak memory of a node is taken from
+                :keypath:`option,scheduler,memory` if set, otherwise from the memory
+                metric of the node in the jobs in the history. Nodes without an
+                estimate are not limited by the budget. If not set, the memory is
+                not limited."""))
+
+        schema.insert(
+            'scheduler', 'memorypressure',
+            Parameter(
+                '<pause,requeue>',
+                scope=Scope.JOB,
+                shorthelp="Option: memory pressure action",
+                switch="-memorypressure <str>",
+                example=["cli: -memorypressure pause",
+                         "api: chip.set('scheduler', 'memorypressure', 'pause')"],
+                help="""
+                Action to take when the system memory usage exceeds 90% while
+                several nodes are running on the local machine. No new nodes are
+                started until the memory usage drops below 80%.
+
+                * pause: the most recently started node is suspended and resumed
+                  once the memory usage drops.
+                * requeue: the most recently started node is stopped and placed
+                  back in the queue to be run again.
+
+                If not set, no action is taken."""))
+
+        schema.insert(
+            'scheduler', 'async',
+            Parameter(
+                'bool',
+                defvalue=False,
+                scope=Scope.JOB,
+                shorthelp="Option: asynchronous job submission",
+                switch="-scheduler_async <bool>",
+                example=["cli: -scheduler_async true",
+                         "api: chip.set('scheduler', 'async', True)"],
+                help="""
+                Submit nodes to the job scheduler without keeping a local process
+                running for each node. With slurm, the nodes are submitted with
+                'sbatch', indices of the same step which are ready at the same
+                time are submitted as a job array, and all the submitted jobs
+                are tracked with a single periodic query of the scheduler.
+                Nodes submitted this way are not limited by
+                :keypath:`option,scheduler,maxnodes`."""))
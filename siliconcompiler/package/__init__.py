@@ -22,6 +22,7 @@ import uuid
 
 import os.path
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from fasteners import InterProcessLock
 from importlib.metadata import distributions, distribution
 from pathlib import Path
@@ -267,6 +268,21 @@ class Resolver:
                 Resolver.__CACHE[root_id] = {}
             Resolver.__CACHE[root_id][name] = path
 
+    @staticmethod
+    def update_cache(root, paths: dict):
+        """
+        Sets multiple cached paths for a given root object at once.
+
+        Args:
+            root: The root object (e.g., Chip).
+            paths (dict): A mapping of resolver cache names to paths.
+        """
+        with Resolver.__CACHE_LOCK:
+            root_id = Resolver.__get_root_id(root)
+            if root_id not in Resolver.__CACHE:
+                Resolver.__CACHE[root_id] = {}
+            Resolver.__CACHE[root_id].update(paths)
+
     @staticmethod
     def reset_cache(root):
         """
@@ -297,6 +313,22 @@ class Resolver:
         if cache_path:
             return cache_path
 
+        path = self._resolve_checked()
+
+        Resolver.set_cache(self.__root, self.cache_id, path)
+        return path
+
+    def _resolve_checked(self):
+        """
+        Resolves the data source without consulting the in-memory cache and
+        checks that the resolved path exists.
+
+        Returns:
+            str: The absolute path to the resolved data on the local filesystem.
+
+        Raises:
+            FileNotFoundError: If the resolved path does not exist.
+        """
         path = self.resolve()
         if not os.path.exists(path):
             raise FileNotFoundError(f"Unable to locate '{self.name}' at {path}")
@@ -306,7 +338,6 @@ class Resolver:
         else:
             self.logger.info(f'Found {self.name} data at {path}')
 
-        Resolver.set_cache(self.__root, self.cache_id, path)
         return path
 
     def __resolve_env(self, path):
@@ -549,6 +580,79 @@ class RemoteResolver(Resolver):
             return self.cache_path
 
 
+class ResolverPool:
+    """
+    Resolves multiple remote data sources concurrently.
+
+    Each resolver is still resolved through :meth:`RemoteResolver.resolve`, so
+    the per-resource locking and cache checks are unchanged, but independent
+    sources are fetched in parallel on a bounded pool of threads. The resolved
+    paths are stored in the in-memory cache of the root object in one batch.
+
+    Args:
+        root: The root object (e.g., Chip) the resolvers belong to.
+        max_workers (int): Maximum number of sources to fetch at once.
+    """
+
+    def __init__(self, root, max_workers: int = 8):
+        self.__root = root
+        self.__max_workers = max(1, max_workers)
+        self.__resolvers = {}
+
+    def add(self, resolver: Resolver) -> None:
+        """
+        Adds a resolver to the pool.
+
+        Resolvers that are already cached for the root object, or that have
+        the same cache id as a resolver in the pool, are skipped.
+
+        Args:
+            resolver (:class:`Resolver`): resolver to add.
+        """
+        if resolver.cache_id in self.__resolvers:
+            return
+        if Resolver.get_cache(self.__root, resolver.cache_id):
+            return
+        self.__resolvers[resolver.cache_id] = resolver
+
+    def resolve(self) -> dict:
+        """
+        Resolves all the resolvers in the pool.
+
+        Returns:
+            dict: A mapping of resolver cache ids to the resolved paths.
+
+        Raises:
+            Exception: the first error raised by a resolver, after the paths
+                of the remaining resolvers have been cached.
+        """
+        resolvers = list(self.__resolvers.values())
+        self.__resolvers.clear()
+        if not resolvers:
+            return {}
+
+        paths = {}
+        error = None
+        max_workers = min(self.__max_workers, len(resolvers))
+        with ThreadPoolExecutor(max_workers=max_workers,
+                                thread_name_prefix="sc_resolver") as pool:
+            futures = {pool.submit(resolver._resolve_checked): resolver
+                       for resolver in resolvers}
+            for future in as_completed(futures):
+                try:
+                    paths[futures[future].cache_id] = future.result()
+                except Exception as e:
+                    if error is None:
+                        error = e
+
+        Resolver.update_cache(self.__root, paths)
+
+        if error is not None:
+            raise error
+
+        return paths
+
+
 class FileResolver(Resolver):
     """
     A resolver for local file system paths.
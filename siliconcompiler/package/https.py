@@ -7,11 +7,11 @@ and unpacking archives (TAR or ZIP) from a given URL.
 import requests
 import shutil
 import tarfile
+import time
 import zipfile
 
 import os.path
 
-from io import BytesIO
 from urllib.parse import urlparse
 
 from siliconcompiler.package import RemoteResolver
@@ -41,8 +41,21 @@ class HTTPResolver(RemoteResolver):
     gzipped tarball or a zip file, and extracts its contents into the local
     cache. It also includes special handling to flatten the directory structure
     of archives downloaded from GitHub.
+
+    Archives are streamed to a partial download file next to the cache
+    directory, so large archives are never held in memory and an interrupted
+    download is resumed with an HTTP range request.
     """
 
+    # Size of the blocks read from the network
+    _CHUNK_SIZE = 64 * 1024
+
+    # Number of attempts to make before giving up on a download
+    _DOWNLOAD_ATTEMPTS = 5
+
+    # Minimum number of seconds between progress messages
+    _PROGRESS_INTERVAL = 10
+
     def check_cache(self):
         """
         Checks if the data has already been cached.
@@ -71,6 +84,89 @@ class HTTPResolver(RemoteResolver):
             data_url = f"{data_url}{self.reference}.tar.gz"
         return data_url
 
+    @property
+    def download_path(self) -> str:
+        """
+        The path to the file the archive is downloaded into before extraction.
+        """
+        return f"{self.cache_path}.download"
+
+    def progress(self, downloaded: int, total: int) -> None:
+        """
+        Reports the progress of a download.
+
+        Args:
+            downloaded (int): number of bytes downloaded so far
+            total (int): total size of the archive in bytes, or None if unknown
+        """
+        if total:
+            self.logger.info(f'Downloaded {downloaded / total:.0%} of {self.name} data '
+                             f'({downloaded >> 20} / {total >> 20} MiB)')
+        else:
+            self.logger.info(f'Downloaded {downloaded >> 20} MiB of {self.name} data')
+
+    def __download(self, data_url, headers, path):
+        """
+        Streams the archive into path, resuming partial downloads.
+        """
+        for attempt in range(1, self._DOWNLOAD_ATTEMPTS + 1):
+            offset = 0
+            request_headers = dict(headers)
+            if os.path.isfile(path):
+                offset = os.path.getsize(path)
+            if offset:
+                request_headers['Range'] = f'bytes={offset}-'
+
+            try:
+                with requests.get(data_url, stream=True, headers=request_headers) as response:
+                    if response.status_code == 416:
+                        # Range is not satisfiable, the partial file is stale
+                        os.remove(path)
+                        continue
+                    if not response.ok:
+                        raise FileNotFoundError(
+                            f'Failed to download {self.name} data source from {data_url}. '
+                            f'Status code: {response.status_code}')
+
+                    if response.status_code != 206:
+                        # Server ignored the range request, start over
+                        offset = 0
+
+                    total = response.headers.get('Content-Length')
+                    if total is not None:
+                        total = int(total) + offset
+
+                    self.__stream_response(response, path, offset, total)
+                    return
+            except (requests.exceptions.ConnectionError,
+                    requests.exceptions.ChunkedEncodingError) as e:
+                if attempt == self._DOWNLOAD_ATTEMPTS:
+                    raise
+                self.logger.warning(f'Download of {self.name} data interrupted ({e}), '
+                                    'resuming')
+
+    def __stream_response(self, response, path, offset, total):
+        """
+        Writes the response body to path in chunks, starting at offset.
+        """
+        downloaded = offset
+        last_report = time.monotonic()
+        with open(path, 'ab' if offset else 'wb') as f:
+            for chunk in response.iter_content(chunk_size=self._CHUNK_SIZE):
+                f.write(chunk)
+                downloaded += len(chunk)
+
+                now = time.monotonic()
+                if now - last_report >= self._PROGRESS_INTERVAL:
+                    last_report = now
+                    self.progress(downloaded, total)
+
+        if total is not None and downloaded < total:
+            raise requests.exceptions.ChunkedEncodingError(
+                f'received {downloaded} of {total} bytes')
+
+        self.progress(downloaded, total)
+
     def resolve_remote(self):
         """
         Fetches the remote archive, unpacks it, and stores it in the cache.
@@ -95,29 +191,27 @@ class HTTPResolver(RemoteResolver):
 
         self.logger.info(f'Downloading {self.name} data from {data_url}')
 
-        response = requests.get(data_url, stream=True, headers=headers)
-        if not response.ok:
-            raise FileNotFoundError(f'Failed to download {self.name} data source from {data_url}. '
-                                    f'Status code: {response.status_code}')
+        download_path = self.download_path
+        self.__download(data_url, headers, download_path)
 
         os.makedirs(self.cache_path, exist_ok=True)
 
-        # Download content into an in-memory buffer
-        fileobj = BytesIO(response.content)
-
         # Attempt to extract as a tarball, fall back to zip
         try:
-            with tarfile.open(fileobj=fileobj, mode='r:gz') as tar_ref:
+            with tarfile.open(download_path, mode='r|gz') as tar_ref:
                 tar_ref.extractall(path=self.cache_path)
         except tarfile.ReadError:
-            fileobj.seek(0)
             try:
-                with zipfile.ZipFile(fileobj) as zip_ref:
+                with zipfile.ZipFile(download_path) as zip_ref:
                     zip_ref.extractall(path=self.cache_path)
             except zipfile.BadZipFile:
+                shutil.rmtree(self.cache_path)
+                os.remove(download_path)
                 raise TypeError(f"Could not extract file from {data_url}. "
                                 "File is not a valid tar.gz or zip archive.")
 
+        os.remove(download_path)
+
         # --- GitHub-specific directory flattening ---
         # GitHub archives often have a single top-level directory like 'repo-v1.0'.
         # This logic moves the contents of that directory up one level for a cleaner cache.
@@ -1,8 +1,11 @@
+import gzip
+import hashlib
 import importlib
 import inspect
+import json
 import logging
 import os
-import shutil
+import pathlib
 import sys
 import uuid
 
@@ -13,7 +16,7 @@ from typing import Set, Union, List, Tuple, Type, Callable, TextIO
 
 from siliconcompiler.schema import BaseSchema, NamedSchema, EditableSchema, Parameter, Scope, \
     SCHEMA_VERSION
-from siliconcompiler.schema.parametervalue import NodeListValue, NodeSetValue
+from siliconcompiler.schema.parametervalue import NodeListValue, NodeSetValue, PathNodeValue
 from siliconcompiler.schema.utils import trim
 
 from siliconcompiler import DesignSchema, LibrarySchema
@@ -28,15 +31,108 @@ from siliconcompiler import OptionSchema
 from siliconcompiler.cmdlineschema import CommandLineSchema
 from siliconcompiler.dependencyschema import DependencySchema
 from siliconcompiler.pathschema import PathSchemaBase
+from siliconcompiler.package import Resolver, RemoteResolver, ResolverPool
 
 from siliconcompiler.report.dashboard.cli import CliDashboard
 from siliconcompiler.scheduler import Scheduler
 from siliconcompiler.utils.logging import SCColorLoggerFormatter, SCLoggerFormatter
 from siliconcompiler.utils import FilterDirectories, get_file_ext
+from siliconcompiler.utils.collect import FileCollector
 from siliconcompiler.utils.multiprocessing import MPManager
 from siliconcompiler.flows.showflow import ShowFlow
 
 
+class _HistoryReference(BaseSchema):
+    """
+    Placeholder for a history job stored outside of the project manifest.
+
+    The job is stored as a separate manifest, named after the hash of its
+    content, and is loaded the first time it is requested from
+    :meth:`Project.history`.
+
+    Args:
+        path (path): path to the stored manifest.
+        digest (str): sha256 hash of the stored manifest.
+    """
+
+    def __init__(self, path: str = None, digest: str = None):
+        super().__init__()
+
+        self.__path = path
+        self.__hash = digest
+        self.__project = None
+
+    @property
+    def path(self) -> str:
+        """
+        Returns the path to the stored manifest
+        """
+        return self.__path
+
+    @property
+    def hash(self) -> str:
+        """
+        Returns the hash of the stored manifest
+        """
+        return self.__hash
+
+    @staticmethod
+    def store(directory: str, manifest: dict) -> "_HistoryReference":
+        """
+        Stores a project manifest in a directory, if an identical manifest is
+        not already stored, and returns a reference to it.
+
+        Args:
+            directory (path): directory to store the manifest in.
+            manifest (dict): project manifest to store.
+        """
+        manifest = json.dumps(manifest, sort_keys=True)
+        digest = hashlib.sha256(manifest.encode("utf-8")).hexdigest()
+
+        path = os.path.join(directory, f"{digest}.json.gz")
+        if not os.path.exists(path):
+            os.makedirs(directory, exist_ok=True)
+            # Write to a new file and then move it to be atomic
+            new_file = f"{path}.{uuid.uuid4().hex}"
+            with gzip.open(new_file, mode="wt", encoding="utf-8") as f:
+                f.write(manifest)
+            os.replace(new_file, path)
+
+        return _HistoryReference(path, digest)
+
+    def load(self, directory: str = None) -> "Project":
+        """
+        Returns the stored project.
+
+        Args:
+            directory (path): directory to look for the manifest in, if it is no
+                longer at the recorded path.
+        """
+        if self.__project is None:
+            path = self.__path
+            if not os.path.exists(path) and directory:
+                path = os.path.join(directory, os.path.basename(path))
+            if not os.path.exists(path):
+                raise FileNotFoundError(f"history manifest not found: {self.__path}")
+            self.__project = BaseSchema.from_manifest(filepath=path)
+        return self.__project
+
+    def getdict(self, *keypath: str, include_default: bool = True,
+                values_only: bool = False):
+        manifest = super().getdict(*keypath, include_default=include_default,
+                                   values_only=values_only)
+        if not keypath:
+            manifest["path"] = self.__path
+            manifest["hash"] = self.__hash
+        return manifest
+
+    def _from_dict(self, manifest, keypath, version=None):
+        self.__path = manifest.pop("path", None)
+        self.__hash = manifest.pop("hash", None)
+        self.__project = None
+        return super()._from_dict(manifest, keypath, version)
+
+
 class Project(PathSchemaBase, CommandLineSchema, BaseSchema):
     """
     The Project class is the core object in SiliconCompiler, representing a
@@ -162,6 +258,21 @@ class Project(PathSchemaBase, CommandLineSchema, BaseSchema):
                 example=["api: project.set('option', 'nodashboard', True)"],
                 help=trim("""Disables the dashboard during execution""")))
 
+        schema.insert(
+            "option", "externalhistory",
+            Parameter(
+                "bool",
+                defvalue=False,
+                scope=Scope.GLOBAL,
+                switch=["-externalhistory <bool>"],
+                shorthelp="Option: Store history outside of the manifest",
+                example=["api: project.set('option', 'externalhistory', True)"],
+                help=trim("""Stores each job recorded in the history as a separate
+                    manifest in the history directory of the design's build
+                    directory, instead of embedding it in the project manifest.
+                    Identical jobs share the same file and jobs are loaded when
+                    they are accessed.""")))
+
         # Add history
         schema.insert("history", BaseSchema())
 
@@ -581,6 +692,34 @@ class Project(PathSchemaBase, CommandLineSchema, BaseSchema):
                 self.logger.warning(f"Setting design fileset to: {fileset}")
                 self.set("option", "fileset", fileset)
 
+    def _resolve_dataroots(self):
+        """
+        Fetches all remote data directories in the project concurrently before
+        the run starts, so nodes do not resolve them one after another.
+        """
+        pool = ResolverPool(self)
+        for keypath in self.allkeys(include_default=False):
+            if keypath[0] == "history":
+                continue
+            if len(keypath) < 3 or keypath[-3] != "dataroot" or keypath[-1] != "path":
+                continue
+
+            path = self.get(*keypath)
+            if not path:
+                continue
+            try:
+                resolver = Resolver.find_resolver(path)
+            except ValueError:
+                # Reported when the data directory is accessed
+                continue
+            if not issubclass(resolver, RemoteResolver):
+                continue
+
+            tag = self.get(*keypath[:-1], "tag")
+            pool.add(resolver(keypath[-2], self, path, tag))
+
+        pool.resolve()
+
     def run(self, raise_exception=False):
         '''
         Executes tasks in a flowgraph.
@@ -713,28 +852,38 @@ class Project(PathSchemaBase, CommandLineSchema, BaseSchema):
     def collect(self,
                 directory: str = None,
                 verbose: bool = True,
-                whitelist: List[str] = None):
+                whitelist: List[str] = None,
+                link: bool = True):
         '''
         Collects files found in the configuration dictionary and places
         them in :meth:`.getcollectiondir`. The function only copies in files that have the 'copy'
         field set as true.
 
+        Files are copied concurrently and files with identical content are
+        only stored once. Collecting into an existing directory only updates
+        the files which have changed.
+
         Args:
             directory (filepath): Output filepath
             verbose (bool): Flag to indicate if logging should be used
             whitelist (list[path]): List of directories that are allowed to be
                 collected. If a directory is is found that is not on this list
                 a RuntimeError will be raised.
+            link (bool): Flag to allow cloning or hardlinking files which are on
+                the same filesystem as the output directory instead of copying them.
         '''
 
         if not directory:
             directory = self.getcollectiondir()
         directory = os.path.abspath(directory)
 
-        # Remove existing directory
-        if os.path.exists(directory):
-            shutil.rmtree(directory)
-        os.makedirs(directory)
+        # Files are collected from their sources, unless they are being collected
+        # from the collection directory into a different directory
+        collection_dir = os.path.abspath(self.getcollectiondir())
+        if collection_dir == directory:
+            collection_dir = None
+
+        os.makedirs(directory, exist_ok=True)
 
         if verbose:
             self.logger.info(f'Collecting files to: {directory}')
@@ -785,19 +934,18 @@ class Project(PathSchemaBase, CommandLineSchema, BaseSchema):
                 else:
                     files[(key, step, index)] = values
 
+        abs_paths = self.__find_collect_files([*dirs.keys(), *files.keys()], collection_dir)
+
+        collector = FileCollector(directory, link=link)
+
         path_filter = FilterDirectories(self)
         for key, step, index in sorted(dirs.keys()):
-            abs_paths = self.find_files(*key, step=step, index=index)
-
             new_paths = set()
 
-            if not isinstance(abs_paths, (list, tuple, set)):
-                abs_paths = [abs_paths]
-
-            abs_paths = zip(abs_paths, dirs[(key, step, index)])
-            abs_paths = sorted(abs_paths, key=lambda p: p[0])
+            paths = zip(abs_paths[(key, step, index)], dirs[(key, step, index)])
+            paths = sorted(paths, key=lambda p: p[0] or "")
 
-            for abs_path, value in abs_paths:
+            for abs_path, value in paths:
                 if not abs_path:
                     raise FileNotFoundError(f"{value.get()} could not be copied")
 
@@ -807,7 +955,7 @@ class Project(PathSchemaBase, CommandLineSchema, BaseSchema):
 
                 imported = False
                 for new_path in new_paths:
-                    if abs_path.startwith(new_path):
+                    if abs_path.startswith(os.path.join(new_path, "")):
                         imported = True
                         break
                 if imported:
@@ -815,8 +963,8 @@ class Project(PathSchemaBase, CommandLineSchema, BaseSchema):
 
                 new_paths.add(abs_path)
 
-                import_path = os.path.join(directory, value.get_hashed_filename())
-                if os.path.exists(import_path):
+                import_path = value.get_hashed_filename()
+                if collector.has(import_path):
                     continue
 
                 if whitelist is not None and abs_path not in whitelist:
@@ -825,19 +973,14 @@ class Project(PathSchemaBase, CommandLineSchema, BaseSchema):
                 if verbose:
                     self.logger.info(f"  Collecting directory: {abs_path}")
                 path_filter.abspath = abs_path
-                shutil.copytree(abs_path, import_path, ignore=path_filter.filter)
+                collector.add_directory(abs_path, import_path, ignore=path_filter.filter)
                 path_filter.abspath = None
 
         for key, step, index in sorted(files.keys()):
-            abs_paths = self.find_files(*key, step=step, index=index)
-
-            if not isinstance(abs_paths, (list, tuple, set)):
-                abs_paths = [abs_paths]
+            paths = zip(abs_paths[(key, step, index)], files[(key, step, index)])
+            paths = sorted(paths, key=lambda p: p[0] or "")
 
-            abs_paths = zip(abs_paths, files[(key, step, index)])
-            abs_paths = sorted(abs_paths, key=lambda p: p[0])
-
-            for abs_path, value in abs_paths:
+            for abs_path, value in paths:
                 if not abs_path:
                     raise FileNotFoundError(f"{value.get()} could not be copied")
 
@@ -845,13 +988,62 @@ class Project(PathSchemaBase, CommandLineSchema, BaseSchema):
                     # File already imported in directory
                     continue
 
-                import_path = os.path.join(directory, value.get_hashed_filename())
-                if os.path.exists(import_path):
+                if self.__is_collected(collector, value):
                     continue
 
                 if verbose:
                     self.logger.info(f"  Collecting file: {abs_path}")
-                shutil.copy2(abs_path, import_path)
+                collector.add_file(abs_path, value.get_hashed_filename())
+
+        collector.collect()
+
+    def __find_collect_files(self, keys: List[Tuple], collection_dir: str):
+        '''
+        Resolves the paths of the keys to collect in one batch, so the data
+        directories are fetched once and shared between keys.
+
+        Args:
+            keys (list of tuple): list of (keypath, step, index) to resolve.
+            collection_dir (path): collection directory to search for files.
+
+        Returns:
+            dict mapping each (keypath, step, index) to a list of paths.
+        '''
+        if keys:
+            self._resolve_dataroots()
+
+        resolvers = {}
+        paths = {}
+        for key, step, index in keys:
+            schema = self.get(*key[:-1], field="schema")
+            if id(schema) not in resolvers:
+                resolvers[id(schema)] = (schema, schema._find_files_dataroot_resolvers())
+
+            abs_paths = BaseSchema.find_files(self, *key, step=step, index=index,
+                                              packages=resolvers[id(schema)][1],
+                                              collection_dir=collection_dir,
+                                              cwd=self.cwd)
+            if not isinstance(abs_paths, (list, tuple, set)):
+                abs_paths = [abs_paths]
+            paths[(key, step, index)] = abs_paths
+        return paths
+
+    @staticmethod
+    def __is_collected(collector: FileCollector, value) -> bool:
+        '''
+        Returns true if the path, or a directory containing it, is already
+        part of the collection.
+        '''
+        package = value.get(field="package")
+        parts = pathlib.PurePosixPath(value.get()).parts
+        for n in range(1, len(parts) + 1):
+            basename = str(pathlib.PurePosixPath(*parts[0:n]))
+            import_name = PathNodeValue.generate_hashed_path(basename, package)
+            if n < len(parts):
+                import_name = os.path.join(import_name, *parts[n:])
+            if collector.has(import_name):
+                return True
+        return False
 
     def history(self, job: str) -> "Project":
         '''
@@ -867,7 +1059,16 @@ class Project(PathSchemaBase, CommandLineSchema, BaseSchema):
         if job not in self.getkeys("history"):
             raise KeyError(f"{job} is not a valid job")
 
-        return self.get("history", job, field="schema")
+        history = self.get("history", job, field="schema")
+        if isinstance(history, _HistoryReference):
+            return history.load(self.__gethistorydir())
+        return history
+
+    def __gethistorydir(self) -> str:
+        """
+        Returns the directory used to store history jobs outside of the manifest.
+        """
+        return os.path.join(self._getbuilddir(), self.name, "history")
 
     def _record_history(self):
         '''
@@ -875,10 +1076,17 @@ class Project(PathSchemaBase, CommandLineSchema, BaseSchema):
         '''
 
         job = self.get("option", "jobname")
-        proj = self.copy()
 
-        # Remove history from proj
-        EditableSchema(proj).insert("history", BaseSchema(), clobber=True)
+        if self.get("option", "externalhistory"):
+            manifest = self.getdict()
+            # Remove history from manifest
+            manifest["history"] = {}
+            proj = _HistoryReference.store(self.__gethistorydir(), manifest)
+        else:
+            proj = self.copy()
+
+            # Remove history from proj
+            EditableSchema(proj).insert("history", BaseSchema(), clobber=True)
 
         if job in self.getkeys("history"):
             self.logger.warning(f"Overwriting job {job}")
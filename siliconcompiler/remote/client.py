@@ -1,17 +1,17 @@
 # Copyright 2020 Silicon Compiler Authors. All Rights Reserved.
 
 import json
-import multiprocessing
 import os
 import requests
 import shutil
 import time
 import tarfile
-import tempfile
 
 import os.path
 import urllib.parse
 
+from concurrent.futures import ThreadPoolExecutor
+
 from siliconcompiler import utils
 from siliconcompiler import NodeStatus as SCNodeStatus
 
@@ -23,6 +23,7 @@ from siliconcompiler.schema import Journal
 from siliconcompiler.utils.logging import get_console_formatter
 
 from siliconcompiler.remote import JobStatus, NodeStatus
+from siliconcompiler.remote import transfer
 
 # Step name to use while logging
 remote_step_name = 'remote'
@@ -70,7 +71,12 @@ service, provided by SiliconCompiler, is not intended to process proprietary IP.
 '''
         # Runtime
         self.__download_pool = None
+        self.__download_workers = 4
+        self.__session = None
         self.__check_interval = None
+        # Long-poll support for 'check_progress', 0 if the server only supports polling
+        self.__progress_wait = 0
+        self.__progress_version = None
         self.__node_information = None
 
     def __get_remote_config_file(self, fail=True):
@@ -244,12 +250,20 @@ service, provided by SiliconCompiler, is not intended to process proprietary IP.
         return self.__post('/delete_job/', post_action, success_action)
 
     def check_job_status(self):
+        post_params = self.__get_post_params(include_job_id=True, include_job_name=True)
+        timeout = self.__timeout
+        if self.__progress_wait and self.__progress_version is not None:
+            # Let the server hold the request until the job makes progress
+            post_params['version'] = self.__progress_version
+            post_params['wait'] = self.__progress_wait
+            timeout += self.__progress_wait
+
         # Make the request and print its response.
         def post_action(url):
             return requests.post(
                 url,
-                data=json.dumps(self.__get_post_params(include_job_id=True, include_job_name=True)),
-                timeout=self.__timeout)
+                data=json.dumps(post_params),
+                timeout=timeout)
 
         def error_action(code, msg):
             return {
@@ -260,6 +274,8 @@ service, provided by SiliconCompiler, is not intended to process proprietary IP.
         def success_action(resp):
             json_response = json.loads(resp.text)
 
+            self.__progress_version = json_response.get('version', None)
+
             if json_response['status'] != JobStatus.RUNNING:
                 if json_response['status'] == JobStatus.REJECTED:
                     self.__logger.error(f'Job was rejected: {json_response["message"]}')
@@ -513,38 +529,35 @@ service, provided by SiliconCompiler, is not intended to process proprietary IP.
 
         remote_resume = not self.__chip.get('option', 'clean') and \
             self.__chip.get('record', 'remoteid')
-        # Only package and upload the entry steps if starting a new job.
-        if not remote_resume:
-            upload_file = tempfile.TemporaryFile(prefix='sc', suffix='remote.tar.gz')
-            with tarfile.open(fileobj=upload_file, mode='w:gz') as tar:
-                tar.add(self.__chip.getworkdir(), arcname='')
-            # Flush file to ensure everything is written
-            upload_file.flush()
-
-            # We no longer need the collected files
-            shutil.rmtree(self.__chip.getcollectiondir())
 
         if 'pre_upload' in remote_status:
             self.__logger.info(remote_status['pre_upload']['message'])
             time.sleep(remote_status['pre_upload']['delay'])
 
+        codec = transfer.select_codec(remote_status.get('codecs', None))
+
         # Make the actual request, streaming the bulk data as a multipart file.
         # Redirected POST requests are translated to GETs. This is actually
         # part of the HTTP spec, so we need to manually follow the trail.
         post_params = {
             'chip_cfg': self.__chip.getdict(),
-            'params': self.__get_post_params(include_job_id=True)
+            'params': self.__get_post_params(include_job_id=True),
+            'codec': codec
         }
 
-        post_files = {'params': json.dumps(post_params)}
+        post_files = {'params': post_params}
+        # Only package and upload the entry steps if starting a new job.
+        # The workdir is compressed while it is being uploaded.
         if not remote_resume:
-            post_files['import'] = upload_file
-            upload_file.seek(0)
+            workdir = self.__chip.getworkdir()
+            post_files['import'] = lambda: transfer.stream_directory(workdir, codec)
 
         def post_action(url):
+            body = transfer.MultipartStream(post_files)
             return requests.post(
                 url,
-                files=post_files,
+                data=iter(body),
+                headers={'Content-Type': body.content_type},
                 timeout=self.__timeout)
 
         def success_action(resp):
@@ -552,7 +565,8 @@ service, provided by SiliconCompiler, is not intended to process proprietary IP.
 
         resp = self.__post('/remote_run/', post_action, success_action)
         if not remote_resume:
-            upload_file.close()
+            # We no longer need the collected files
+            shutil.rmtree(self.__chip.getcollectiondir(), ignore_errors=True)
 
         if 'message' in resp and resp['message']:
             self.__logger.info(resp['message'])
@@ -563,6 +577,7 @@ service, provided by SiliconCompiler, is not intended to process proprietary IP.
         self.__logger.info(f"Your job's reference ID is: {resp['job_hash']}")
 
         self.__check_interval = remote_status['progress_interval']
+        self.__progress_wait = remote_status.get('progress_wait', 0)
 
     def __run_preprocess(self):
         '''
@@ -655,11 +670,18 @@ service, provided by SiliconCompiler, is not intended to process proprietary IP.
         self.__chip._logger_console.setFormatter(
             get_console_formatter(self.__chip, True, self.STEP_NAME, None))
         if not self.__download_pool:
-            self.__download_pool = multiprocessing.Pool()
+            self.__download_pool = ThreadPoolExecutor(
+                max_workers=self.__download_workers,
+                thread_name_prefix="sc_remote_fetch")
+            self.__session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=self.__download_workers)
+            self.__session.mount('http://', adapter)
+            self.__session.mount('https://', adapter)
 
         if self.__check_interval is None:
             check_info = self.__check()
             self.__check_interval = check_info['progress_interval']
+            self.__progress_wait = check_info.get('progress_wait', 0)
 
         self.__setup_information_fetched = False
         self.__setup_information_loaded = False
@@ -699,7 +721,8 @@ service, provided by SiliconCompiler, is not intended to process proprietary IP.
                 if sleepremaining <= 0:
                     break
                 time.sleep(1)
-            if sleepremaining > 0:
+            if sleepremaining > 0 and not self.__progress_wait:
+                # Server cannot hold the progress request, so poll periodically
                 time.sleep(sleepremaining)
 
             # Check progress
@@ -746,9 +769,11 @@ service, provided by SiliconCompiler, is not intended to process proprietary IP.
 
     def _finalize_loop(self):
         if self.__download_pool:
-            self.__download_pool.close()
-            self.__download_pool.join()
+            self.__download_pool.shutdown(wait=True)
             self.__download_pool = None
+        if self.__session:
+            self.__session.close()
+            self.__session = None
 
         self.__import_run_manifests({})
 
@@ -758,8 +783,13 @@ service, provided by SiliconCompiler, is not intended to process proprietary IP.
             self.__logger.info(f'    {self.__node_information[node]["print"]}')
         else:
             self.__setup_information_fetched = True
-        self.__download_pool.apply_async(Client._fetch_result, (self, node),
-                                         error_callback=lambda err: self.__logger.error(str(err)))
+        future = self.__download_pool.submit(self._fetch_result, node)
+        future.add_done_callback(self.__report_fetch_error)
+
+    def __report_fetch_error(self, future):
+        error = future.exception()
+        if error:
+            self.__logger.error(str(error))
 
     def _fetch_result(self, node):
         '''
@@ -772,65 +802,65 @@ service, provided by SiliconCompiler, is not intended to process proprietary IP.
         job_hash = self.__chip.get('record', 'remoteid')
         local_dir = self.__chip.get('option', 'builddir')
 
-        # Set default results archive path if necessary, and fetch it.
-        with tempfile.TemporaryDirectory(prefix=f'sc_{job_hash}_', suffix=f'_{node}') as tmpdir:
-            results_path = os.path.join(tmpdir, 'result.tar.gz')
-
-            with open(results_path, 'wb') as rd:
-                # Fetch results archive.
-                def post_action(url):
-                    post_params = self.__get_post_params()
-                    if node:
-                        post_params['node'] = node
-                    return requests.post(
-                        url,
-                        data=json.dumps(post_params),
-                        stream=True,
-                        timeout=self.__timeout)
-
-                def success_action(resp):
-                    shutil.copyfileobj(resp.raw, rd)
-                    return 0
-
-                def error_action(code, msg):
-                    # Results are fetched in parallel, and a failure in one node
-                    # does not necessarily mean that the whole job failed.
-                    if node:
-                        self.__logger.warning(f'Could not fetch results for node: {node}')
-                    else:
-                        self.__logger.warning('Could not fetch results for final results.')
-                    return 404
-
-                results_code = self.__post(
-                    f'/get_results/{job_hash}.tar.gz',
-                    post_action,
-                    success_action,
-                    error_action=error_action
-                )
-
-            # Note: the server should eventually delete the results as they age out (~8h),
-            # but this will give us a brief period to look at failed results.
-            if results_code:
-                return
+        # Fetch results archive and extract it while it is being downloaded.
+        def post_action(url):
+            post_params = self.__get_post_params()
+            if node:
+                post_params['node'] = node
+            session = self.__session or requests
+            return session.post(
+                url,
+                data=json.dumps(post_params),
+                stream=True,
+                timeout=self.__timeout)
 
-            # Unzip the results.
-            # Unauthenticated jobs get a gzip archive, authenticated jobs get nested archives.
-            # So we need to extract and delete those.
-            # Archive contents: server-side build directory. Format:
-            # [job_hash]/[design]/[job_name]/[step]/[index]/...
-            try:
-                with tarfile.open(results_path, 'r:gz') as tar:
-                    tar.extractall(path=tmpdir)
-            except tarfile.TarError as e:
-                self.__logger.error(f'Failed to extract data from {results_path}: {e}')
-                return
+        def success_action(resp):
+            with resp:
+                return self.__extract_result(resp.raw, job_hash, local_dir, node)
 
-            work_dir = os.path.join(tmpdir, job_hash)
-            if os.path.exists(work_dir):
-                shutil.copytree(work_dir, local_dir, dirs_exist_ok=True)
+        def error_action(code, msg):
+            # Results are fetched in parallel, and a failure in one node
+            # does not necessarily mean that the whole job failed.
+            if node:
+                self.__logger.warning(f'Could not fetch results for node: {node}')
             else:
-                self.__logger.error(f'Empty file returned from remote for: {node}')
-                return
+                self.__logger.warning('Could not fetch results for final results.')
+            return 404
+
+        # Note: the server should eventually delete the results as they age out (~8h),
+        # but this will give us a brief period to look at failed results.
+        self.__post(
+            f'/get_results/{job_hash}.tar.gz',
+            post_action,
+            success_action,
+            error_action=error_action
+        )
+
+    def __extract_result(self, fileobj, job_hash, local_dir, node):
+        '''
+        Helper method to extract a results archive into the local build directory.
+        Archive contents: server-side build directory. Format:
+        [job_hash]/[design]/[job_name]/[step]/[index]/...
+        '''
+        found = False
+        try:
+            with transfer.open_reader(fileobj, transfer.Codec.GZIP) as tar:
+                for member in tar:
+                    name = os.path.normpath(member.name)
+                    if not name.startswith(f'{job_hash}{os.sep}'):
+                        continue
+                    member.name = os.path.relpath(name, job_hash)
+                    tar.extract(member, path=local_dir)
+                    found = True
+        except tarfile.TarError as e:
+            self.__logger.error(f'Failed to extract data for {node}: {e}')
+            return 1
+
+        if not found:
+            self.__logger.error(f'Empty file returned from remote for: {node}')
+            return 1
+
+        return 0
 
     def configure_server(self, server=None, username=None, password=None):
 
@@ -955,6 +985,7 @@ service, provided by SiliconCompiler, is not intended to process proprietary IP.
         attributes = self.__dict__.copy()
 
         attributes['_Client__download_pool'] = None
+        attributes['_Client__session'] = None
         attributes['_Client__dashboard'] = None
 
         return attributes
@@ -2,7 +2,7 @@ from siliconcompiler.schema import BaseSchema, EditableSchema, Parameter, Scope
 from siliconcompiler.cmdlineschema import CommandLineSchema
 
 
-SCHEMA_VERSION = '0.0.3'
+SCHEMA_VERSION = '0.0.4'
 
 
 class ServerSchema(CommandLineSchema, BaseSchema):
@@ -101,3 +101,49 @@ class ServerSchema(CommandLineSchema, BaseSchema):
                          "api: chip.set('option', 'checkinterval', 10)"],
                 help="""
                 Interval between checks to announce to clients"""))
+
+        schema.insert(
+            'option', 'maxjobs',
+            Parameter(
+                'int',
+                scope=Scope.GLOBAL,
+                defvalue=4,
+                require='all',
+                shorthelp="Maximum number of concurrent jobs",
+                switch="-maxjobs <int>",
+                example=["cli: -maxjobs 8",
+                         "api: server.set('option', 'maxjobs', 8)"],
+                help="""
+                Maximum number of jobs the server runs at the same time, additional
+                jobs are queued until a running job completes."""))
+
+        schema.insert(
+            'option', 'maxuserjobs',
+            Parameter(
+                'int',
+                scope=Scope.GLOBAL,
+                defvalue=0,
+                require='all',
+                shorthelp="Maximum number of concurrent jobs per user",
+                switch="-maxuserjobs <int>",
+                example=["cli: -maxuserjobs 2",
+                         "api: server.set('option', 'maxuserjobs', 2)"],
+                help="""
+                Maximum number of jobs a single user can run at the same time,
+                if 0 the number is only limited by [option,maxjobs]. Queued jobs are
+                started from the user with the fewest running jobs first."""))
+
+        schema.insert(
+            'option', 'maxqueue',
+            Parameter(
+                'int',
+                scope=Scope.GLOBAL,
+                defvalue=64,
+                require='all',
+                shorthelp="Maximum number of queued jobs",
+                switch="-maxqueue <int>",
+                example=["cli: -maxqueue 16",
+                         "api: server.set('option', 'maxqueue', 16)"],
+                help="""
+                Maximum number of jobs waiting to run, new jobs are rejected
+                while the queue is full."""))
@@ -1,5 +1,6 @@
 # Copyright 2020 Silicon Compiler Authors. All Rights Reserved.
 
+import asyncio
 import fastjsonschema
 import json
 import logging
@@ -8,9 +9,11 @@ import shutil
 import sys
 import tarfile
 import threading
+import time
 import uuid
 
 from aiohttp import web
+from collections import deque
 from pathlib import Path
 from fastjsonschema import JsonSchemaException
 
@@ -29,6 +32,7 @@ from siliconcompiler.scheduler import TaskScheduler
 
 from siliconcompiler.remote import JobStatus, NodeStatus
 from siliconcompiler.remote.schema import ServerSchema
+from siliconcompiler.remote import transfer
 
 
 # Compile validation code for API request bodies.
@@ -71,6 +75,9 @@ class Server(ServerSchema):
 
     __version__ = '0.0.1'
 
+    # Maximum number of seconds a 'check_progress' request will wait for progress
+    __max_progress_wait = 30
+
     ####################
     def __init__(self, loglevel="info"):
         '''
@@ -92,6 +99,18 @@ class Server(ServerSchema):
         self.sc_jobs = {}
         self.sc_chip_lookup = {}
 
+        # Progress events, used by 'check_progress' to wait for job changes
+        self.sc_jobs_version = {}
+        self.__loop = None
+        self.__progress_waiters = {}
+
+        # Queue of jobs waiting to run, per user
+        self.__job_queue_cond = threading.Condition()
+        self.__job_queue = {}
+        self.__job_running = {}
+        self.__job_wait_times = deque(maxlen=32)
+        self.__job_workers = []
+
     def __run_start(self, chip):
         flow = chip.get("option", "flow")
         nodes = chip.get("flowgraph", flow, field="schema").get_nodes()
@@ -117,10 +136,13 @@ class Server(ServerSchema):
                 self.sc_jobs[job_name][name]["status"] = \
                     chip.get('record', 'status', step=step, index=index)
 
+            self.__notify_progress(job_name)
+
     def __node_start(self, chip, step, index):
         with self.sc_jobs_lock:
             job_name = self.sc_chip_lookup[chip]["name"]
             self.sc_jobs[job_name][f"{step}{index}"]["status"] = NodeStatus.RUNNING
+            self.__notify_progress(job_name)
 
     def __node_end(self, chip, step, index):
         with self.sc_jobs_lock:
@@ -138,6 +160,46 @@ class Server(ServerSchema):
         with self.sc_jobs_lock:
             self.sc_jobs[job_name][f"{step}{index}"]["status"] = \
                 chip.get('record', 'status', step=step, index=index)
+            self.__notify_progress(job_name)
+
+    def __notify_progress(self, job_name):
+        '''
+        Records a change in the job status and wakes up any 'check_progress'
+        requests waiting on the job. Must be called while holding sc_jobs_lock.
+        '''
+        self.sc_jobs_version[job_name] = self.sc_jobs_version.get(job_name, 0) + 1
+        if self.__loop:
+            self.__loop.call_soon_threadsafe(self.__wake_progress_waiters, job_name)
+
+    def __wake_progress_waiters(self, job_name):
+        for waiter in self.__progress_waiters.pop(job_name, []):
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def __wait_for_progress(self, job_name, version, timeout):
+        '''
+        Waits until the job status changes from version, or the timeout expires.
+        '''
+        with self.sc_jobs_lock:
+            if job_name not in self.sc_jobs or \
+                    self.sc_jobs_version.get(job_name, 0) != version:
+                return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self.__progress_waiters.setdefault(job_name, []).append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            waiters = self.__progress_waiters.get(job_name, [])
+            if waiter in waiters:
+                waiters.remove(waiter)
+            if not waiters:
+                self.__progress_waiters.pop(job_name, None)
+
+    async def __on_startup(self, app):
+        self.__loop = asyncio.get_running_loop()
 
     def run(self):
         if not os.path.exists(self.nfs_mount):
@@ -178,6 +240,14 @@ class Server(ServerSchema):
                                     "file in the server's working directory. "
                                     "(User : Key) mappings were not imported.")
 
+        # Start the job workers
+        for n in range(max(1, self.get('option', 'maxjobs'))):
+            worker = threading.Thread(target=self.__job_worker,
+                                      name=f"sc_server_job{n}",
+                                      daemon=True)
+            worker.start()
+            self.__job_workers.append(worker)
+
         # Register callbacks
         TaskScheduler.register_callback("pre_run", self.__run_start)
         TaskScheduler.register_callback("pre_node", self.__node_start)
@@ -185,6 +255,7 @@ class Server(ServerSchema):
 
         # Create a minimal web server to process the 'remote_run' API call.
         self.app = web.Application()
+        self.app.on_startup.append(self.__on_startup)
         self.app.add_routes([
             web.post('/remote_run/', self.handle_remote_run),
             web.post('/check_progress/', self.handle_check_progress),
@@ -237,6 +308,9 @@ class Server(ServerSchema):
                 if 'chip_cfg' not in params:
                     return self.__response('Manifest not provided.', status=400)
                 chip_cfg = params['chip_cfg']
+                codec = params.get('codec', transfer.Codec.GZIP)
+                if codec not in transfer.available_codecs():
+                    return self.__response(f'Unsupported codec: {codec}', status=400)
 
         # Process input parameters
         job_params, response = self._check_request(params['params'],
@@ -244,6 +318,33 @@ class Server(ServerSchema):
         if response is not None:
             return response
 
+        if self.__queue_full():
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            return self.__response('Server is busy, job queue is full.', status=503)
+
+        # Extracting the archive and parsing the manifest is slow, so keep
+        # it out of the event loop.
+        project = await asyncio.get_running_loop().run_in_executor(
+            None, self.__prepare_job, chip_cfg, tmp_file, codec)
+        job_hash = project.get('record', 'remoteid')
+
+        # Log job received
+        self.logger.info(f"Received job: {job_hash}")
+
+        # Queue the job to run with the configured clustering option.
+        self.__queue_job(project, job_params['username'])
+
+        # Return a response to the client.
+        return web.json_response({'message': f"Starting job: {job_hash}",
+                                  'interval': self.checkinterval,
+                                  'job_hash': job_hash})
+
+    def __prepare_job(self, chip_cfg, tmp_file, codec):
+        '''
+        Creates the project for a job and extracts the uploaded archive.
+        '''
+
         # Create a dummy Chip object to make schema traversal easier.
         # start with a dummy name, as this will be overwritten
         project = Project.from_manifest(cfg=chip_cfg)
@@ -264,7 +365,8 @@ class Server(ServerSchema):
 
         # Move the uploaded archive and un-zip it.
         # (Contents will be encrypted for authenticated jobs)
-        with tarfile.open(tmp_file, "r:gz") as tar:
+        with open(tmp_file, "rb") as fileobj, \
+                transfer.open_reader(fileobj, codec) as tar:
             tar.extractall(path=job_dir)
 
         # Delete the temporary file if it still exists.
@@ -283,19 +385,83 @@ class Server(ServerSchema):
         # Mark as quite to make server logging easier
         project.set('option', 'quiet', True)
 
-        # Log job received
-        self.logger.info(f"Received job: {job_hash}")
+        return project
 
-        # Run the job with the configured clustering option. (Non-blocking)
-        job_proc = threading.Thread(target=self.remote_sc,
-                                    args=[project,
-                                          job_params['username']])
-        job_proc.start()
+    ####################
+    def __queue_full(self):
+        with self.__job_queue_cond:
+            queued = sum(len(jobs) for jobs in self.__job_queue.values())
+        return queued >= self.get('option', 'maxqueue')
 
-        # Return a response to the client.
-        return web.json_response({'message': f"Starting job: {job_hash}",
-                                  'interval': self.checkinterval,
-                                  'job_hash': job_hash})
+    def __queue_job(self, chip, username):
+        '''
+        Registers a job and adds it to the queue of jobs waiting to run.
+        '''
+        self.__register_job(chip, username)
+
+        with self.__job_queue_cond:
+            self.__job_queue.setdefault(username, deque()).append((time.time(), chip))
+            self.__job_queue_cond.notify()
+
+    def __next_job(self):
+        '''
+        Returns the next job to run, or None if no job can be started.
+        Jobs are taken from the user with the fewest running jobs, then in the
+        order they were received. Must be called while holding the queue lock.
+        '''
+        max_user_jobs = self.get('option', 'maxuserjobs')
+
+        selected = None
+        for username, jobs in self.__job_queue.items():
+            running = self.__job_running.get(username, 0)
+            if max_user_jobs > 0 and running >= max_user_jobs:
+                continue
+            key = (running, jobs[0][0])
+            if selected is None or key < selected[0]:
+                selected = (key, username)
+
+        if selected is None:
+            return None
+
+        username = selected[1]
+        queued_at, chip = self.__job_queue[username].popleft()
+        if not self.__job_queue[username]:
+            del self.__job_queue[username]
+        self.__job_running[username] = self.__job_running.get(username, 0) + 1
+        self.__job_wait_times.append(time.time() - queued_at)
+        return username, chip
+
+    def __job_worker(self):
+        while True:
+            with self.__job_queue_cond:
+                job = self.__next_job()
+                while job is None:
+                    self.__job_queue_cond.wait()
+                    job = self.__next_job()
+
+            username, chip = job
+            try:
+                self.remote_sc(chip, username)
+            except Exception as e:
+                self.logger.exception(e)
+            finally:
+                with self.__job_queue_cond:
+                    self.__job_running[username] -= 1
+                    if not self.__job_running[username]:
+                        del self.__job_running[username]
+                    self.__job_queue_cond.notify_all()
+
+    def __queue_status(self):
+        with self.__job_queue_cond:
+            wait_time = 0
+            if self.__job_wait_times:
+                wait_time = sum(self.__job_wait_times) / len(self.__job_wait_times)
+            return {
+                'depth': sum(len(jobs) for jobs in self.__job_queue.values()),
+                'running': sum(self.__job_running.values()),
+                'max_jobs': self.get('option', 'maxjobs'),
+                'wait_time': round(wait_time, 3)
+            }
 
     ####################
     async def handle_get_results(self, request):
@@ -379,13 +545,19 @@ class Server(ServerSchema):
 
         jobname = self.job_name(username, job_hash)
 
+        # Wait for the job to make progress since the last request.
+        if job_params.get('wait') and 'version' in job_params:
+            await self.__wait_for_progress(
+                jobname, job_params['version'],
+                min(job_params['wait'], self.__max_progress_wait))
+
         # Determine if the job is running.
-        # TODO: Return information about individual flowgraph nodes.
         with self.sc_jobs_lock:
             if jobname in self.sc_jobs:
                 resp = {
                     'status': JobStatus.RUNNING,
                     'message': self.sc_jobs[jobname],
+                    'version': self.sc_jobs_version.get(jobname, 0)
                 }
             else:
                 resp = {
@@ -408,13 +580,16 @@ class Server(ServerSchema):
             return response
 
         resp = {
-            'status': 'ready',
+            'status': 'busy' if self.__queue_full() else 'ready',
             'versions': {
                 'sc': sc_version,
                 'sc_schema': sc_schema_version,
                 'sc_server': Server.__version__,
             },
-            'progress_interval': self.checkinterval
+            'progress_interval': self.checkinterval,
+            'progress_wait': self.__max_progress_wait,
+            'codecs': transfer.available_codecs(),
+            'queue': self.__queue_status()
         }
 
         username = job_params['username']
@@ -433,10 +608,10 @@ class Server(ServerSchema):
             return job_hash
 
     ####################
-    def remote_sc(self, chip, username):
+    def __register_job(self, chip, username):
         '''
-        Async method to delegate an '.run()' command to a host,
-        and send an email notification when the job completes.
+        Records the nodes of a job, so its progress can be reported while it
+        is queued or running.
         '''
 
         # Assemble core job parameters.
@@ -471,6 +646,19 @@ class Server(ServerSchema):
             }
             self.sc_jobs[sc_job_name] = nodes
 
+    def remote_sc(self, chip, username):
+        '''
+        Method to delegate an '.run()' command to a host, called from the job
+        workers for jobs taken from the job queue.
+        '''
+
+        job_hash = chip.get('record', 'remoteid')
+        sc_job_name = self.job_name(username, job_hash)
+        with self.sc_jobs_lock:
+            registered = chip in self.sc_chip_lookup
+        if not registered:
+            self.__register_job(chip, username)
+
         build_dir = os.path.join(self.nfs_mount, job_hash)
         chip.set('option', 'builddir', build_dir)
         chip.set('option', 'remote', False)
@@ -479,13 +667,16 @@ class Server(ServerSchema):
             # Run the job with slurm clustering.
             chip.set('option', 'scheduler', 'name', 'slurm')
 
-        # Run the job.
-        chip.run()
-
-        # Mark the job hash as being done.
-        with self.sc_jobs_lock:
-            self.sc_jobs.pop(sc_job_name)
-            self.sc_chip_lookup.pop(chip)
+        try:
+            # Run the job.
+            chip.run()
+        finally:
+            # Mark the job hash as being done.
+            with self.sc_jobs_lock:
+                self.sc_jobs.pop(sc_job_name)
+                self.sc_chip_lookup.pop(chip)
+                self.__notify_progress(sc_job_name)
+                self.sc_jobs_version.pop(sc_job_name, None)
 
     ####################
     def __auth_password(self, username, password):
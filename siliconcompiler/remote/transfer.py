@@ -0,0 +1,212 @@
+"""
+Helpers to stream archives between the remote client and server.
+
+Archives are compressed while they are being sent and extracted while they are
+being received, so a transfer never needs a complete copy of the archive on
+disk or in memory. Zstandard is used when available on both sides, otherwise
+gzip is used.
+"""
+
+import contextlib
+import json
+import queue
+import tarfile
+import threading
+import uuid
+
+try:
+    import zstandard
+    _has_zstd = True
+except ModuleNotFoundError:
+    _has_zstd = False
+
+
+class Codec():
+    '''
+    Enum class to help ensure consistent codec names
+    '''
+
+    GZIP = "gzip"
+    ZSTD = "zstd"
+
+
+# Size of the blocks passed between the archiver and the network
+CHUNK_SIZE = 1024 * 1024
+
+
+def available_codecs():
+    '''
+    Returns the list of supported codecs, in order of preference.
+    '''
+    if _has_zstd:
+        return [Codec.ZSTD, Codec.GZIP]
+    return [Codec.GZIP]
+
+
+def select_codec(remote_codecs):
+    '''
+    Returns the preferred codec supported by both sides of the transfer.
+
+    Args:
+        remote_codecs (list of str): codecs supported by the other side, if None
+            only gzip is assumed to be supported.
+    '''
+    if not remote_codecs:
+        return Codec.GZIP
+
+    for codec in available_codecs():
+        if codec in remote_codecs:
+            return codec
+    return Codec.GZIP
+
+
+@contextlib.contextmanager
+def open_writer(fileobj, codec):
+    '''
+    Opens a streaming tar archive for writing.
+
+    Args:
+        fileobj (file): file object to write the compressed archive to
+        codec (str): compression codec to use
+    '''
+    if codec == Codec.ZSTD:
+        if not _has_zstd:
+            raise ValueError(f"{codec} is not supported")
+        compressor = zstandard.ZstdCompressor(threads=-1)
+        with compressor.stream_writer(fileobj, closefd=False) as zfile:
+            with tarfile.open(fileobj=zfile, mode='w|') as tar:
+                yield tar
+    elif codec == Codec.GZIP:
+        with tarfile.open(fileobj=fileobj, mode='w|gz') as tar:
+            yield tar
+    else:
+        raise ValueError(f"{codec} is not supported")
+
+
+@contextlib.contextmanager
+def open_reader(fileobj, codec):
+    '''
+    Opens a streaming tar archive for reading.
+
+    Args:
+        fileobj (file): file object to read the compressed archive from
+        codec (str): compression codec used by the archive
+    '''
+    if codec == Codec.ZSTD:
+        if not _has_zstd:
+            raise ValueError(f"{codec} is not supported")
+        decompressor = zstandard.ZstdDecompressor()
+        with decompressor.stream_reader(fileobj, closefd=False) as zfile:
+            with tarfile.open(fileobj=zfile, mode='r|') as tar:
+                yield tar
+    elif codec == Codec.GZIP:
+        with tarfile.open(fileobj=fileobj, mode='r|gz') as tar:
+            yield tar
+    else:
+        raise ValueError(f"{codec} is not supported")
+
+
+class _QueueWriter():
+    '''
+    Write-only file object that hands the written blocks to a queue.
+    '''
+
+    def __init__(self, blocks):
+        self.__blocks = blocks
+        self.__buffer = bytearray()
+
+    def write(self, data):
+        self.__buffer.extend(data)
+        if len(self.__buffer) >= CHUNK_SIZE:
+            self.flush()
+        return len(data)
+
+    def flush(self):
+        if self.__buffer:
+            self.__blocks.put(bytes(self.__buffer))
+            self.__buffer.clear()
+
+
+def stream_directory(path, codec, arcname=''):
+    '''
+    Generator which yields a compressed tar archive of a directory.
+
+    The archive is built in a background thread while the blocks are consumed,
+    and at most a few blocks are held in memory at a time.
+
+    Args:
+        path (path): directory to archive
+        codec (str): compression codec to use
+        arcname (str): name of the directory in the archive
+    '''
+    blocks = queue.Queue(maxsize=4)
+    error = []
+    stop = threading.Event()
+
+    def archive():
+        try:
+            writer = _QueueWriter(blocks)
+            with open_writer(writer, codec) as tar:
+                tar.add(path, arcname=arcname,
+                        filter=lambda info: None if stop.is_set() else info)
+            writer.flush()
+        except BaseException as e:
+            error.append(e)
+        finally:
+            blocks.put(None)
+
+    thread = threading.Thread(target=archive, name="sc_remote_archive", daemon=True)
+    thread.start()
+    try:
+        while True:
+            block = blocks.get()
+            if block is None:
+                break
+            yield block
+    finally:
+        # Unblock the archiver if the consumer stopped early
+        stop.set()
+        while thread.is_alive():
+            try:
+                blocks.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        thread.join()
+
+    if error:
+        raise error[0]
+
+
+class MultipartStream():
+    '''
+    Streaming multipart/form-data request body.
+
+    Args:
+        fields (dict): mapping of field names to either a JSON serializable object,
+            or a callable returning an iterator of bytes for file fields.
+    '''
+
+    def __init__(self, fields):
+        self.__fields = fields
+        self.__boundary = uuid.uuid4().hex
+
+    @property
+    def content_type(self):
+        '''
+        Returns the content type header for the request
+        '''
+        return f'multipart/form-data; boundary={self.__boundary}'
+
+    def __iter__(self):
+        for name, value in self.__fields.items():
+            header = f'--{self.__boundary}\r\nContent-Disposition: form-data; name="{name}"'
+            if callable(value):
+                yield (f'{header}; filename="{name}"\r\n'
+                       'Content-Type: application/octet-stream\r\n\r\n').encode('utf-8')
+                yield from value()
+            else:
+                yield (f'{header}\r\n'
+                       'Content-Type: application/json\r\n\r\n').encode('utf-8')
+                yield json.dumps(value).encode('utf-8')
+            yield b'\r\n'
+        yield f'--{self.__boundary}--\r\n'.encode('utf-8')
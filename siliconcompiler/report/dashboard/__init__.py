@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from enum import Enum
 
 
@@ -17,6 +18,43 @@ class DashboardType(Enum):
     CLI = 'cli'
 
 
+class DashboardEventType(Enum):
+    """
+    An enumeration of the node events a dashboard can be notified of.
+
+    Attributes:
+        NODE_STARTED: A node has started running.
+        NODE_FINISHED: A node has finished, or will not run, with a final status.
+        METRIC: A metric of a node has been updated.
+    """
+    NODE_STARTED = 'started'
+    NODE_FINISHED = 'finished'
+    METRIC = 'metric'
+
+
+@dataclass
+class DashboardEvent:
+    """
+    A data class describing a single change to a node during a run.
+
+    Attributes:
+        type (DashboardEventType): The kind of event.
+        step (str): The step of the node.
+        index (str): The index of the node.
+        status (str): The new status of the node, for node events.
+        time (float): The time the node started, for started events.
+        metric (str): The name of the metric, for metric events.
+        value: The new value of the metric, for metric events.
+    """
+    type: DashboardEventType
+    step: str
+    index: str
+    status: str = None
+    time: float = None
+    metric: str = None
+    value: object = None
+
+
 class AbstractDashboard(ABC):
     """
     Abstract base class defining the interface for dashboard implementations.
@@ -64,6 +102,20 @@ class AbstractDashboard(ABC):
         """
         pass
 
+    def update_status(self, events):
+        """
+        Updates the dashboard with a list of node events.
+
+        This is a lightweight alternative to :meth:`update_manifest` used while
+        nodes are running. Dashboards which cannot apply the events directly
+        fall back to a full manifest update.
+
+        Args:
+            events (list of :class:`DashboardEvent`): The node events, in the
+                order they occurred.
+        """
+        self.update_manifest()
+
     @abstractmethod
     def update_graph_manifests(self):
         """
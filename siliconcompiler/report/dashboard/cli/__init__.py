@@ -104,6 +104,16 @@ class CliDashboard(AbstractDashboard):
             starttimes = payload["starttimes"]
         self._dashboard.update_manifest(self._chip, starttimes=starttimes)
 
+    def update_status(self, events):
+        """
+        Updates the dashboard with node events, without re-reading the manifest.
+
+        Args:
+            events (list of :class:`DashboardEvent`): The node events, in the
+                order they occurred.
+        """
+        self._dashboard.update_status(self._chip, events)
+
     def update_graph_manifests(self):
         """Placeholder method for updating graph manifests. Currently not implemented."""
         pass
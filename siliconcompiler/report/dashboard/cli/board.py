@@ -9,7 +9,7 @@ import threading
 from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Dict
+from typing import List, Dict, Tuple
 
 from rich import box
 from rich.theme import Theme
@@ -21,6 +21,7 @@ from rich.console import Group
 from rich.padding import Padding
 
 from siliconcompiler import SiliconCompilerError, NodeStatus
+from siliconcompiler.report.dashboard import DashboardEventType
 from siliconcompiler.utils.logging import SCColorLoggerFormatter
 from siliconcompiler.flowgraph import RuntimeFlowgraph
 
@@ -410,6 +411,12 @@ class Board:
         """
         self._console = Console(theme=Board.__theme)
 
+        # Cached node distances for the last flowgraph seen
+        self._node_dists = (None, {})
+
+        # Flowgraph information for each job, used to apply status updates
+        self._job_context = {}
+
         self.live = Live(
             console=self._console,
             screen=True,
@@ -492,6 +499,90 @@ class Board:
 
         self._update_render_data(chip, starttimes=starttimes)
 
+    def update_status(self, chip, events):
+        """
+        Applies node events to the cached job data of a chip.
+
+        Only the nodes named in the events are updated, so the manifest is not
+        walked again. If the job has not been loaded yet, a full update from
+        the manifest is performed instead.
+
+        Args:
+            chip: The SiliconCompiler chip object.
+            events (list of DashboardEvent): The node events, in the order
+                they occurred.
+        """
+        if not self._active or not chip:
+            return
+
+        chip_id = f"{chip.get('option', 'design')}/{chip.get('option', 'jobname')}"
+
+        context = self._job_context.get(chip_id)
+        with self._job_data_lock:
+            job_data = self._job_data.get(chip_id)
+
+        if context is None or job_data is None:
+            starttimes = {(event.step, event.index): event.time for event in events
+                          if event.type == DashboardEventType.NODE_STARTED}
+            self._update_render_data(chip, starttimes=starttimes)
+            return
+
+        nodestatus = context["status"]
+        node_entries = {(entry["step"], entry["index"]): entry for entry in job_data.nodes}
+
+        for event in events:
+            node = (event.step, event.index)
+            if node not in nodestatus:
+                continue
+
+            entry = node_entries.get(node)
+            if event.type == DashboardEventType.NODE_STARTED:
+                nodestatus[node] = event.status or NodeStatus.RUNNING
+                context["starttimes"][node] = event.time
+                if entry:
+                    entry["time"]["start"] = event.time
+            elif event.type == DashboardEventType.NODE_FINISHED:
+                nodestatus[node] = event.status
+            elif event.type == DashboardEventType.METRIC:
+                if event.metric == "totaltime":
+                    context["totaltime"][node] = event.value or 0
+                if not entry:
+                    continue
+                if event.metric == "tasktime" and NodeStatus.is_done(nodestatus[node]):
+                    entry["time"]["duration"] = event.value
+                if event.metric in self._metrics:
+                    value = "" if event.value is None else str(event.value)
+                    entry["metrics"][self._metrics.index(event.metric)] = value
+
+            if entry:
+                entry["status"] = nodestatus[node]
+
+        node_priority = Board._get_node_priority(
+            list(nodestatus.keys()), nodestatus, context["entry"], context["dists"],
+            context["lowest"])
+
+        nodes = []
+        for entry in job_data.nodes:
+            node = (entry["step"], entry["index"])
+            if nodestatus[node] == NodeStatus.SKIPPED:
+                continue
+            entry["print"]["priority"] = node_priority[node]
+            nodes.append(entry)
+        job_data.nodes = nodes
+
+        statuses = nodestatus.values()
+        job_data.total = len(nodestatus)
+        job_data.error = len([status for status in statuses if NodeStatus.is_error(status)])
+        job_data.success = len([status for status in statuses if NodeStatus.is_success(status)])
+        job_data.finished = len([status for status in statuses if NodeStatus.is_done(status)])
+        job_data.skipped = len([status for status in statuses if status == NodeStatus.SKIPPED])
+        job_data.runtime = max([0, *context["totaltime"].values()])
+
+        with self._job_data_lock:
+            self._job_data[chip_id] = job_data
+            self._board_info.data_modified = True
+            self._render_event.set()
+
     def is_running(self) -> bool:
         """
         Checks if the dashboard rendering thread is currently active.
@@ -954,6 +1045,117 @@ class Board:
             self._board_info.data_modified = True
             self._render_event.set()
 
+    @staticmethod
+    def _get_search_distances(search) -> Dict[Tuple[str, str], Dict[Tuple[str, str], int]]:
+        """
+        Computes the distance from every node to all the nodes reachable from it.
+
+        Args:
+            search (dict): mapping of nodes to the nodes one step away from them.
+
+        Returns:
+            dict: mapping of nodes to a mapping of reachable nodes and their
+                  distance in steps.
+        """
+        dists = {}
+        for start in search:
+            node_dists = {}
+            pending = deque([(start, 0)])
+            while pending:
+                node, level = pending.popleft()
+                for snode in search.get(node, ()):
+                    if snode in node_dists:
+                        continue
+                    node_dists[snode] = level + 1
+                    pending.append((snode, level + 1))
+            dists[start] = node_dists
+        return dists
+
+    def _get_node_distances(self, nodes, node_inputs, node_outputs):
+        """
+        Computes the relative distances between the nodes of a flowgraph.
+
+        The distances only depend on the shape of the flowgraph, so they are
+        cached and only recomputed when the flowgraph changes.
+
+        Args:
+            nodes (list): nodes in the flowgraph.
+            node_inputs (dict): mapping of nodes to their input nodes.
+            node_outputs (dict): mapping of nodes to their output nodes.
+
+        Returns:
+            dict: mapping of nodes to a mapping of related nodes and their
+                  weighted distance.
+        """
+        key = (
+            tuple((node, tuple(sorted(node_inputs.get(node, ())))) for node in nodes),
+            tuple(sorted((node, tuple(sorted(outputs)))
+                         for node, outputs in node_outputs.items()))
+        )
+
+        cache_key, node_dists = self._node_dists
+        if cache_key == key:
+            return node_dists
+
+        input_dists = Board._get_search_distances(node_inputs)
+        output_dists = Board._get_search_distances(node_outputs)
+
+        node_dists = {}
+        for cnode in nodes:
+            # use 2x + 1 to give completed nodes sorting priority
+            node_dists[cnode] = {
+                node: 2*level+1 for node, level in input_dists.get(cnode, {}).items()
+            }
+            node_dists[cnode].update({
+                node: 2*level for node, level in output_dists.get(cnode, {}).items()
+            })
+
+        self._node_dists = (key, node_dists)
+        return node_dists
+
+    @staticmethod
+    def _get_node_priority(nodes, nodestatus, flow_entry_nodes, node_dists, lowest_priority):
+        """
+        Computes the printing priority of the nodes, based on their distance
+        from the running, entry and failed nodes.
+
+        Args:
+            nodes (list): nodes in the flowgraph.
+            nodestatus (dict): mapping of nodes to their status.
+            flow_entry_nodes (set): entry nodes of the flowgraph.
+            node_dists (dict): relative node distances from :meth:`_get_node_distances`.
+            lowest_priority (int): priority of nodes not related to any start node.
+
+        Returns:
+            dict: mapping of nodes to their priority, lower is more important.
+        """
+        running_nodes = set([node for node in nodes if NodeStatus.is_running(nodestatus[node])])
+        done_nodes = set([node for node in nodes if NodeStatus.is_done(nodestatus[node])])
+        error_nodes = set([node for node in nodes if NodeStatus.is_error(nodestatus[node])])
+
+        node_priority = {node: lowest_priority for node in nodes}
+
+        remaining_entry_nodes = flow_entry_nodes - done_nodes
+        startnodes = running_nodes.union(remaining_entry_nodes)
+        priority_node = {0: startnodes.union(error_nodes)}
+        for node in nodes:
+            dists = node_dists[node]
+            levels = []
+            for snode in startnodes:
+                if snode not in dists:
+                    continue
+                levels.append(dists[snode])
+            if not levels:
+                continue
+            priority_node.setdefault(min(levels), set()).add(node)
+        for level, level_nodes in priority_node.items():
+            for node in level_nodes:
+                if node not in node_priority:
+                    continue
+                node_priority[node] = min(node_priority[node], level)
+
+        return node_priority
+
     def _get_job(self, chip, starttimes=None) -> JobData:
         """
         Parses a chip object to extract detailed information about the flowgraph,
@@ -979,6 +1181,7 @@ class Board:
         node_priority = {}
         flow_entry_nodes = set()
         flow_exit_nodes = set()
+        node_dists = None
         try:
             node_inputs = {}
             node_outputs = {}
@@ -1016,52 +1219,12 @@ class Board:
                 chip.get("flowgraph", flow, field="schema").get_entry_nodes())
             flow_exit_nodes = set(runtime_flow.get_exit_nodes())
 
-            running_nodes = set([node for node in nodes if NodeStatus.is_running(nodestatus[node])])
-            done_nodes = set([node for node in nodes if NodeStatus.is_done(nodestatus[node])])
-            error_nodes = set([node for node in nodes if NodeStatus.is_error(nodestatus[node])])
-
-            def get_node_distance(node, search, level=1):
-                dists = {}
-
-                if node not in search:
-                    return dists
-
-                for snode in search[node]:
-                    dists[snode] = level
-                    dists.update(get_node_distance(snode, search, level=level+1))
-
-                return dists
-
             # Compute relative node distances
-            node_dists = {}
-            for cnode in nodes:
-                # use 2x + 1 to give completed nodes sorting priority
-                node_dists[cnode] = {
-                    node: 2*level+1 for node, level in get_node_distance(cnode, node_inputs).items()
-                }
-                node_dists[cnode].update({
-                    node: 2*level for node, level in get_node_distance(cnode, node_outputs).items()
-                })
+            node_dists = self._get_node_distances(nodes, node_inputs, node_outputs)
 
             # Compute printing priority of nodes
-            remaining_entry_nodes = flow_entry_nodes - done_nodes
-            startnodes = running_nodes.union(remaining_entry_nodes)
-            priority_node = {0: startnodes.union(error_nodes)}
-            for node in nodes:
-                dists = node_dists[node]
-                levels = []
-                for snode in startnodes:
-                    if snode not in dists:
-                        continue
-                    levels.append(dists[snode])
-                if not levels:
-                    continue
-                priority_node.setdefault(min(levels), set()).add(node)
-            for level, level_nodes in priority_node.items():
-                for node in level_nodes:
-                    if node not in node_priority:
-                        continue
-                    node_priority[node] = min(node_priority[node], level)
+            node_priority.update(Board._get_node_priority(
+                nodes, nodestatus, flow_entry_nodes, node_dists, lowest_priority))
         except SiliconCompilerError:
             pass
 
@@ -1071,13 +1234,22 @@ class Board:
         job_data = JobData()
         job_data.jobname = jobname
         job_data.design = design
-        totaltimes = [
-            chip.get("metric", "totaltime", step=step, index=index) or 0
+        totaltimes = {
+            (step, index): chip.get("metric", "totaltime", step=step, index=index) or 0
             for step, index in nodes
-        ]
-        if not totaltimes:
-            totaltimes = [0]
-        job_data.runtime = max(totaltimes)
+        }
+        job_data.runtime = max([0, *totaltimes.values()])
+
+        if node_dists is not None:
+            # Keep the flowgraph information needed to apply status updates
+            self._job_context[f"{design}/{jobname}"] = {
+                "status": nodestatus.copy(),
+                "entry": flow_entry_nodes,
+                "dists": node_dists,
+                "lowest": lowest_priority,
+                "totaltime": totaltimes,
+                "starttimes": dict(starttimes)
+            }
 
         for step, index in nodes:
             status = nodestatus[(step, index)]
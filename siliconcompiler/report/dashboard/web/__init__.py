@@ -61,6 +61,8 @@ class WebDashboard(AbstractDashboard):
                                             suffix=f'_{self.__chip.design.name}')
         self.__manifest = os.path.join(self.__directory, 'manifest.json')
         self.__manifest_lock = os.path.join(self.__directory, 'manifest.lock')
+        self.__status = os.path.join(self.__directory, 'status.json')
+        self.__status_events = []
         self.__port = port
         dirname = os.path.dirname(__file__)
         self.__streamlit_file = os.path.join(dirname, 'viewer.py')
@@ -100,6 +102,7 @@ class WebDashboard(AbstractDashboard):
         self.__config = {
             "manifest": self.__manifest,
             "lock": self.__manifest_lock,
+            "status": self.__status,
             "graph_chips": graph_chips_config
         }
 
@@ -151,6 +154,48 @@ class WebDashboard(AbstractDashboard):
         with self.__lock:
             shutil.move(new_file, self.__manifest)
 
+            # Events are relative to the last manifest
+            self.__status_events = []
+            self.__write_status()
+
+    def update_status(self, events):
+        """
+        Writes the node events to the shared temporary directory.
+
+        The dashboard process applies the events to the last manifest it read,
+        so the full manifest does not need to be written and parsed again
+        while nodes are running.
+
+        Args:
+            events (list of :class:`DashboardEvent`): The node events, in the
+                order they occurred.
+        """
+        if not self.__manifest:
+            return
+
+        for event in events:
+            self.__status_events.append({
+                "type": event.type.value,
+                "step": event.step,
+                "index": event.index,
+                "status": event.status,
+                "metric": event.metric,
+                "value": event.value
+            })
+
+        with self.__lock:
+            self.__write_status()
+
+    def __write_status(self):
+        """
+        Writes the node events recorded since the last manifest update.
+        """
+        # Write to a new file and then move it to be atomic
+        new_file = f"{self.__status}.new.json"
+        with open(new_file, 'w') as f:
+            json.dump(self.__status_events, f)
+        shutil.move(new_file, self.__status)
+
     def update_graph_manifests(self):
         """
         Writes the manifests for all additional graph chips to the shared directory.
@@ -15,12 +15,15 @@ The main functions are:
 """
 import argparse
 import fasteners
+import functools
 import json
 import os
 import streamlit
 import streamlit_javascript
 
 from siliconcompiler import Project
+from siliconcompiler.report import utils as report_utils
+from siliconcompiler.report.dashboard import DashboardEventType
 
 # --- State Keys ---
 # These constants define the keys used to store and access data in
@@ -47,6 +50,9 @@ LOADED_CHIPS = "loaded_chips"
 MANIFEST_FILE = "manifest_file"
 MANIFEST_LOCK = "manifest_lock"
 MANIFEST_TIME = "manifest_time"
+STATUS_FILE = "status_file"
+STATUS_TIME = "status_time"
+STATUS_APPLIED = "status_applied"
 IS_RUNNING = "is_flow_running"
 GRAPH_JOBS = "graph_jobs"
 
@@ -80,28 +86,83 @@ def update_manifest():
     Checks for updates to the main manifest file and reloads it if necessary.
 
     Compares the current file modification time with the stored time. If they
-    differ, it re-reads the manifest, re-populates the chip objects (including
-    history), and updates the timestamp in the session state.
+    differ, it re-reads the manifest, re-populates the chip objects, and
+    updates the timestamp in the session state. Historical runs are shared
+    with the manifest and only loaded when they are selected.
+
+    While the flow is running, the node events written next to the manifest
+    are applied to the loaded chip, so the manifest is not parsed again when
+    only node statuses and metrics change.
 
     Returns:
         bool: True if the manifest was updated, False otherwise.
     """
+    changed = False
+
     file_time = os.stat(get_key(MANIFEST_FILE)).st_mtime
 
     if get_key(MANIFEST_TIME) != file_time:
         with get_key(MANIFEST_LOCK):
             proj = Project.from_manifest(filepath=get_key(MANIFEST_FILE))
         set_key(MANIFEST_TIME, file_time)
+        set_key(STATUS_TIME, None)
+        set_key(STATUS_APPLIED, 0)
         debug_print("Read manifest", get_key(MANIFEST_FILE))
 
         add_chip("default", proj)
 
-        # Load historical runs from the manifest
+        # Register historical runs from the manifest
         for history in proj.getkeys('history'):
-            add_chip(history, proj.history(history).copy())
+            add_chip(history, functools.partial(proj.history, history))
 
-        return True
-    return False
+        changed = True
+
+    if update_status():
+        changed = True
+
+    return changed
+
+
+def update_status():
+    """
+    Applies the node events written since the last manifest to the loaded chip.
+
+    Returns:
+        bool: True if any events were applied, False otherwise.
+    """
+    status_file = get_key(STATUS_FILE)
+    if not status_file or not os.path.exists(status_file):
+        return False
+
+    file_time = os.stat(status_file).st_mtime
+    if get_key(STATUS_TIME) == file_time:
+        return False
+
+    with get_key(MANIFEST_LOCK):
+        with open(status_file, 'r') as f:
+            events = json.load(f)
+    set_key(STATUS_TIME, file_time)
+
+    applied = get_key(STATUS_APPLIED)
+    if len(events) < applied:
+        # Events were reset, the events are absolute so apply all of them again
+        applied = 0
+    if len(events) == applied:
+        return False
+
+    chip = get_chip("default")
+    for event in events[applied:]:
+        step, index = event["step"], event["index"]
+        if event["type"] == DashboardEventType.METRIC.value:
+            chip.set('metric', event["metric"], event["value"], step=step, index=index)
+        elif event["status"]:
+            chip.set('record', 'status', event["status"], step=step, index=index)
+    set_key(STATUS_APPLIED, len(events))
+    debug_print("Applied status", len(events) - applied)
+
+    report_utils._clear_metric_store(chip)
+
+    return True
 
 
 def init():
@@ -125,6 +186,9 @@ def init():
     _add_default(MANIFEST_FILE, None)
     _add_default(MANIFEST_LOCK, None)
     _add_default(MANIFEST_TIME, None)
+    _add_default(STATUS_FILE, None)
+    _add_default(STATUS_TIME, None)
+    _add_default(STATUS_APPLIED, 0)
     _add_default(IS_RUNNING, False)
     _add_default(GRAPH_JOBS, None)
     _add_default(UI_WIDTH, None)
@@ -152,6 +216,7 @@ def init():
 
         set_key(MANIFEST_FILE, config["manifest"])
         set_key(MANIFEST_LOCK, fasteners.InterProcessLock(config["lock"]))
+        set_key(STATUS_FILE, config.get("status"))
 
         update_manifest()
         chip = get_chip("default")
@@ -211,7 +276,12 @@ def get_chip(job=None):
     """
     if not job:
         job = get_key(SELECTED_JOB)
-    return get_key(LOADED_CHIPS)[job]
+    chip = get_key(LOADED_CHIPS)[job]
+    if callable(chip):
+        # Load history jobs on first use
+        chip = chip()
+        add_chip(job, chip)
+    return chip
 
 
 def add_chip(name, chip):
@@ -220,7 +290,8 @@ def add_chip(name, chip):
 
     Args:
         name (str): The name to associate with the chip (e.g., 'default' or a history ID).
-        chip (Chip): The Chip object to store.
+        chip (Chip): The Chip object to store, or a function returning it,
+            which is called the first time the chip is requested.
     """
     streamlit.session_state[LOADED_CHIPS][name] = chip
 
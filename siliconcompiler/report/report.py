@@ -22,7 +22,8 @@ def make_metric_dataframe(chip):
     '''
     from pandas import DataFrame
 
-    nodes, errors, metrics, metrics_unit, metrics_to_show, reports = utils._collect_data(chip)
+    nodes, errors, metrics, metrics_unit, metrics_to_show, reports = \
+        utils._collect_data(chip, cache=True)
     # converts from 2d dictionary to pandas DataFrame, transposes so
     # orientation is correct, and filters based on the metrics we track
     data = (DataFrame.from_dict(metrics, orient='index').transpose())
@@ -364,7 +365,7 @@ def get_chart_selection_options(chips):
     for chip_and_chip_name in chips:
         chip = chip_and_chip_name['chip_object']
         nodes_list, _, _, _, chip_metrics, _ = \
-            utils._collect_data(chip, format_as_string=False)
+            utils._collect_data(chip, format_as_string=False, cache=True)
         nodes.update(set([f'{step}/{index}' for step, index in nodes_list]))
         metrics.update(set(chip_metrics))
     return nodes, metrics
@@ -388,17 +389,19 @@ def get_chart_data(chips, metric, nodes):
     for chip_and_chip_name in chips:
         chip = chip_and_chip_name['chip_object']
         chip_name = chip_and_chip_name['chip_name']
-        nodes_list, errors, metrics, metrics_unit, metrics_to_show, reports = \
-            utils._collect_data(chip, format_as_string=False)
-        if metric in metrics_unit:
-            metric_unit = metrics_unit[metric]
+        store = utils._get_metric_store(chip, cache=True)
+        if metric in store.metrics_to_show:
+            metric_unit = store.units[metric] if store.units[metric] else ''
             metric_units.add(metric_unit)
+        values = store.values.get(metric, {})
         for node in nodes:
-            if node not in metrics:
+            if node not in values:
                 continue
-            value = metrics[node][metric]
+            value = values[node]
             if value is None:
                 continue
+            value = utils._format_value(metric, value, store.units[metric], store.types[metric],
+                                        False)
             if node in metric_datapoints:
                 metric_datapoints[node][chip_name] = value
             else:
@@ -1,3 +1,6 @@
+import os
+import weakref
+
 from siliconcompiler import NodeStatus
 from siliconcompiler.utils import units
 from siliconcompiler.tools._common import get_tool_task
@@ -37,91 +40,178 @@ def _find_summary_metrics(chip, metrics_map):
     return metrics
 
 
-def _collect_data(chip, flow=None, flowgraph_nodes=None, format_as_string=True):
+class _MetricStore:
+    '''
+    Metric data of a job, collected in a single pass over the schema.
+
+    The values are stored unformatted, one column per metric, so the same
+    store can be used to build tables and charts for any metric.
+    '''
+
+    def __init__(self, chip, flow, flowgraph_nodes):
+        self.nodes = []
+        self.errors = {}
+        self.values = {}
+        self.units = {}
+        self.types = {}
+        self.reports = {}
+        self.metrics_to_show = []
+
+        if not flow:
+            return
+
+        if not flowgraph_nodes:
+            runtime = RuntimeFlowgraph(
+                chip.get("flowgraph", flow, field='schema'),
+                from_steps=chip.get('option', 'from'),
+                to_steps=chip.get('option', 'to'),
+                prune_nodes=chip.get('option', 'prune'))
+
+            flowgraph_nodes = list(runtime.get_nodes())
+            # only report tool based steps functions
+            for (step, index) in list(flowgraph_nodes):
+                tool, task = get_tool_task(chip, step, '0', flow=flow)
+                if tool == 'builtin':
+                    index = flowgraph_nodes.index((step, index))
+                    del flowgraph_nodes[index]
+
+        status = {}
+        for step, index in flowgraph_nodes:
+            status[step, index] = chip.get('record', 'status', step=step, index=index)
+        flowgraph_nodes = [node for node in flowgraph_nodes
+                           if status[node] != NodeStatus.SKIPPED]
+
+        # Build ordered list of nodes in flowgraph
+        for level_nodes in chip.get("flowgraph", flow, field="schema").get_execution_order():
+            self.nodes.extend(sorted(level_nodes))
+        self.nodes = [node for node in self.nodes if node in flowgraph_nodes]
+
+        # Look up the per node information once
+        weighted = set()
+        node_reports = {}
+        for step, index in self.nodes:
+            self.errors[step, index] = status[step, index] == NodeStatus.ERROR
+
+            for metric in chip.getkeys('flowgraph', flow, step, index, 'weight'):
+                if chip.get('flowgraph', flow, step, index, 'weight', metric):
+                    weighted.add(metric)
+
+            tool, task = get_tool_task(chip, step, index, flow=flow)
+            reports = {}
+            if tool and task and chip.valid('tool', tool, 'task', task, 'report'):
+                for metric in chip.getkeys('tool', tool, 'task', task, 'report'):
+                    reports[metric] = chip.get('tool', tool, 'task', task, 'report', metric,
+                                               step=step, index=index)
+            node_reports[step, index] = reports
+
+        # Gather data and determine which metrics to show
+        # We show a metric if:
+        # - at least one step in the steps has a non-zero weight for the metric -OR -
+        #   at least one step in the steps set a value for it
+        for metric in chip.getkeys('metric'):
+            self.units[metric] = chip.get('metric', metric, field='unit')
+            self.types[metric] = chip.get('metric', metric, field='type')
+
+            values = {}
+            reports = {}
+            for step, index in self.nodes:
+                values[step, index] = chip.get('metric', metric, step=step, index=index)
+                reports[step, index] = node_reports[step, index].get(metric, [])
+            self.values[metric] = values
+            self.reports[metric] = reports
+
+            if self.nodes and (metric in weighted or
+                               any([value is not None for value in values.values()])):
+                self.metrics_to_show.append(metric)
+
+        if 'totaltime' in self.metrics_to_show:
+            totaltime = self.values['totaltime']
+            if not any([totaltime[node] is None for node in self.nodes]):
+                self.nodes.sort(key=lambda node: totaltime[node])
+
+    def collect(self, format_as_string=True):
+        '''
+        Returns the data in the form used by the reports.
+
+        Args:
+            format_as_string (bool): if True, the values are formatted as strings.
+
+        Returns:
+            tuple of nodes, errors, metrics, metrics_unit, metrics_to_show, reports.
+        '''
+        errors = dict(self.errors)
+        metrics = {node: {} for node in self.nodes}
+        reports = {node: {} for node in self.nodes}
+        for metric, values in self.values.items():
+            metric_unit = self.units[metric]
+            metric_type = self.types[metric]
+            metric_reports = self.reports[metric]
+            for node in self.nodes:
+                value = values[node]
+                if value is not None:
+                    value = _format_value(metric, value, metric_unit, metric_type,
+                                          format_as_string)
+                metrics[node][metric] = value
+                reports[node][metric] = list(metric_reports[node])
+
+        metrics_unit = {metric: self.units[metric] if self.units[metric] else ''
+                        for metric in self.metrics_to_show}
+
+        return list(self.nodes), errors, metrics, metrics_unit, \
+            list(self.metrics_to_show), reports
+
+
+# Metric stores of the chips, valid as long as their manifest is unchanged
+_metric_store_cache = weakref.WeakKeyDictionary()
+
+
+def _get_manifest_time(chip):
+    try:
+        manifest = os.path.join(chip.getworkdir(), f"{chip.name}.pkg.json")
+        return os.stat(manifest).st_mtime_ns
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def _clear_metric_store(chip):
+    _metric_store_cache.pop(chip, None)
+
+
+def _get_metric_store(chip, flow=None, flowgraph_nodes=None, cache=False):
     if not flow:
         flow = chip.get('option', 'flow')
-    if not flow:
-        return [], {}, {}, {}, [], {}
-
-    if not flowgraph_nodes:
-        runtime = RuntimeFlowgraph(
-            chip.get("flowgraph", flow, field='schema'),
-            from_steps=chip.get('option', 'from'),
-            to_steps=chip.get('option', 'to'),
-            prune_nodes=chip.get('option', 'prune'))
-
-        flowgraph_nodes = list(runtime.get_nodes())
-        # only report tool based steps functions
-        for (step, index) in list(flowgraph_nodes):
-            tool, task = get_tool_task(chip, step, '0', flow=flow)
-            if tool == 'builtin':
-                index = flowgraph_nodes.index((step, index))
-                del flowgraph_nodes[index]
-    flowgraph_nodes = [
-        node for node in flowgraph_nodes
-        if chip.get('record', 'status', step=node[0], index=node[1]) != NodeStatus.SKIPPED
-    ]
-
-    # Collections for data
-    nodes = []
-    errors = {}
-    metrics = {}
-    metrics_unit = {}
-    reports = {}
-
-    # Build ordered list of nodes in flowgraph
-    for level_nodes in chip.get("flowgraph", flow, field="schema").get_execution_order():
-        nodes.extend(sorted(level_nodes))
-    nodes = [node for node in nodes if node in flowgraph_nodes]
-    for (step, index) in nodes:
-        metrics[step, index] = {}
-        reports[step, index] = {}
-
-    # Gather data and determine which metrics to show
-    # We show a metric if:
-    # - at least one step in the steps has a non-zero weight for the metric -OR -
-    #   at least one step in the steps set a value for it
-    metrics_to_show = []
-    for metric in chip.getkeys('metric'):
-
-        # Get the unit associated with the metric
-        metric_unit = chip.get('metric', metric, field='unit')
-        metric_type = chip.get('metric', metric, field='type')
-
-        show_metric = False
-        for step, index in nodes:
-            if metric in chip.getkeys('flowgraph', flow,
-                                      step, index, 'weight') and \
-               chip.get('flowgraph', flow, step, index, 'weight', metric):
-                show_metric = True
-
-            value = chip.get('metric', metric, step=step, index=index)
-            if value is not None:
-                show_metric = True
-            tool, task = get_tool_task(chip, step, index, flow=flow)
-            rpts = chip.get('tool', tool, 'task', task, 'report', metric,
-                            step=step, index=index)
 
-            errors[step, index] = chip.get('record', 'status', step=step, index=index) == \
-                NodeStatus.ERROR
+    if not cache:
+        return _MetricStore(chip, flow, flowgraph_nodes)
 
-            if value is not None:
-                value = _format_value(metric, value, metric_unit, metric_type, format_as_string)
+    key = (flow,
+           tuple(flowgraph_nodes) if flowgraph_nodes else None,
+           _get_manifest_time(chip))
+    if key[2] is not None:
+        cached = _metric_store_cache.get(chip)
+        if cached and cached[0] == key:
+            return cached[1]
 
-            metrics[step, index][metric] = value
-            reports[step, index][metric] = rpts
+    store = _MetricStore(chip, flow, flowgraph_nodes)
+    if key[2] is not None:
+        _metric_store_cache[chip] = (key, store)
+    return store
 
-        if show_metric:
-            metrics_to_show.append(metric)
-            metrics_unit[metric] = metric_unit if metric_unit else ''
 
-    if 'totaltime' in metrics_to_show:
-        if not any([chip.get('metric', 'totaltime', step=node[0], index=node[1]) is None
-                    for node in nodes]):
-            nodes.sort(
-                key=lambda node: chip.get('metric', 'totaltime', step=node[0], index=node[1]))
+def _collect_data(chip, flow=None, flowgraph_nodes=None, format_as_string=True, cache=False):
+    '''
+    Collects the metrics of a chip.
 
-    return nodes, errors, metrics, metrics_unit, metrics_to_show, reports
+    Args:
+        chip (Chip): The chip object that contains the schema read from.
+        flow (str): flow to collect, defaults to the current flow.
+        flowgraph_nodes (list): nodes to collect, defaults to the tool based nodes
+            of the runtime flowgraph.
+        format_as_string (bool): if True, the values are formatted as strings.
+        cache (bool): if True, the data is reused until the job manifest changes.
+    '''
+    return _get_metric_store(chip, flow=flow, flowgraph_nodes=flowgraph_nodes,
+                             cache=cache).collect(format_as_string=format_as_string)
 
 
 def _format_value(metric, value, metric_unit, metric_type, format_as_string):
@@ -0,0 +1,155 @@
+import json
+import os
+import threading
+
+import os.path
+
+from typing import Dict, Optional
+
+try:
+    import sqlite3
+    _has_sqlite = True
+except ModuleNotFoundError:
+    _has_sqlite = False
+
+
+class FingerprintDatabase:
+    '''
+    Per-job index of the fingerprints of successfully completed nodes.
+
+    A fingerprint summarizes the inputs of a node when it ran, so checking
+    whether a node needs to be run again only requires comparing it with
+    the fingerprint of the current inputs, instead of loading the manifests
+    of the previous run. The fingerprints are stored in a sqlite database.
+
+    Args:
+        path (path): path to the database
+    '''
+
+    def __init__(self, path: str):
+        self.__path = os.path.abspath(path)
+
+        self.__lock = threading.Lock()
+        self.__conn = None
+        self.__pid = None
+        self.__failed = not _has_sqlite
+
+    @property
+    def path(self) -> str:
+        '''
+        Returns the path to the database
+        '''
+        return self.__path
+
+    def __connect(self, create: bool):
+        if self.__failed:
+            return None
+
+        if self.__conn is not None and self.__pid == os.getpid():
+            return self.__conn
+
+        if not create and not os.path.exists(self.__path):
+            return None
+
+        try:
+            os.makedirs(os.path.dirname(self.__path), exist_ok=True)
+            conn = sqlite3.connect(self.__path, timeout=30, check_same_thread=False)
+            conn.execute("CREATE TABLE IF NOT EXISTS fingerprints ("
+                         "node TEXT PRIMARY KEY, "
+                         "fingerprint TEXT NOT NULL)")
+            conn.commit()
+        except (sqlite3.Error, OSError):
+            self.__failed = True
+            return None
+
+        self.__conn = conn
+        self.__pid = os.getpid()
+        return conn
+
+    @staticmethod
+    def __node_key(step: str, index: str) -> str:
+        return f"{step}/{index}"
+
+    def get(self, step: str, index: str) -> Optional[Dict]:
+        '''
+        Returns the fingerprint of a node, or None if it has not been recorded.
+
+        Args:
+            step (str): step name.
+            index (str): index name.
+        '''
+        with self.__lock:
+            conn = self.__connect(False)
+            if not conn:
+                return None
+
+            try:
+                row = conn.execute("SELECT fingerprint FROM fingerprints WHERE node = ?",
+                                   (self.__node_key(step, index),)).fetchone()
+            except sqlite3.Error:
+                return None
+
+        if not row:
+            return None
+
+        try:
+            fingerprint = json.loads(row[0])
+        except ValueError:
+            return None
+
+        if not isinstance(fingerprint, dict):
+            return None
+        return fingerprint
+
+    def put(self, step: str, index: str, fingerprint: Dict) -> None:
+        '''
+        Records the fingerprint of a node.
+
+        Args:
+            step (str): step name.
+            index (str): index name.
+            fingerprint (dict): fingerprint of the node.
+        '''
+        with self.__lock:
+            conn = self.__connect(True)
+            if not conn:
+                return
+
+            try:
+                conn.execute("INSERT OR REPLACE INTO fingerprints (node, fingerprint) "
+                             "VALUES (?, ?)",
+                             (self.__node_key(step, index),
+                              json.dumps(fingerprint, sort_keys=True)))
+                conn.commit()
+            except sqlite3.Error:
+                pass
+
+    def remove(self, step: str, index: str) -> None:
+        '''
+        Removes the fingerprint of a node.
+
+        Args:
+            step (str): step name.
+            index (str): index name.
+        '''
+        with self.__lock:
+            conn = self.__connect(False)
+            if not conn:
+                return
+
+            try:
+                conn.execute("DELETE FROM fingerprints WHERE node = ?",
+                             (self.__node_key(step, index),))
+                conn.commit()
+            except sqlite3.Error:
+                pass
+
+    def close(self) -> None:
+        '''
+        Closes the connection to the database
+        '''
+        with self.__lock:
+            if self.__conn is not None and self.__pid == os.getpid():
+                self.__conn.close()
+            self.__conn = None
+            self.__pid = None
@@ -0,0 +1,123 @@
+import json
+import os
+import uuid
+
+import os.path
+
+from typing import Dict, Optional
+
+
+class RuntimeDatabase:
+    """
+    Persistent record of the runtimes of nodes from previous runs.
+
+    Runtimes are recorded for each node and for each tool task, so a node
+    which has not run before can be estimated from other nodes running the
+    same task. Each record is a moving average of the observed runtimes.
+
+    Args:
+        path (path): path to the database file.
+    """
+
+    # Weight of a new runtime in the moving average
+    __WEIGHT = 0.5
+
+    def __init__(self, path: str):
+        self.__path = os.path.abspath(path)
+
+        self.__nodes: Dict[str, float] = {}
+        self.__tasks: Dict[str, float] = {}
+        self.__changed = False
+
+        self.__load()
+
+    @property
+    def path(self) -> str:
+        '''
+        Returns the path to the database file
+        '''
+        return self.__path
+
+    def __load(self) -> None:
+        try:
+            with open(self.__path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        if not isinstance(data, dict):
+            return
+
+        for name, records in (("nodes", self.__nodes), ("tasks", self.__tasks)):
+            entries = data.get(name)
+            if not isinstance(entries, dict):
+                continue
+            for key, runtime in entries.items():
+                if isinstance(runtime, (int, float)) and runtime >= 0:
+                    records[key] = float(runtime)
+
+    @staticmethod
+    def __node_key(step: str, index: str) -> str:
+        return f"{step}/{index}"
+
+    @staticmethod
+    def __task_key(tool: str, task: str) -> str:
+        return f"{tool}/{task}"
+
+    def get(self, step: str, index: str, tool: str = None, task: str = None) -> Optional[float]:
+        '''
+        Returns the recorded runtime of a node, or of its task if the node has
+        not been recorded, or None if neither has been recorded.
+
+        Args:
+            step (str): step name.
+            index (str): index name.
+            tool (str): name of the tool run by the node.
+            task (str): name of the task run by the node.
+        '''
+        runtime = self.__nodes.get(self.__node_key(step, index))
+        if runtime is None and tool and task:
+            runtime = self.__tasks.get(self.__task_key(tool, task))
+        return runtime
+
+    def record(self, step: str, index: str, tool: str, task: str, runtime: float) -> None:
+        '''
+        Records the runtime of a node.
+
+        Args:
+            step (str): step name.
+            index (str): index name.
+            tool (str): name of the tool run by the node.
+            task (str): name of the task run by the node.
+            runtime (float): runtime of the node in seconds.
+        '''
+        if runtime is None or runtime < 0:
+            return
+
+        for records, key in ((self.__nodes, self.__node_key(step, index)),
+                             (self.__tasks, self.__task_key(tool, task))):
+            previous = records.get(key)
+            if previous is None:
+                records[key] = float(runtime)
+            else:
+                records[key] = (1 - self.__WEIGHT) * previous + self.__WEIGHT * runtime
+        self.__changed = True
+
+    def write(self) -> None:
+        '''
+        Writes the database if any runtimes were recorded.
+        '''
+        if not self.__changed:
+            return
+
+        os.makedirs(os.path.dirname(self.__path), exist_ok=True)
+        tmp_path = f"{self.__path}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump({"nodes": self.__nodes, "tasks": self.__tasks}, f, indent=2,
+                          sort_keys=True)
+            os.replace(tmp_path, self.__path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        self.__changed = False
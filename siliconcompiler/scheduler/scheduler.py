@@ -1,6 +1,8 @@
 import io
 import logging
+import multiprocessing
 import os
+import queue
 import re
 import shutil
 import sys
@@ -8,6 +10,9 @@ import traceback
 
 import os.path
 
+from concurrent.futures import ProcessPoolExecutor
+from logging.handlers import QueueHandler
+
 from siliconcompiler import NodeStatus
 from siliconcompiler.schema import Journal
 from siliconcompiler.flowgraph import RuntimeFlowgraph
@@ -20,6 +25,52 @@ from siliconcompiler import utils
 from siliconcompiler.utils.logging import SCLoggerFormatter
 from siliconcompiler.utils.multiprocessing import MPManager
 from siliconcompiler.scheduler import send_messages
+from siliconcompiler.package import Resolver
+
+
+# Project and function used by the worker processes of configure_nodes,
+# which are inherited when the workers are forked
+_configure_worker = None
+
+
+def _init_configure_worker(project, func):
+    global _configure_worker
+    _configure_worker = (project, func)
+
+
+def _run_configure_worker(step, index):
+    """
+    Calls the configure function for a node in a worker process.
+
+    Returns:
+        tuple: the return value, the journal of the changes made to the
+        project, the package cache, the log records and the exception raised.
+    """
+    project, func = _configure_worker
+
+    records = queue.SimpleQueue()
+    logger = project.logger
+    handlers, propagate = logger.handlers, logger.propagate
+    logger.handlers = [QueueHandler(records)]
+    logger.propagate = False
+
+    journal = Journal.access(project)
+    journal.start()
+
+    result, error = None, None
+    try:
+        result = func(step, index)
+    except Exception as e:
+        error = e
+    finally:
+        logger.handlers = handlers
+        logger.propagate = propagate
+
+    logs = []
+    while not records.empty():
+        logs.append(records.get())
+
+    return result, journal.get(), Resolver.get_cache(project), logs, error
 
 
 class Scheduler:
@@ -218,6 +269,9 @@ class Scheduler:
         if not self.check_manifest():
             raise RuntimeError("check_manifest() failed")
 
+        # Fetch remote data before any node needs it
+        self.__project._resolve_dataroots()
+
         self.__run_setup()
         self.configure_nodes()
 
@@ -455,9 +509,9 @@ class Scheduler:
 
         # Setup tools for all nodes to run
         for layer_nodes in self.__flow.get_execution_order():
+            layer_kept = self.__configure_layer(self.__setup_node, layer_nodes)
             for step, index in layer_nodes:
-                with self.__tasks[(step, index)].runtime():
-                    node_kept = self.__tasks[(step, index)].setup()
+                node_kept = layer_kept[(step, index)]
                 if not node_kept and (step, index) in extra_setup_nodes:
                     # remove from previous node data
                     del extra_setup_nodes[(step, index)]
@@ -477,18 +531,18 @@ class Scheduler:
 
         # Check for modified information
         for layer_nodes in self.__flow.get_execution_order():
-            for step, index in layer_nodes:
-                # Only look at successful nodes
-                if self.__record.get("status", step=step, index=index) != NodeStatus.SUCCESS:
-                    continue
-
-                with self.__tasks[(step, index)].runtime():
-                    if self.__tasks[(step, index)].requires_run():
-                        # This node must be run
-                        self.__mark_pending(step, index)
-                    elif (step, index) in extra_setup_nodes:
-                        # import old information
-                        Journal.access(extra_setup_nodes[(step, index)]).replay(self.__project)
+            # Only look at successful nodes
+            check_nodes = [(step, index) for step, index in layer_nodes
+                           if self.__record.get("status", step=step, index=index) ==
+                           NodeStatus.SUCCESS]
+            layer_requires_run = self.__configure_layer(self.__requires_run, check_nodes)
+            for step, index in check_nodes:
+                if layer_requires_run[(step, index)]:
+                    # This node must be run
+                    self.__mark_pending(step, index)
+                elif (step, index) in extra_setup_nodes:
+                    # import old information
+                    Journal.access(extra_setup_nodes[(step, index)]).replay(self.__project)
 
         self.__print_status("After requires run")
 
@@ -512,6 +566,75 @@ class Scheduler:
                 with self.__tasks[(step, index)].runtime():
                     self.__tasks[(step, index)].clean_directory()
 
+    def __setup_node(self, step, index):
+        """
+        Private helper to run the setup of a node.
+
+        Returns:
+            bool: False if the node was skipped, True otherwise.
+        """
+        with self.__tasks[(step, index)].runtime():
+            return self.__tasks[(step, index)].setup()
+
+    def __requires_run(self, step, index):
+        """
+        Private helper to check if a node must be run.
+
+        Returns:
+            bool: True if the node must be run, False otherwise.
+        """
+        with self.__tasks[(step, index)].runtime():
+            return self.__tasks[(step, index)].requires_run()
+
+    def __configure_layer(self, func, nodes):
+        """
+        Private helper to call a configuration function for the independent
+        nodes of a flowgraph layer.
+
+        When more than one core is available, the nodes are distributed across
+        a pool of forked processes. The changes each process makes to the
+        project are merged back into the project and its log messages are
+        emitted, in the order of the nodes.
+
+        Args:
+            func (function): function called with the step and index of each
+                node, its return value must be picklable.
+            nodes (list of (str, str)): nodes to call the function for.
+
+        Returns:
+            dict: The return value of the function for each node.
+        """
+        workers = min(len(nodes), utils.get_cores())
+        if workers <= 1 or sys.platform == "darwin" or \
+                "fork" not in multiprocessing.get_all_start_methods():
+            return {node: func(*node) for node in nodes}
+
+        results = {}
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=multiprocessing.get_context("fork"),
+                                 initializer=_init_configure_worker,
+                                 initargs=(self.__project, func)) as pool:
+            futures = [(node, pool.submit(_run_configure_worker, *node)) for node in nodes]
+            for node, future in futures:
+                result, journal_data, packages, logs, error = future.result()
+
+                for record in logs:
+                    self.__logger.handle(record)
+
+                if error is not None:
+                    raise error
+
+                journal = Journal()
+                journal.from_dict(journal_data)
+                journal.replay(self.__project)
+
+                for package, path in packages.items():
+                    Resolver.set_cache(self.__project, package, path)
+
+                results[node] = result
+
+        return results
+
     def __check_display(self):
         """
         Private helper to automatically disable GUI display on headless systems.
@@ -1,5 +1,7 @@
 import contextlib
 import glob
+import hashlib
+import json
 import logging
 import os
 import shutil
@@ -16,12 +18,16 @@ from typing import List
 from siliconcompiler import utils, sc_open
 from siliconcompiler import NodeStatus
 from siliconcompiler.utils.logging import get_console_formatter, SCInRunLoggerFormatter
+from siliconcompiler.utils.logscan import LogScanner
 from siliconcompiler.schema import utils as schema_utils
 
-from siliconcompiler.package import Resolver
+from siliconcompiler.package import Resolver, RemoteResolver
 from siliconcompiler.record import RecordTime, RecordTool
 from siliconcompiler.schema import Journal
+from siliconcompiler.schema.hashcache import FileHashCache
+from siliconcompiler.schema.parametervalue import PathNodeValue
 from siliconcompiler.scheduler import send_messages
+from siliconcompiler.scheduler.fingerprint import FingerprintDatabase
 
 
 class SchedulerNode:
@@ -73,6 +79,7 @@ class SchedulerNode:
         self.__generate_test_case = not replay
         self.__replay = replay
         self.__hash = self.__project.get("option", "hash")
+        self.__compact_manifest = self.__project.get("option", "compactmanifest")
         self.__builtin = False
 
         self.__enforce_inputfiles = True
@@ -94,6 +101,7 @@ class SchedulerNode:
             "exe": os.path.join(self.__workdir, f"{self.__step}.log")
         }
         self.__replay_script = os.path.join(self.__workdir, "replay.sh")
+        self.__fingerprint = None
         self.__collection_path = self.__project.getcollectiondir()
 
         self.set_queue(None, None)
@@ -118,6 +126,23 @@ class SchedulerNode:
         """Static placeholder for future initialization logic."""
         pass
 
+    @staticmethod
+    def create_job_tracker(project):
+        """
+        Creates the tracker used to submit nodes of this type without a local process.
+
+        A tracker provides ``add(node)``, which returns a handle used in place of
+        the node's process, ``submit()``, ``poll()``, which returns the handles of
+        the finished nodes, ``cancel()`` and a ``poll_interval`` in seconds.
+
+        Args:
+            project (Project): The project being run.
+
+        Returns:
+            The job tracker, or None if the nodes run in a local process.
+        """
+        return None
+
     def switch_node(self, step: str, index: str) -> "SchedulerNode":
         """
         Creates a new SchedulerNode for a different step/index.
@@ -331,12 +356,14 @@ class SchedulerNode:
 
         self.__record.set("status", NodeStatus.ERROR, step=self.__step, index=self.__index)
         try:
-            self.__project.write_manifest(self.__manifests["output"])
+            self.__project.write_manifest(self.__manifests["output"],
+                                          compact=self.__compact_manifest)
         except FileNotFoundError:
             self.logger.error(f"Failed to write manifest for {self.__step}/{self.__index}.")
 
         self.logger.error(f"Halting {self.__step}/{self.__index} due to errors.")
         send_messages.send(self.__project, "fail", self.__step, self.__index)
+        self.__send_results()
         sys.exit(1)
 
     def setup(self):
@@ -502,9 +529,10 @@ class SchedulerNode:
                 step, index = None, None
 
             if use_hash:
-                check_hash = self.__project.hash_files(*key, update=False, check=False,
-                                                       verbose=False,
-                                                       step=step, index=index)
+                with self.__file_hash_cache():
+                    check_hash = self.__project.hash_files(*key, update=False, check=False,
+                                                           verbose=False,
+                                                           step=step, index=index)
                 prev_hash = previous_run.__project.get(*key, field='filehash',
                                                        step=step, index=index)
 
@@ -567,6 +595,207 @@ class SchedulerNode:
 
         return value_keys, path_keys
 
+    def __get_key_node(self, key):
+        """Private helper to return the step and index used to access a key."""
+        if self.__project.get(*key, field='pernode').is_never():
+            return None, None
+        return self.__step, self.__index
+
+    @staticmethod
+    def __get_file_state(path):
+        """
+        Private helper to return the sizes and modification times of a file
+        or of the files in a directory.
+        """
+        if path is None:
+            return None
+
+        try:
+            if not os.path.isdir(path):
+                stat = os.stat(path)
+                return [stat.st_size, stat.st_mtime_ns]
+
+            state = []
+            for path_root, _, files in os.walk(path):
+                for path_end in files:
+                    filepath = os.path.join(path_root, path_end)
+                    stat = os.stat(filepath)
+                    state.append([os.path.relpath(filepath, path),
+                                  stat.st_size, stat.st_mtime_ns])
+            return sorted(state)
+        except OSError:
+            return None
+
+    def get_fingerprint(self, inputs=None):
+        """
+        Computes the fingerprint of the inputs to this node.
+
+        The fingerprint holds everything :meth:`requires_run` checks against a
+        previous run: the flow, tool and task names, the selected input nodes,
+        a digest of the value of each key from :meth:`get_check_changed_keys`
+        and a digest of the files each file or directory key points to. Files
+        are represented by their sizes and modification times, and by their
+        hashes if hashing is enabled.
+
+        Args:
+            inputs (list of (str, str)): The selected input nodes. If not
+                provided, the input nodes are selected by the task.
+
+        Returns:
+            dict: The fingerprint of the node.
+
+        Raises:
+            KeyError: If a required keypath is not found in the schema.
+        """
+        if inputs is None:
+            log_level = self.logger.level
+            self.logger.setLevel(logging.CRITICAL)
+            inputs = self.__task.select_input_nodes()
+            self.logger.setLevel(log_level)
+
+        value_keys, path_keys = self.get_check_changed_keys()
+
+        def digest(value):
+            return hashlib.sha1(
+                json.dumps(value, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+        values = {}
+        for key in value_keys.union(path_keys):
+            if not self.__project.valid(*key):
+                # Key is missing, so it can never match
+                values[",".join(key)] = None
+                continue
+            step, index = self.__get_key_node(key)
+            values[",".join(key)] = digest(self.__project.get(*key, step=step, index=index))
+
+        packages = {}
+        files = {}
+        for key in path_keys:
+            step, index = self.__get_key_node(key)
+            packages[",".join(key)] = digest(
+                self.__project.get(*key, field='package', step=step, index=index))
+
+            paths = self.__project.find_files(*key, missing_ok=True, step=step, index=index)
+            if isinstance(paths, set):
+                paths = sorted(paths, key=str)
+            elif not isinstance(paths, (list, tuple)):
+                paths = [paths]
+            files[",".join(key)] = digest([self.__get_file_state(path) for path in paths])
+
+        filehashes = None
+        if self.__hash:
+            filehashes = {}
+            with self.__file_hash_cache():
+                for key in path_keys:
+                    step, index = self.__get_key_node(key)
+                    filehashes[",".join(key)] = digest(
+                        self.__project.hash_files(*key, update=False, check=False,
+                                                  verbose=False, missing_ok=True,
+                                                  step=step, index=index))
+
+        return {
+            "flow": self.__flow.name,
+            "tool": self.__task.tool(),
+            "task": self.__task.task(),
+            "inputnode": sorted([list(node) for node in inputs]),
+            "values": values,
+            "packages": packages,
+            "files": files,
+            "filehashes": filehashes
+        }
+
+    def check_fingerprint_changed(self, previous_fingerprint):
+        """
+        Checks if the inputs to this node have changed since a previous run.
+
+        This performs the same checks as :meth:`check_previous_run_status`,
+        :meth:`check_values_changed` and :meth:`check_files_changed`, using
+        the fingerprint recorded by the previous run instead of its manifests.
+
+        Args:
+            previous_fingerprint (dict): The fingerprint recorded by the
+                previous run.
+
+        Returns:
+            bool: True if anything has changed, False otherwise.
+        """
+        try:
+            fingerprint = self.get_fingerprint()
+        except KeyError:
+            self.logger.debug("Failed to acquire keys")
+            return True
+
+        for field, name in (("flow", "Flow"), ("tool", "Tool"), ("task", "Task")):
+            if fingerprint[field] != previous_fingerprint.get(field):
+                self.logger.debug(f"{name} name changed")
+                return True
+
+        if fingerprint["inputnode"] != previous_fingerprint.get("inputnode"):
+            self.logger.warning(f'inputs to {self.__step}/{self.__index} has been modified from '
+                                'previous run')
+            return True
+
+        def check_changed(field, reason=None):
+            current = fingerprint[field]
+            previous = previous_fingerprint.get(field)
+            if not isinstance(previous, dict):
+                previous = {}
+            for key in sorted(set(current).union(previous)):
+                if current.get(key) is None or current.get(key) != previous.get(key):
+                    label = f"[{key}]"
+                    if reason:
+                        label = f"{label} ({reason})"
+                    self.logger.warning(f'{label} in {self.__step}/{self.__index} has been '
+                                        'modified from previous run')
+                    return True
+            return False
+
+        if check_changed("values"):
+            self.logger.debug("Key values changed")
+            return True
+
+        if fingerprint["filehashes"] is not None and \
+                previous_fingerprint.get("filehashes") is not None:
+            files_changed = check_changed("filehashes", "file hash")
+        else:
+            files_changed = check_changed("packages", "file package") or \
+                check_changed("files", "timestamp")
+        if files_changed:
+            self.logger.debug("Files changed")
+            return True
+
+        return False
+
+    @contextlib.contextmanager
+    def __fingerprint_database(self, jobworkdir=None):
+        """
+        Private helper to access the fingerprints recorded for a job.
+
+        Args:
+            jobworkdir (path): The working directory of the job, defaults to
+                the current job.
+        """
+        if jobworkdir is None:
+            jobworkdir = self.__jobworkdir
+        database = FingerprintDatabase(os.path.join(jobworkdir, "fingerprints.db"))
+        try:
+            yield database
+        finally:
+            database.close()
+
+    def __record_fingerprint(self):
+        """Private helper to record the fingerprint of a successful run."""
+        if self.__fingerprint is None:
+            return
+
+        if self.__record.get('status', step=self.__step, index=self.__index) != \
+                NodeStatus.SUCCESS:
+            return
+
+        with self.__fingerprint_database() as database:
+            database.put(self.__step, self.__index, self.__fingerprint)
+        self.__fingerprint = None
+
     def requires_run(self):
         """
         Determines if the node needs to be re-run.
@@ -574,13 +803,23 @@ class SchedulerNode:
         This method performs a series of checks against the results of a
         previous run (if one exists). It checks for changes in run status,
         configuration parameters, and input files to decide if the node's
-        task can be skipped.
+        task can be skipped. If the previous run recorded a fingerprint, the
+        checks are done against the fingerprint, otherwise the manifests of
+        the previous run are loaded.
 
         Returns:
             bool: True if a re-run is required, False otherwise.
         """
         from siliconcompiler import Project
 
+        if os.path.exists(self.__manifests["output"]):
+            with self.__fingerprint_database() as database:
+                previous_fingerprint = database.get(self.__step, self.__index)
+
+            if previous_fingerprint is not None:
+                with self.runtime():
+                    return self.check_fingerprint_changed(previous_fingerprint)
+
         # Load previous manifest
         previous_node = None
         previous_node_time = time.time()
@@ -798,6 +1037,10 @@ class SchedulerNode:
         # Start wall timer
         self.__record.record_time(self.__step, self.__index, RecordTime.START)
 
+        # Invalidate the previous run until this run succeeds
+        with self.__fingerprint_database() as database:
+            database.remove(self.__step, self.__index)
+
         cwd = os.getcwd()
         with self.runtime():
             # Setup run directory
@@ -825,7 +1068,16 @@ class SchedulerNode:
                 self.setup_input_directory()
 
             # Write manifest prior to step running into inputs
-            self.__project.write_manifest(self.__manifests["input"])
+            self.__project.write_manifest(self.__manifests["input"],
+                                          compact=self.__compact_manifest)
+
+            # Fingerprint the inputs, which is recorded if the node succeeds
+            self.__fingerprint = None
+            if not self.__replay:
+                try:
+                    self.__fingerprint = self.get_fingerprint(inputs=sel_inputs)
+                except KeyError:
+                    pass
 
             # Check manifest
             if not self.validate():
@@ -840,11 +1092,27 @@ class SchedulerNode:
         # return to original directory
         os.chdir(cwd)
 
+        self.__send_results()
+
         # Stop journaling
         journal.stop()
 
-        if self.__pipe:
-            self.__pipe.send(Resolver.get_cache(self.__project))
+    def __send_results(self):
+        """
+        Private helper to send the results of the run back to the parent process.
+
+        The message contains the package cache and the journal of schema
+        transactions recorded during the run, which allows the parent to merge
+        the changes without reading the full output manifest.
+        """
+        if not self.__pipe:
+            return
+
+        self.__pipe.send({
+            "packages": Resolver.get_cache(self.__project),
+            "journal": Journal.access(self.__project).get()
+        })
+        self.__pipe = None
 
     def execute(self):
         """
@@ -969,7 +1237,8 @@ class SchedulerNode:
         if self.__record.get('status', step=self.__step, index=self.__index) != NodeStatus.SKIPPED:
             self.__record.set('status', NodeStatus.SUCCESS, step=self.__step, index=self.__index)
 
-        self.__project.write_manifest(self.__manifests["output"])
+        self.__project.write_manifest(self.__manifests["output"],
+                                      compact=self.__compact_manifest)
 
         self.summarize()
 
@@ -988,6 +1257,8 @@ class SchedulerNode:
 
         self.__report_output_files()
 
+        self.__record_fingerprint()
+
         send_messages.send(self.__project, "end", self.__step, self.__index)
 
     def __generate_testcase(self):
@@ -1028,18 +1299,15 @@ class SchedulerNode:
             return
 
         checks = {}
-        matches = {}
         for suffix in self.__task.getkeys('regex'):
             regexes = self.__task.get('regex', suffix)
             if not regexes:
                 continue
 
             checks[suffix] = {
-                "report": open(f"{self.__step}.{suffix}", "w"),
                 "args": regexes,
                 "display": False
             }
-            matches[suffix] = 0
 
         def print_error(suffix, line):
             self.logger.error(line)
@@ -1067,31 +1335,24 @@ class SchedulerNode:
         if 'errors' in checks:
             ordered_suffixes.append('errors')
 
-        # Looping through patterns for each line
+        # Scan the log once for all the patterns
+        scanner = LogScanner(self.__project,
+                             {suffix: checks[suffix]["args"] for suffix in ordered_suffixes})
         with sc_open(self.__logs["exe"]) as f:
-            line_count = sum(1 for _ in f)
-            right_align = len(str(line_count))
-            for suffix in ordered_suffixes:
-                # Start at the beginning of file again
-                f.seek(0)
-                for num, line in enumerate(f, start=1):
-                    string = line
-                    for item in checks[suffix]['args']:
-                        if string is None:
-                            break
-                        else:
-                            string = utils.grep(self.__project, item, string)
-                    if string is not None:
-                        matches[suffix] += 1
-                        # always print to file
-                        line_with_num = f'{num: >{right_align}}: {string.strip()}'
-                        print(line_with_num, file=checks[suffix]['report'])
-                        # selectively print to display
-                        if checks[suffix]["display"]:
-                            checks[suffix]["display"](suffix, line_with_num)
-
-        for check in checks.values():
-            check['report'].close()
+            line_count, found = scanner.scan(f)
+
+        matches = {}
+        right_align = len(str(line_count))
+        for suffix in ordered_suffixes:
+            matches[suffix] = len(found[suffix])
+            with open(f"{self.__step}.{suffix}", "w") as report:
+                for num, string in found[suffix]:
+                    # always print to file
+                    line_with_num = f'{num: >{right_align}}: {string.strip()}'
+                    print(line_with_num, file=report)
+                    # selectively print to display
+                    if checks[suffix]["display"]:
+                        checks[suffix]["display"](suffix, line_with_num)
 
         for metric in ("errors", "warnings"):
             if metric in matches:
@@ -1106,8 +1367,28 @@ class SchedulerNode:
 
                 self.__task.record_metric(metric, value, source_file=sources)
 
+    @contextlib.contextmanager
+    def __file_hash_cache(self):
+        """
+        Private helper to reuse file hashes computed by previous runs.
+
+        Hashes are stored in the on-disk cache directory and keyed on the
+        file metadata, so unchanged files are not rehashed.
+        """
+        cache = FileHashCache(os.path.join(RemoteResolver.determine_cache_dir(self.__project),
+                                           "filehash.db"))
+        try:
+            with PathNodeValue.use_hash_cache(cache):
+                yield
+        finally:
+            cache.close()
+
     def __hash_files_pre_execute(self):
         """Private helper to hash all relevant input files before execution."""
+        with self.__file_hash_cache():
+            self.__hash_files_pre_execute_inputs()
+
+    def __hash_files_pre_execute_inputs(self):
         for task_key in ('refdir', 'prescript', 'postscript', 'script'):
             self.__project.hash_files('tool', self.__task.tool(),
                                       'task', self.__task.task(), task_key,
@@ -1127,6 +1408,10 @@ class SchedulerNode:
 
     def __hash_files_post_execute(self):
         """Private helper to hash all output files after execution."""
+        with self.__file_hash_cache():
+            self.__hash_files_post_execute_outputs()
+
+    def __hash_files_post_execute_outputs(self):
         # hash all outputs
         self.__project.hash_files('tool', self.__task.tool(), 'task', self.__task.task(), 'output',
                                   step=self.__step, index=self.__index, check=False, verbose=False)
@@ -1202,6 +1487,7 @@ class SchedulerNode:
         org_name = self.__project.get("option", "jobname")
         self.__project.set("option", "jobname", source)
         copy_from = self.__project.getworkdir(step=self.__step, index=self.__index)
+        copy_from_jobworkdir = self.__project.getworkdir()
         self.__project.set("option", "jobname", org_name)
 
         if not os.path.exists(copy_from):
@@ -1227,7 +1513,15 @@ class SchedulerNode:
                 # delete file as it might be a hard link
                 os.remove(manifest)
                 schema.set('option', 'jobname', self.__job)
-                schema.write_manifest(manifest)
+                schema.write_manifest(manifest, compact=self.__compact_manifest)
+
+        with self.__fingerprint_database(copy_from_jobworkdir) as database:
+            fingerprint = database.get(self.__step, self.__index)
+        with self.__fingerprint_database() as database:
+            if fingerprint is not None:
+                database.put(self.__step, self.__index, fingerprint)
+            else:
+                database.remove(self.__step, self.__index)
 
     def clean_directory(self):
         """Removes the working directory for this node."""
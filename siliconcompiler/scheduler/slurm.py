@@ -20,7 +20,9 @@ class SlurmSchedulerNode(SchedulerNode):
     This class extends the base SchedulerNode to handle the specifics of
     submitting a compilation step as a job to a Slurm workload manager.
     It prepares a run script, a manifest, and uses the 'srun' command
-    to execute the step on a compute node.
+    to execute the step on a compute node. When :keypath:`option,scheduler,async`
+    is set, the nodes are instead submitted with 'sbatch' by a
+    :class:`SlurmJobTracker` without a local process per node.
     """
 
     def __init__(self, chip, step, index, replay=False):
@@ -58,7 +60,7 @@ class SlurmSchedulerNode(SchedulerNode):
         Args:
             chip (Chip): The Chip object to perform pre-processing on.
         """
-        if os.path.exists(chip._getcollectdir()):
+        if os.path.exists(chip.getcollectiondir()):
             # nothing to do
             return
 
@@ -148,6 +150,60 @@ class SlurmSchedulerNode(SchedulerNode):
         # Return the first listed partition
         return sinfo['nodes'][0]['partitions'][0]
 
+    @staticmethod
+    def create_job_tracker(project):
+        """Creates the tracker used to submit nodes with 'sbatch'.
+
+        Args:
+            project (Project): The project being run.
+
+        Returns:
+            SlurmJobTracker: The tracker if :keypath:`option,scheduler,async`
+            is set, otherwise None.
+        """
+        if not project.get('option', 'scheduler', 'async'):
+            return None
+        return SlurmJobTracker(project)
+
+    def get_runtime_files(self):
+        """Gets the paths to the manifest, log and run script for this node.
+
+        Returns:
+            tuple: The paths to the manifest, log file and run script.
+        """
+        cfg_dir = SlurmSchedulerNode.get_configuration_directory(self.project)
+
+        return tuple(os.path.join(cfg_dir, SlurmSchedulerNode.get_runtime_file_name(
+            self.__job_hash, self.step, self.index, ext)) for ext in ("pkg.json", "log", "sh"))
+
+    def write_script(self):
+        """Writes the script used to run this node on a compute node.
+
+        A user-defined script is used if it already exists on the filesystem,
+        otherwise a minimal script is created to run the task using the
+        SiliconCompiler CLI.
+
+        Returns:
+            str: The path to the script.
+        """
+        cfg_file, _, script_file = self.get_runtime_files()
+
+        if not os.path.isfile(script_file):
+            with open(script_file, 'w') as sf:
+                sf.write(utils.get_file_template('slurm/run.sh').render(
+                    cfg_file=shlex.quote(cfg_file),
+                    build_dir=shlex.quote(self.project.get("option", "builddir")),
+                    step=shlex.quote(self.step),
+                    index=shlex.quote(self.index),
+                    cachedir=shlex.quote(str(RemoteResolver.determine_cache_dir(self.project)))
+                ))
+
+        # This is Python for: `chmod +x [script_path]`
+        os.chmod(script_file,
+                 os.stat(script_file).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+
+        return script_file
+
     def run(self):
         """
         Runs the node's task as a job on a Slurm cluster.
@@ -163,51 +219,34 @@ class SlurmSchedulerNode(SchedulerNode):
             raise RuntimeError('slurm is not available or installed on this machine')
 
         # Determine which cluster parititon to use.
-        partition = self.chip.get('option', 'scheduler', 'queue', step=self.step, index=self.index)
+        partition = self.project.get('option', 'scheduler', 'queue',
+                                     step=self.step, index=self.index)
         if not partition:
             partition = SlurmSchedulerNode.get_slurm_partition()
 
         # Write out the current schema for the compute node to pick up.
-        cfg_dir = SlurmSchedulerNode.get_configuration_directory(self.chip)
+        cfg_dir = SlurmSchedulerNode.get_configuration_directory(self.project)
         os.makedirs(cfg_dir, exist_ok=True)
 
-        cfg_file = os.path.join(cfg_dir, SlurmSchedulerNode.get_runtime_file_name(
-            self.__job_hash, self.step, self.index, "pkg.json"))
-        log_file = os.path.join(cfg_dir, SlurmSchedulerNode.get_runtime_file_name(
-            self.__job_hash, self.step, self.index, "log"))
-        script_file = os.path.join(cfg_dir, SlurmSchedulerNode.get_runtime_file_name(
-            self.__job_hash, self.step, self.index, "sh"))
+        cfg_file, log_file, _ = self.get_runtime_files()
 
         # Remove scheduler as this is now a local run
-        self.chip.set('option', 'scheduler', 'name', None, step=self.step, index=self.index)
-        self.chip.write_manifest(cfg_file)
-
-        # Allow user-defined compute node execution script if it already exists on the filesystem.
-        # Otherwise, create a minimal script to run the task using the SiliconCompiler CLI.
-        if not os.path.isfile(script_file):
-            with open(script_file, 'w') as sf:
-                sf.write(utils.get_file_template('slurm/run.sh').render(
-                    cfg_file=shlex.quote(cfg_file),
-                    build_dir=shlex.quote(self.chip.get("option", "builddir")),
-                    step=shlex.quote(self.step),
-                    index=shlex.quote(self.index),
-                    cachedir=shlex.quote(str(RemoteResolver.determine_cache_dir(self.chip)))
-                ))
+        self.project.set('option', 'scheduler', 'name', None, step=self.step, index=self.index)
+        self.project.write_manifest(cfg_file)
 
-        # This is Python for: `chmod +x [script_path]`
-        os.chmod(script_file,
-                 os.stat(script_file).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+        script_file = self.write_script()
 
         schedule_cmd = ['srun',
                         '--exclusive',
                         '--partition', partition,
-                        '--chdir', self.chip.cwd,
+                        '--chdir', self.project.cwd,
                         '--job-name', SlurmSchedulerNode.get_job_name(self.__job_hash,
                                                                       self.step, self.index),
                         '--output', log_file]
 
         # Only delay the starting time if the 'defer' Schema option is specified.
-        defer_time = self.chip.get('option', 'scheduler', 'defer', step=self.step, index=self.index)
+        defer_time = self.project.get('option', 'scheduler', 'defer',
+                                      step=self.step, index=self.index)
         if defer_time:
             schedule_cmd.extend(['--begin', defer_time])
 
@@ -223,3 +262,317 @@ class SlurmSchedulerNode(SchedulerNode):
         # as it has closed its output stream. But if we don't call '.wait()',
         # the '.returncode' value will not be set correctly.
         step_result.wait()
+
+
+class SlurmJob:
+    """A node submitted to Slurm by a :class:`SlurmJobTracker`.
+
+    The job is used by the task scheduler in place of the local process of
+    the node. Starting the job queues the node for the next submission.
+
+    Args:
+        tracker (SlurmJobTracker): The tracker which submits the job.
+        node (SlurmSchedulerNode): The node to run.
+    """
+
+    def __init__(self, tracker, node):
+        self.__tracker = tracker
+        self.__node = node
+
+        self.jobid = None
+        self.exitcode = None
+
+    @property
+    def node(self):
+        """SlurmSchedulerNode: The node run by this job."""
+        return self.__node
+
+    def start(self):
+        """Queues the job for submission."""
+        self.__tracker.queue(self)
+
+    def join(self):
+        """Placeholder to match the process interface, the job is reaped by the tracker."""
+        pass
+
+
+class SlurmJobTracker:
+    """Submits nodes to Slurm with 'sbatch' and tracks them until they finish.
+
+    Nodes which are started together are submitted at once, and indices of
+    the same step are submitted as a job array. All the submitted jobs are
+    tracked with one 'squeue' query per poll, and the jobs which left the
+    queue are looked up with one 'sacct' query to determine how they ended.
+
+    Args:
+        project (Project): The project being run.
+    """
+
+    # Seconds between two queries of the job states
+    poll_interval = 10.0
+
+    # States which 'sacct' reports for jobs which have ended
+    __FINISHED_STATES = ("BOOT_FAIL", "CANCELLED", "COMPLETED", "DEADLINE", "FAILED",
+                         "NODE_FAIL", "OUT_OF_MEMORY", "PREEMPTED", "REVOKED", "TIMEOUT")
+
+    def __init__(self, project):
+        self.__project = project
+
+        self.__queued = []
+        self.__active = {}
+        self.__finished = []
+        self.__partition = None
+        self.__submissions = 0
+
+    def add(self, node):
+        """Creates the job for a node.
+
+        Args:
+            node (SlurmSchedulerNode): The node to run.
+
+        Returns:
+            SlurmJob: The job for the node.
+        """
+        return SlurmJob(self, node)
+
+    def queue(self, job):
+        """Queues a job for the next submission.
+
+        Args:
+            job (SlurmJob): The job to submit.
+        """
+        self.__queued.append(job)
+
+    def __get_partition(self, job):
+        partition = self.__project.get('option', 'scheduler', 'queue',
+                                       step=job.node.step, index=job.node.index)
+        if partition:
+            return partition
+
+        if not self.__partition:
+            self.__partition = SlurmSchedulerNode.get_slurm_partition()
+        return self.__partition
+
+    def submit(self):
+        """Submits the queued jobs.
+
+        The manifest is written once for all the queued jobs and the jobs are
+        grouped by step, partition and start time into a job array.
+
+        Raises:
+            RuntimeError: If 'sbatch' is not available.
+        """
+        if not self.__queued:
+            return
+
+        jobs, self.__queued = self.__queued, []
+
+        if shutil.which('sbatch') is None:
+            raise RuntimeError('slurm is not available or installed on this machine')
+
+        cfg_dir = SlurmSchedulerNode.get_configuration_directory(self.__project)
+        os.makedirs(cfg_dir, exist_ok=True)
+
+        # All the jobs submitted together share the same manifest
+        manifest = None
+        for job in jobs:
+            cfg_file, _, _ = job.node.get_runtime_files()
+            if os.path.lexists(cfg_file):
+                os.remove(cfg_file)
+            if manifest is None:
+                self.__project.write_manifest(cfg_file)
+                manifest = cfg_file
+            else:
+                utils.link_copy(manifest, cfg_file)
+
+        groups = {}
+        for job in jobs:
+            step, index = job.node.step, job.node.index
+            defer_time = self.__project.get('option', 'scheduler', 'defer',
+                                            step=step, index=index)
+            key = (step, self.__get_partition(job), defer_time)
+            groups.setdefault(key, []).append(job)
+
+        for (step, partition, defer_time), group in groups.items():
+            self.__submit_group(step, partition, defer_time, group)
+
+    def __submit_group(self, step, partition, defer_time, jobs):
+        cfg_dir = SlurmSchedulerNode.get_configuration_directory(self.__project)
+        jobhash = jobs[0].node.jobhash
+
+        schedule_cmd = ['sbatch',
+                        '--parsable',
+                        '--exclusive',
+                        '--partition', partition,
+                        '--chdir', self.__project.cwd]
+
+        if defer_time:
+            schedule_cmd.extend(['--begin', defer_time])
+
+        if len(jobs) == 1:
+            node = jobs[0].node
+            _, log_file, _ = node.get_runtime_files()
+            schedule_cmd.extend([
+                '--job-name', SlurmSchedulerNode.get_job_name(jobhash, node.step, node.index),
+                '--output', log_file,
+                node.write_script()])
+        else:
+            tasks = []
+            for job in jobs:
+                _, log_file, _ = job.node.get_runtime_files()
+                tasks.append((shlex.quote(job.node.write_script()), shlex.quote(log_file)))
+
+            self.__submissions += 1
+            array_file = os.path.join(cfg_dir, SlurmSchedulerNode.get_runtime_file_name(
+                jobhash, step, f"array{self.__submissions}", "sh"))
+            with open(array_file, 'w') as sf:
+                sf.write(utils.get_file_template('slurm/array.sh').render(tasks=tasks))
+            os.chmod(array_file,
+                     os.stat(array_file).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+
+            schedule_cmd.extend([
+                '--job-name', f'{jobhash}_{step}',
+                '--output', os.devnull,
+                '--array', f'0-{len(jobs) - 1}',
+                array_file])
+
+        result = subprocess.run(schedule_cmd,
+                                stdout=subprocess.PIPE,
+                                stderr=subprocess.STDOUT)
+        output = result.stdout.decode(errors="replace").strip()
+
+        if result.returncode != 0:
+            names = ", ".join(f"{job.node.step}/{job.node.index}" for job in jobs)
+            self.__project.logger.error(f"Failed to submit {names} to slurm: {output}")
+            for job in jobs:
+                job.exitcode = 1
+                self.__finished.append(job)
+            return
+
+        # Output is <jobid> or <jobid>;<cluster>
+        jobid = output.splitlines()[-1].split(';')[0].strip()
+        for n, job in enumerate(jobs):
+            if len(jobs) == 1:
+                job.jobid = jobid
+            else:
+                job.jobid = f"{jobid}_{n}"
+            self.__active[job.jobid] = job
+
+    @staticmethod
+    def __parse_job_ids(output):
+        """Expands the job ids reported by slurm, including array ranges
+        such as 12_[0-3,5%2], into the ids of the individual jobs."""
+        jobids = set()
+        for line in output.splitlines():
+            jobid = line.split('|')[0].strip()
+            if not jobid:
+                continue
+
+            if not jobid.endswith("]") or "_[" not in jobid:
+                jobids.add(jobid)
+                continue
+
+            base, tasks = jobid[:-1].split("_[", 1)
+            for task in tasks.split("%")[0].split(","):
+                if "-" in task:
+                    first, last = task.split("-", 1)
+                    for n in range(int(first), int(last) + 1):
+                        jobids.add(f"{base}_{n}")
+                elif task:
+                    jobids.add(f"{base}_{task}")
+        return jobids
+
+    @staticmethod
+    def __get_base_ids(jobids):
+        return ",".join(sorted(set(jobid.split("_")[0] for jobid in jobids)))
+
+    @staticmethod
+    def __run_query(cmd):
+        try:
+            result = subprocess.run(cmd,
+                                    stdout=subprocess.PIPE,
+                                    stderr=subprocess.DEVNULL)
+        except OSError:
+            return None
+        if result.returncode != 0:
+            return None
+        return result.stdout.decode(errors="replace")
+
+    def __get_queued_jobs(self):
+        """Returns the ids of the tracked jobs which are still in the queue."""
+        output = self.__run_query(['squeue',
+                                   '--noheader',
+                                   '--format=%i',
+                                   f'--jobs={self.__get_base_ids(self.__active)}'])
+        if output is None:
+            return set()
+        return self.__parse_job_ids(output)
+
+    def __get_job_states(self, jobids):
+        """Returns the state and exit code reported by accounting for the jobs."""
+        output = self.__run_query(['sacct',
+                                   '--noheader',
+                                   '--parsable2',
+                                   '--allocations',
+                                   '--format=JobID,State,ExitCode',
+                                   f'--jobs={self.__get_base_ids(jobids)}'])
+        if output is None:
+            return {}
+
+        states = {}
+        for line in output.splitlines():
+            fields = line.strip().split('|')
+            if len(fields) < 3:
+                continue
+            state = fields[1].split()[0] if fields[1].strip() else None
+            try:
+                exitcode = int(fields[2].split(':')[0])
+            except ValueError:
+                exitcode = 0
+            if state and state != "COMPLETED":
+                exitcode = max(1, exitcode)
+            for jobid in self.__parse_job_ids(fields[0]):
+                states[jobid] = (state, exitcode)
+        return states
+
+    def poll(self):
+        """Checks the state of the submitted jobs.
+
+        Jobs which are no longer queued, and which accounting does not report
+        as still active, are finished. If accounting is not available, the
+        node status recorded in the node manifest determines the result.
+
+        Returns:
+            list of SlurmJob: The jobs which finished since the last poll.
+        """
+        finished, self.__finished = self.__finished, []
+
+        if not self.__active:
+            return finished
+
+        queued = self.__get_queued_jobs()
+        done = [jobid for jobid in self.__active if jobid not in queued]
+        if not done:
+            return finished
+
+        states = self.__get_job_states(done)
+        for jobid in done:
+            state, exitcode = states.get(jobid, (None, 0))
+            if state and state not in SlurmJobTracker.__FINISHED_STATES:
+                continue
+
+            job = self.__active.pop(jobid)
+            job.exitcode = exitcode
+            finished.append(job)
+
+        return finished
+
+    def cancel(self):
+        """Cancels the jobs which have not finished."""
+        self.__queued.clear()
+        if not self.__active:
+            return
+
+        jobids = sorted(self.__active)
+        self.__active.clear()
+        self.__run_query(['scancel', *jobids])
@@ -1,10 +1,13 @@
+import heapq
 import multiprocessing
+import psutil
 import sys
 import time
 
 import os.path
 
 from logging.handlers import QueueListener
+from multiprocessing.connection import wait as wait_for_sentinels
 
 from siliconcompiler import NodeStatus
 from siliconcompiler import SiliconCompilerError
@@ -12,7 +15,9 @@ from siliconcompiler import utils
 from siliconcompiler.flowgraph import RuntimeFlowgraph
 
 from siliconcompiler.package import Resolver
+from siliconcompiler.report.dashboard import DashboardEvent, DashboardEventType
 from siliconcompiler.schema import Journal
+from siliconcompiler.scheduler.runtimes import RuntimeDatabase
 
 from siliconcompiler.utils.logging import SCBlankLoggerFormatter, SCBlankColorlessLoggerFormatter
 from siliconcompiler.utils.multiprocessing import MPManager
@@ -25,7 +30,33 @@ class TaskScheduler:
     handling multiprocessing, resource allocation (cores/threads), and
     dependency checking. It operates on a set of pending tasks defined by the
     main Scheduler and executes them in a loop until the flow is complete.
+
+    Scheduling is event driven: each node tracks how many of its inputs are
+    still outstanding, nodes whose inputs are all done are kept in a ready
+    queue, and the loop blocks on the sentinels of the running processes so
+    completions are handled as soon as they happen.
+
+    With the 'criticalpath' scheduling policy, ready nodes are started in
+    order of their estimated remaining path to the end of the flow, and the
+    observed runtimes are recorded for later runs.
+
+    When a memory budget is set, nodes are only started while the estimated
+    peak memory of the running local nodes fits in the budget, and under
+    system memory pressure the most recently started node can be paused or
+    requeued.
+
+    Nodes which provide a job tracker (see
+    :meth:`SchedulerNode.create_job_tracker`) do not use a local process,
+    they are submitted in batches by their tracker and the loop polls the
+    trackers periodically for the nodes which finished.
     """
+    # System memory usage, in percent, at which nodes are paused or requeued
+    __MEMORY_PRESSURE_LIMIT = 90
+    # System memory usage, in percent, below which paused nodes are resumed
+    __MEMORY_RELEASE_LIMIT = 80
+    # Seconds between two checks of the system memory usage
+    __MEMORY_POLL_INTERVAL = 1.0
+
     __callbacks = {
         "pre_run": lambda chip: None,
         "pre_node": lambda chip, step, index: None,
@@ -86,9 +117,43 @@ class TaskScheduler:
 
         self.__nodes = {}
         self.__startTimes = {}
-        self.__dwellTime = 0.1
+        self.__events = []
+
+        # Event driven bookkeeping
+        self.__dependents = {}
+        self.__ready = []
+        self.__running = {}
+        self.__running_pipes = {}
+        self.__running_threads = 0
+
+        # Nodes submitted through job trackers
+        self.__trackers = {}
+        self.__running_jobs = {}
+        self.__next_poll = 0
+
+        # Memory admission
+        self.__max_memory = self.__chip.get('option', 'scheduler', 'maxmemory')
+        if self.__max_memory:
+            self.__max_memory *= 1024 * 1024
+        self.__memory_action = self.__chip.get('option', 'scheduler', 'memorypressure')
+        self.__memory = {}
+        self.__running_memory = 0
+        self.__memory_pressure = False
+        self.__paused = []
+        self.__requeued = set()
+
+        # Critical path scheduling
+        self.__history = None
+        self.__runtimes = None
+        self.__estimates = {}
+        self.__priorities = {}
+        if self.__chip.get('option', 'scheduler', 'policy') == 'criticalpath':
+            self.__runtimes = RuntimeDatabase(TaskScheduler.get_runtime_database_path(chip))
 
         self.__create_nodes(tasks)
+        self.__create_dependencies()
+        self.__create_priorities()
+        self.__create_memory_estimates()
 
     def __create_nodes(self, tasks):
         """
@@ -119,7 +184,10 @@ class TaskScheduler:
                 "parent_pipe": None,
                 "threads": None,
                 "running": False,
+                "waiting_on": None,
+                "results": None,
                 "manifest": None,
+                "tracker": None,
                 "node": tasks[(step, index)]
             }
 
@@ -130,17 +198,220 @@ class TaskScheduler:
                 threads = self.__max_threads
             task["threads"] = max(1, min(threads, self.__max_threads))
 
-            task["parent_pipe"], pipe = multiprocessing.Pipe()
-            task["node"].set_queue(pipe, self.__log_queue)
+            node_cls = type(task["node"])
+            if node_cls not in self.__trackers:
+                self.__trackers[node_cls] = node_cls.create_job_tracker(self.__chip)
+            task["tracker"] = self.__trackers[node_cls]
 
-            task["proc"] = multiprocessing.Process(target=task["node"].run)
-            init_funcs.add(task["node"].init)
             self.__nodes[(step, index)] = task
+            self.__create_process((step, index))
+            init_funcs.add(task["node"].init)
 
         # Call preprocessing for schedulers
         for init_func in init_funcs:
             init_func(self.__chip)
 
+    def __create_process(self, node):
+        """
+        Private helper to create the process, or tracked job, which runs a node.
+
+        Args:
+            node (tuple): The (step, index) of the node.
+        """
+        task = self.__nodes[node]
+        if task["tracker"]:
+            task["proc"] = task["tracker"].add(task["node"])
+        else:
+            task["parent_pipe"], pipe = multiprocessing.Pipe()
+            task["node"].set_queue(pipe, self.__log_queue)
+
+            task["proc"] = multiprocessing.Process(target=task["node"].run)
+
+    def __create_dependencies(self):
+        """
+        Private helper to build the dependency counts and ready queue.
+
+        Each pending node records the set of inputs which have not completed
+        yet and every input records which pending nodes depend on it. Nodes
+        without outstanding inputs are placed in the ready queue.
+        """
+        for node, info in self.__nodes.items():
+            waiting_on = set()
+            for in_node in info["inputs"]:
+                in_step, in_index = in_node
+                if in_node in self.__nodes or \
+                        not NodeStatus.is_done(self.__record.get('status',
+                                                                 step=in_step,
+                                                                 index=in_index)):
+                    waiting_on.add(in_node)
+                    self.__dependents.setdefault(in_node, []).append(node)
+            info["waiting_on"] = waiting_on
+
+        for node, info in self.__nodes.items():
+            if not info["waiting_on"]:
+                heapq.heappush(self.__ready, node)
+
+    @staticmethod
+    def get_runtime_database_path(chip):
+        """Gets the path to the database of node runtimes used by the
+        'criticalpath' scheduling policy.
+
+        Args:
+            chip (Chip): The Chip object.
+
+        Returns:
+            str: The path to the database.
+        """
+        return os.path.join(chip._getbuilddir(), chip.name, "runtimes.json")
+
+    def __get_history(self):
+        """
+        Private helper to get the jobs in the history.
+
+        Returns:
+            list: The projects of the jobs in the history.
+        """
+        if self.__history is None:
+            self.__history = []
+            for job in self.__chip.getkeys("history"):
+                try:
+                    self.__history.append(self.__chip.history(job))
+                except (KeyError, FileNotFoundError):
+                    continue
+        return self.__history
+
+    def __create_memory_estimates(self):
+        """
+        Private helper to estimate the peak memory of each pending node.
+
+        The declared memory of the node is used if set, otherwise the largest
+        memory metric of the node in the jobs in the history. Nodes without
+        an estimate use 0.
+        """
+        if not self.__max_memory:
+            return
+
+        for node in self.__nodes:
+            step, index = node
+            memory = self.__chip.get('option', 'scheduler', 'memory', step=step, index=index)
+            if memory:
+                self.__memory[node] = memory * 1024 * 1024
+                continue
+
+            peaks = []
+            for job in self.__get_history():
+                try:
+                    peak = job.get("metric", "memory", step=step, index=index)
+                except (KeyError, ValueError):
+                    peak = None
+                if peak is not None:
+                    peaks.append(peak)
+            self.__memory[node] = max(peaks) if peaks else 0
+
+    def __get_runtime_metric(self, schema, node):
+        """
+        Private helper to get the recorded runtime of a node.
+
+        Args:
+            schema (Project): The project to read the metrics from.
+            node (tuple): The (step, index) of the node.
+
+        Returns:
+            float: The task time, or the execution time, of the node or None.
+        """
+        step, index = node
+        for metric in ("tasktime", "exetime"):
+            try:
+                value = schema.get("metric", metric, step=step, index=index)
+            except (KeyError, ValueError):
+                value = None
+            if value is not None:
+                return value
+        return None
+
+    def __create_priorities(self):
+        """
+        Private helper to compute the priority of each pending node for the
+        'criticalpath' scheduling policy.
+
+        The runtime of each node is estimated from the jobs in the history,
+        then from the runtime database. Nodes without an estimate use the
+        average of the known estimates. The priority of a node is its estimated
+        runtime plus the longest remaining path through its dependents.
+        """
+        if self.__runtimes is None:
+            return
+
+        for node in self.__nodes:
+            step, index = node
+            runtimes = [self.__get_runtime_metric(job, node) for job in self.__get_history()]
+            runtimes = [runtime for runtime in runtimes if runtime is not None]
+            if runtimes:
+                estimate = sum(runtimes) / len(runtimes)
+            else:
+                estimate = self.__runtimes.get(step, index,
+                                               self.__flow.get(step, index, "tool"),
+                                               self.__flow.get(step, index, "task"))
+            self.__estimates[node] = estimate
+
+        known = [estimate for estimate in self.__estimates.values() if estimate is not None]
+        default = sum(known) / len(known) if known else 1.0
+        for node, estimate in self.__estimates.items():
+            if estimate is None:
+                self.__estimates[node] = default
+
+        def remaining(node):
+            if node not in self.__priorities:
+                path = 0.0
+                for dependent in self.__dependents.get(node, []):
+                    path = max(path, remaining(dependent))
+                self.__priorities[node] = self.__estimates[node] + path
+            return self.__priorities[node]
+
+        for node in self.__nodes:
+            remaining(node)
+
+    def __get_priority(self, node):
+        """
+        Private helper to get the sort key of a ready node.
+
+        Args:
+            node (tuple): The (step, index) of the node.
+        """
+        if self.__runtimes is None:
+            return (0, node)
+        return (-self.__priorities[node], node)
+
+    def __get_reservation(self, threads):
+        """
+        Private helper to estimate when a node waiting for resources can start.
+
+        The running local nodes are expected to finish after their estimated
+        runtime, and the node can start once enough nodes have finished to
+        free its threads.
+
+        Args:
+            threads (int): The number of threads needed by the node.
+
+        Returns:
+            float: The expected start time of the node.
+        """
+        now = time.time()
+        finish_times = []
+        for node in self.__running.values():
+            end = self.__startTimes.get(node, now) + self.__estimates.get(node, 0)
+            finish_times.append((max(now, end), self.__nodes[node]["threads"]))
+
+        free_threads = self.__max_cores - self.__running_threads
+        free_slots = self.__max_parallel_run - len(self.__running)
+        for end, node_threads in sorted(finish_times):
+            if free_threads >= threads and free_slots > 0:
+                break
+            now = end
+            free_threads += node_threads
+            free_slots += 1
+        return now
+
     def run(self, job_log_handler):
         """
         The main entry point for the task scheduling loop.
@@ -177,6 +448,7 @@ class TaskScheduler:
             TaskScheduler.__callbacks["post_run"](self.__chip)
         except KeyboardInterrupt:
             # exit immediately
+            self.__cancel_jobs()
             log_listener.stop()
             sys.exit(0)
         finally:
@@ -190,41 +462,253 @@ class TaskScheduler:
             job_log_handler.setFormatter(file_formatter)
             self.__logger.addHandler(job_log_handler)
 
+            if self.__runtimes is not None:
+                try:
+                    self.__runtimes.write()
+                except OSError as e:
+                    self.__logger.warning(f"Unable to write node runtimes: {e}")
+
     def __run_loop(self):
         """
         The core execution loop of the scheduler.
 
         This loop continues as long as there are nodes running or waiting to
-        run. In each iteration, it processes completed nodes and launches new
-        ones whose dependencies have been met.
+        run. In each iteration, it launches nodes from the ready queue, blocks
+        until at least one running node terminates, and then processes the
+        completed nodes, releasing any dependents that became ready.
+
+        The pipes of the running nodes are waited on as well, so results sent
+        back by a node are drained while it is still running and a large
+        journal cannot block the node from exiting. While nodes submitted
+        through job trackers are running, the wait is bounded by the poll
+        interval of the trackers.
         """
         self.__startTimes = {None: time.time()}
 
-        while len(self.get_nodes_waiting_to_run()) > 0 or len(self.get_running_nodes()) > 0:
-            changed = self.__process_completed_nodes()
-            changed |= self.__lanuch_nodes()
+        completed = []
+        while True:
+            self.__process_completed_nodes(completed)
+            self.__lanuch_nodes()
+            self.__submit_jobs()
+
+            # Update dashboard with the node changes
+            self.__publish_events()
+
+            if not self.__running and not self.__running_jobs:
+                # Check for situation where we have stuff left to run but don't
+                # have any nodes running. This shouldn't happen, but we will get
+                # stuck in an infinite loop if it does, so we want to break out
+                # with an explicit error.
+                if self.get_nodes_waiting_to_run():
+                    raise SiliconCompilerError(
+                        'Nodes left to run, but no running nodes. From/to may be invalid.',
+                        chip=self.__chip)
+                break
+
+            timeout = None
+            if self.__running_jobs:
+                timeout = max(0, self.__next_poll - time.time())
+            if self.__memory_action and self.__running:
+                timeout = min(timeout if timeout is not None else self.__MEMORY_POLL_INTERVAL,
+                              self.__MEMORY_POLL_INTERVAL)
+
+            # Block until at least one node is done
+            completed = []
+            waitables = [*self.__running.keys(), *self.__running_pipes.keys()]
+            if waitables:
+                ready = wait_for_sentinels(waitables, timeout=timeout)
+            else:
+                time.sleep(timeout)
+                ready = []
+            for obj in ready:
+                if obj in self.__running_pipes:
+                    self.__receive_results(self.__running_pipes.pop(obj))
+                else:
+                    completed.append(self.__running[obj])
+
+            completed.extend(self.__poll_jobs())
+
+            if self.__memory_action:
+                self.__check_memory()
+
+    @staticmethod
+    def __get_process_tree(proc):
+        """
+        Private helper to get a node process and all its children.
+
+        Args:
+            proc (multiprocessing.Process): The process of the node.
+
+        Returns:
+            list: The psutil processes.
+        """
+        try:
+            parent = psutil.Process(proc.pid)
+            return [parent, *parent.children(recursive=True)]
+        except psutil.Error:
+            return []
+
+    def __check_memory(self):
+        """
+        Private helper to act on the system memory usage.
+
+        Under memory pressure, the most recently started local node is paused
+        or requeued, as long as another local node keeps running. Paused nodes
+        are resumed, one at a time, once the memory usage has dropped or no
+        other local node is running.
+        """
+        usage = psutil.virtual_memory().percent
+        if usage > self.__MEMORY_PRESSURE_LIMIT:
+            self.__memory_pressure = True
+        elif usage < self.__MEMORY_RELEASE_LIMIT:
+            self.__memory_pressure = False
+
+        active = [node for node in self.__running.values()
+                  if node not in self.__paused and node not in self.__requeued]
+
+        if self.__paused and (not self.__memory_pressure or not active):
+            node = self.__paused.pop(0)
+            self.__logger.info(f'Resuming {self.__nodes[node]["name"]}')
+            for proc in reversed(self.__get_process_tree(self.__nodes[node]["proc"])):
+                try:
+                    proc.resume()
+                except psutil.Error:
+                    pass
+            return
+
+        if usage <= self.__MEMORY_PRESSURE_LIMIT or len(active) < 2:
+            return
+
+        node = max(active, key=lambda n: self.__startTimes.get(n, 0))
+        info = self.__nodes[node]
+        procs = self.__get_process_tree(info["proc"])
+        if self.__memory_action == "pause":
+            self.__logger.warning(f'System memory usage is {usage:.1f}%, '
+                                  f'pausing {info["name"]}')
+            self.__paused.append(node)
+            for proc in procs:
+                try:
+                    proc.suspend()
+                except psutil.Error:
+                    pass
+        else:
+            self.__logger.warning(f'System memory usage is {usage:.1f}%, '
+                                  f'requeuing {info["name"]}')
+            self.__requeued.add(node)
+            for proc in procs:
+                try:
+                    proc.terminate()
+                except psutil.Error:
+                    pass
+            _, alive = psutil.wait_procs(procs, timeout=3)
+            for proc in alive:
+                try:
+                    proc.kill()
+                except psutil.Error:
+                    pass
+
+    def __requeue_node(self, node):
+        """
+        Private helper to place a node which was stopped back in the ready queue.
+
+        Args:
+            node (tuple): The (step, index) of the node.
+        """
+        info = self.__nodes[node]
+        step, index = node
+
+        self.__requeued.discard(node)
+        if info["parent_pipe"]:
+            info["parent_pipe"].close()
+        info["results"] = None
+        info["running"] = False
+
+        self.__record.set('status', NodeStatus.PENDING, step=step, index=index)
+        self.__add_event(DashboardEventType.NODE_FINISHED, node, status=NodeStatus.PENDING)
 
-            if changed and self.__dashboard:
-                # Update dashboard if the manifest changed
-                self.__dashboard.update_manifest(payload={"starttimes": self.__startTimes})
+        self.__create_process(node)
+        heapq.heappush(self.__ready, node)
 
-            running_nodes = self.get_running_nodes()
+    def __submit_jobs(self):
+        """
+        Private helper to submit the nodes started through job trackers.
+        """
+        for tracker in self.__get_trackers():
+            tracker.submit()
+
+    def __poll_jobs(self):
+        """
+        Private helper to poll the job trackers once the poll interval has elapsed.
 
-            # Check for situation where we have stuff left to run but don't
-            # have any nodes running. This shouldn't happen, but we will get
-            # stuck in an infinite loop if it does, so we want to break out
-            # with an explicit error.
-            if len(self.get_nodes_waiting_to_run()) > 0 and len(running_nodes) == 0:
-                raise SiliconCompilerError(
-                    'Nodes left to run, but no running nodes. From/to may be invalid.',
-                    chip=self.__chip)
+        Returns:
+            list: The (step, index) of the nodes which finished.
+        """
+        if not self.__running_jobs or time.time() < self.__next_poll:
+            return []
 
-            if len(running_nodes) == 1:
-                # if there is only one node running, just join the thread
-                self.__nodes[running_nodes[0]]["proc"].join()
-            elif len(running_nodes) > 1:
-                # if there are more than 1, join the first with a timeout
-                self.__nodes[running_nodes[0]]["proc"].join(timeout=self.__dwellTime)
+        completed = []
+        trackers = self.__get_trackers()
+        for tracker in trackers:
+            for job in tracker.poll():
+                completed.append(self.__running_jobs[job])
+        self.__next_poll = time.time() + min(tracker.poll_interval for tracker in trackers)
+
+        return completed
+
+    def __cancel_jobs(self):
+        """
+        Private helper to cancel the nodes submitted through job trackers.
+        """
+        for tracker in self.__get_trackers():
+            tracker.cancel()
+
+    def __get_trackers(self):
+        """
+        Private helper to get the job trackers in use.
+        """
+        return [tracker for tracker in self.__trackers.values() if tracker]
+
+    def __add_event(self, event_type, node, **kwargs):
+        """
+        Private helper to record a node event for the dashboard.
+
+        Args:
+            event_type (DashboardEventType): The kind of event.
+            node (tuple): The (step, index) of the node.
+            kwargs: Additional fields of the :class:`DashboardEvent`.
+        """
+        if not self.__dashboard:
+            return
+
+        step, index = node
+        self.__events.append(DashboardEvent(event_type, step, index, **kwargs))
+
+    def __add_metric_events(self, node):
+        """
+        Private helper to record the metrics of a finished node for the dashboard.
+
+        Args:
+            node (tuple): The (step, index) of the node.
+        """
+        if not self.__dashboard:
+            return
+
+        step, index = node
+        for metric in self.__schema.getkeys("metric"):
+            value = self.__schema.get("metric", metric, step=step, index=index)
+            if value is None:
+                continue
+            self.__add_event(DashboardEventType.METRIC, node, metric=metric, value=value)
+
+    def __publish_events(self):
+        """
+        Private helper to send the recorded node events to the dashboard.
+        """
+        if not self.__events:
+            return
+
+        events, self.__events = self.__events, []
+        self.__dashboard.update_status(events)
 
     def get_nodes(self):
         """Gets a sorted list of all nodes managed by this scheduler.
@@ -258,67 +742,166 @@ class TaskScheduler:
                 nodes.append(node)
         return sorted(nodes)
 
-    def __process_completed_nodes(self):
+    def __receive_results(self, node):
+        """
+        Private helper to receive the results sent back by a node.
+
+        Nodes send a single message containing their package cache and the
+        journal of schema transactions recorded during the run.
+
+        Args:
+            node (tuple): The (step, index) of the node to receive from.
         """
-        Private helper to check for and process completed nodes.
+        info = self.__nodes[node]
+        try:
+            results = info["parent_pipe"].recv()
+            if isinstance(results, dict):
+                info["results"] = results
+        except:  # noqa E722
+            pass
+
+    def __process_completed_nodes(self, nodes):
+        """
+        Private helper to process completed nodes.
+
+        This method merges the results (manifest and package cache) of each
+        terminated node back into the main chip object. It updates the node's
+        status based on the process exit code and releases its dependents.
 
-        This method iterates through running nodes, checks if their process has
-        terminated, and if so, merges their results (manifest and package cache)
-        back into the main chip object. It updates the node's status based on
-        the process exit code.
+        If the node sent its journal back through the pipe, only those
+        transactions are replayed, otherwise the journal is read from the
+        node's output manifest.
+
+        Args:
+            nodes (list): The (step, index) of the nodes which have terminated.
 
         Returns:
             bool: True if any node's status changed, False otherwise.
         """
         changed = False
-        for node in self.get_running_nodes():
+        for node in sorted(nodes):
             info = self.__nodes[node]
 
-            if not info["proc"].is_alive():
-                manifest = info["manifest"]
+            # Reap process
+            info["proc"].join()
+
+            if node in self.__requeued:
+                self.__running_pipes.pop(info["parent_pipe"], None)
+                del self.__running[info["proc"].sentinel]
+                self.__running_threads -= info["threads"]
+                self.__running_memory -= self.__memory.get(node, 0)
+                self.__requeue_node(node)
+                changed = True
+                continue
+
+            if info["parent_pipe"] in self.__running_pipes and info["parent_pipe"].poll(1):
+                self.__receive_results(node)
+            self.__running_pipes.pop(info["parent_pipe"], None)
 
+            results = info["results"] or {}
+            info["results"] = None
+
+            manifest = info["manifest"]
+
+            if results.get("journal") is not None:
+                self.__logger.debug(f'{info["name"]} is complete merging journal')
+                journal = Journal()
+                journal.from_dict(results["journal"])
+                journal.replay(self.__schema)
+                # TODO: once tool is fixed this can go away
+                self.__schema.unset("arg", "step")
+                self.__schema.unset("arg", "index")
+            elif os.path.exists(manifest):
                 self.__logger.debug(f'{info["name"]} is complete merging: {manifest}')
+                Journal.replay_file(self.__schema, manifest)
+                # TODO: once tool is fixed this can go away
+                self.__schema.unset("arg", "step")
+                self.__schema.unset("arg", "index")
+
+            packages = results.get("packages")
+            if isinstance(packages, dict):
+                for package, path in packages.items():
+                    Resolver.set_cache(self.__chip, package, path)
 
-                if os.path.exists(manifest):
-                    Journal.replay_file(self.__schema, manifest)
-                    # TODO: once tool is fixed this can go away
-                    self.__schema.unset("arg", "step")
-                    self.__schema.unset("arg", "index")
-
-                if info["parent_pipe"] and info["parent_pipe"].poll(1):
-                    try:
-                        packages = info["parent_pipe"].recv()
-                        if isinstance(packages, dict):
-                            for package, path in packages.items():
-                                Resolver.set_cache(self.__chip, package, path)
-                    except:  # noqa E722
-                        pass
-
-                step, index = node
-                if info["proc"].exitcode > 0:
+            step, index = node
+            if info["proc"].exitcode > 0:
+                status = NodeStatus.ERROR
+            else:
+                status = self.__record.get('status', step=step, index=index)
+                if not status or status == NodeStatus.PENDING:
                     status = NodeStatus.ERROR
-                else:
-                    status = self.__record.get('status', step=step, index=index)
-                    if not status or status == NodeStatus.PENDING:
-                        status = NodeStatus.ERROR
 
-                self.__record.set('status', status, step=step, index=index)
+            self.__record.set('status', status, step=step, index=index)
+            self.__add_event(DashboardEventType.NODE_FINISHED, node, status=status)
+            if self.__runtimes is not None and status == NodeStatus.SUCCESS:
+                self.__runtimes.record(step, index,
+                                       self.__flow.get(step, index, "tool"),
+                                       self.__flow.get(step, index, "task"),
+                                       self.__get_runtime_metric(self.__schema, node))
+            self.__add_metric_events(node)
+
+            if info["tracker"]:
+                del self.__running_jobs[info["proc"]]
+            else:
+                del self.__running[info["proc"].sentinel]
+                self.__running_threads -= info["threads"]
+                self.__running_memory -= self.__memory.get(node, 0)
+            info["running"] = False
+            info["proc"] = None
 
-                info["running"] = False
-                info["proc"] = None
+            changed = True
 
-                changed = True
+            TaskScheduler.__callbacks['post_node'](self.__chip, step, index)
 
-                TaskScheduler.__callbacks['post_node'](self.__chip, step, index)
+            self.__release_dependents(node)
 
         return changed
 
+    def __release_dependents(self, node):
+        """
+        Private helper to update the nodes which depend on a finished node.
+
+        Dependents which have no outstanding inputs left are moved to the ready
+        queue. Non-builtin dependents of a failed node are marked as failed
+        right away, which in turn releases their own dependents.
+
+        Args:
+            node (tuple): The (step, index) of the node which finished.
+        """
+        finished = [node]
+        while finished:
+            done_node = finished.pop()
+            done_step, done_index = done_node
+            failed = NodeStatus.is_error(
+                self.__record.get('status', step=done_step, index=done_index))
+
+            for dependent in self.__dependents.get(done_node, []):
+                info = self.__nodes[dependent]
+                if not info["proc"] or info["running"]:
+                    # Already handled
+                    continue
+
+                info["waiting_on"].discard(done_node)
+
+                if failed and not info["node"].is_builtin:
+                    # Fail if any dependency failed for non-builtin task
+                    step, index = dependent
+                    self.__record.set("status", NodeStatus.ERROR, step=step, index=index)
+                    self.__add_event(DashboardEventType.NODE_FINISHED, dependent,
+                                     status=NodeStatus.ERROR)
+                    info["proc"] = None
+                    finished.append(dependent)
+                elif not info["waiting_on"]:
+                    heapq.heappush(self.__ready, dependent)
+
     def __allow_start(self, node):
         """
         Private helper to check if a node is allowed to start based on resources.
 
         This method checks if launching a new node would exceed the configured
-        maximum number of parallel jobs or the total available CPU cores.
+        maximum number of parallel jobs, the total available CPU cores or the
+        memory budget, and delays nodes while the system is under memory
+        pressure. The memory limits do not apply when no other node is running.
 
         Args:
             node (tuple): The (step, index) of the node to check.
@@ -332,18 +915,23 @@ class TaskScheduler:
             # using a different scheduler, so allow
             return True
 
-        running_nodes = self.get_running_nodes()
-
-        if len(running_nodes) >= self.__max_parallel_run:
+        if len(self.__running) >= self.__max_parallel_run:
             # exceeding machine resources
             return False
 
-        current_threads = sum([self.__nodes[run_node]["threads"] for run_node in running_nodes])
-
-        if info["threads"] + current_threads > self.__max_cores:
+        if info["threads"] + self.__running_threads > self.__max_cores:
             # delay until there are enough core available
             return False
 
+        if self.__running and (self.__memory_pressure or self.__paused):
+            # delay until the memory pressure is released
+            return False
+
+        if self.__running and self.__max_memory and \
+                self.__memory.get(node, 0) + self.__running_memory > self.__max_memory:
+            # delay until there is enough memory available
+            return False
+
         # allow
         return True
 
@@ -351,60 +939,87 @@ class TaskScheduler:
         """
         Private helper to launch new nodes whose dependencies are met.
 
-        This method iterates through pending nodes, checks if all their input
-        nodes have completed successfully, and if system resources are available.
-        If all conditions are met, it starts the node's process.
+        This method iterates through the ready queue in priority order,
+        checks that the inputs of builtin tasks produced at least one success,
+        and if system resources are available, starts the node's process.
+        Nodes which cannot be started yet are kept in the ready queue.
+
+        With the 'criticalpath' policy, once a node has to wait for resources,
+        lower priority nodes are only started if they are expected to finish
+        before that node can start.
 
         Returns:
             bool: True if any new node was launched, False otherwise.
         """
         changed = False
-        for node in self.get_nodes_waiting_to_run():
+        deferred = []
+        reserved_until = None
+
+        ready = sorted(self.__ready, key=self.__get_priority)
+        self.__ready.clear()
+        for node in ready:
+
             # TODO: breakpoint logic:
             # if node is breakpoint, then don't launch while len(running_nodes) > 0
 
             info = self.__nodes[node]
             step, index = node
 
-            ready = True
-            inputs = []
-            for in_step, in_index in info["inputs"]:
-                in_status = self.__record.get('status', step=in_step, index=in_index)
-                inputs.append(in_status)
-
-                if not NodeStatus.is_done(in_status):
-                    ready = False
-                    break
-                if NodeStatus.is_error(in_status) and not info["node"].is_builtin:
-                    # Fail if any dependency failed for non-builtin task
-                    self.__record.set("status", NodeStatus.ERROR, step=step, index=index)
+            if not info["proc"] or info["running"]:
+                continue
 
-            # Fail if no dependency successfully finished for builtin task
-            if inputs:
-                any_success = any([status == NodeStatus.SUCCESS for status in inputs])
+            inputs = [self.__record.get('status', step=in_step, index=in_index)
+                      for in_step, in_index in info["inputs"]]
+            if info["node"].is_builtin:
+                # Fail if no dependency successfully finished for builtin task
+                failed = inputs and not any([status == NodeStatus.SUCCESS for status in inputs])
             else:
-                any_success = True
-            if ready and info["node"].is_builtin and not any_success:
+                # Fail if any dependency failed for non-builtin task
+                failed = any([NodeStatus.is_error(status) for status in inputs])
+            if failed:
                 self.__record.set("status", NodeStatus.ERROR, step=step, index=index)
-
-            if self.__record.get('status', step=step, index=index) == NodeStatus.ERROR:
+                self.__add_event(DashboardEventType.NODE_FINISHED, node, status=NodeStatus.ERROR)
                 info["proc"] = None
+                self.__release_dependents(node)
                 continue
 
-            # If there are no dependencies left, launch this node and
-            # remove from nodes_to_run.
-            if ready and self.__allow_start(node):
-                self.__logger.debug(f'Launching {info["name"]}')
+            if not self.__allow_start(node):
+                if self.__runtimes is not None and reserved_until is None:
+                    reserved_until = self.__get_reservation(info["threads"])
+                deferred.append(node)
+                continue
 
-                TaskScheduler.__callbacks['pre_node'](self.__chip, step, index)
+            if reserved_until is not None and info["node"].is_local and \
+                    time.time() + self.__estimates[node] > reserved_until:
+                # Starting this node would delay a higher priority node
+                deferred.append(node)
+                continue
 
-                self.__record.set('status', NodeStatus.RUNNING, step=step, index=index)
-                self.__startTimes[node] = time.time()
-                changed = True
+            self.__logger.debug(f'Launching {info["name"]}')
+
+            TaskScheduler.__callbacks['pre_node'](self.__chip, step, index)
+
+            self.__record.set('status', NodeStatus.RUNNING, step=step, index=index)
+            self.__startTimes[node] = time.time()
+            self.__add_event(DashboardEventType.NODE_STARTED, node, status=NodeStatus.RUNNING,
+                             time=self.__startTimes[node])
+            changed = True
+
+            # Start the process
+            info["running"] = True
+            info["proc"].start()
+            if info["tracker"]:
+                self.__running_jobs[info["proc"]] = node
+                continue
+
+            self.__running[info["proc"].sentinel] = node
+            if info["parent_pipe"]:
+                self.__running_pipes[info["parent_pipe"]] = node
+            self.__running_threads += info["threads"]
+            self.__running_memory += self.__memory.get(node, 0)
 
-                # Start the process
-                info["running"] = True
-                info["proc"].start()
+        for node in deferred:
+            heapq.heappush(self.__ready, node)
 
         return changed
 
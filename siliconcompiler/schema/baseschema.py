@@ -6,8 +6,10 @@
 
 import contextlib
 import copy
+import functools
 import importlib
 import logging
+import mmap
 
 try:
     import gzip
@@ -24,6 +26,7 @@ except ModuleNotFoundError:
 
 import os.path
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import cache
 from typing import Dict, Type, Tuple, Union, Set, Callable, List
 
@@ -37,6 +40,17 @@ class BaseSchema:
     It can be modified using :class:`EditableSchema`.
     '''
 
+    # Version of the schema structure, used to invalidate the keypath search caches
+    __search_version = 0
+
+    # Indexed manifest file format
+    __INDEXED_EXT = ".idx"
+    __INDEXED_MAGIC = b"SCIDX1\n"
+    __INDEXED_FOOTER = 21
+
+    # Parameter fields which are not written to compact manifests
+    __COMPACT_FIELDS = ("help", "shorthelp", "example", "switch", "notes", "scope", "require")
+
     def __init__(self):
         self.__manifest = {}
         self.__default = None
@@ -44,6 +58,8 @@ class BaseSchema:
         self.__parent = self
         self.__active = None
         self.__key = None
+        self.__search_cache = {}
+        self.__search_cache_version = BaseSchema.__search_version
 
     @property
     def _keypath(self):
@@ -148,6 +164,8 @@ class BaseSchema:
         handled = set()
         missing = set()
 
+        BaseSchema._invalidate_search_cache()
+
         if "__journal__" in manifest:
             self.__journal.from_dict(manifest["__journal__"])
             del manifest["__journal__"]
@@ -155,6 +173,11 @@ class BaseSchema:
         if "__meta__" in manifest:
             del manifest["__meta__"]
 
+        if "__compact__" in manifest:
+            if version is None:
+                version = tuple([int(v) for v in manifest["__compact__"]["version"].split(".")])
+            del manifest["__compact__"]
+
         if self.__default:
             data = manifest.get("default", None)
             if data:
@@ -193,7 +216,8 @@ class BaseSchema:
 
     # Manifest methods
     @classmethod
-    def from_manifest(cls, filepath: str = None, cfg: Dict = None) -> "BaseSchema":
+    def from_manifest(cls, filepath: str = None, cfg: Dict = None,
+                      keypaths: List[Tuple[str]] = None) -> "BaseSchema":
         '''
         Create a new schema based on the provided source files.
 
@@ -202,13 +226,15 @@ class BaseSchema:
         Args:
             filepath (path): Initial manifest.
             cfg (dict): Initial configuration dictionary.
+            keypaths (list of keypaths): If provided, only the sections along these
+                keypaths are loaded from the manifest, see :meth:`_read_manifest`.
         '''
 
         if not filepath and cfg is None:
             raise RuntimeError("filepath or dictionary is required")
 
         if filepath:
-            cfg = BaseSchema._read_manifest(filepath)
+            cfg = BaseSchema._read_manifest(filepath, keypaths=keypaths)
 
         new_cls = None
         if "__meta__" in cfg:
@@ -236,100 +262,327 @@ class BaseSchema:
         return f"[{','.join([*self._keypath, *key])}]"
 
     @staticmethod
-    def _read_manifest(filepath: str):
+    def __is_indexed_file(filepath: str) -> bool:
+        _, ext = os.path.splitext(filepath)
+        return ext.lower() == BaseSchema.__INDEXED_EXT
+
+    @staticmethod
+    def __is_section(key: str, data) -> bool:
+        if key == "default" or not isinstance(data, dict):
+            return False
+        # Parameters are encoded with a type string and node dictionary
+        return not (isinstance(data.get("type", None), str) and
+                    isinstance(data.get("node", None), dict))
+
+    @staticmethod
+    def __select_keypaths(manifest: Dict, keypaths: List[Tuple[str]]) -> Dict:
+        """
+        Restricts a manifest dictionary to the sections along the keypaths.
+        """
+        selected = {}
+        for key, data in manifest.items():
+            if key.startswith("__"):
+                selected[key] = data
+
+        for keypath in keypaths:
+            key = keypath[0]
+            if key not in manifest:
+                continue
+            data = manifest[key]
+            if len(keypath) == 1 or not isinstance(data, dict):
+                selected[key] = data
+                continue
+
+            section = selected.setdefault(key, {})
+            if section is data:
+                continue
+            for subkey, subdata in data.items():
+                if subkey == keypath[1] or not BaseSchema.__is_section(subkey, subdata):
+                    section[subkey] = subdata
+        return selected
+
+    @staticmethod
+    def __read_indexed_manifest(filepath: str, keypaths: List[Tuple[str]] = None) -> Dict:
+        """
+        Reads an indexed manifest.
+
+        The file is memory mapped and only the sections along the keypaths
+        are decoded.
+        """
+        magic = BaseSchema.__INDEXED_MAGIC
+        footer = BaseSchema.__INDEXED_FOOTER
+
+        with open(filepath, "rb") as fin, \
+                mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if len(data) < len(magic) + footer or data[0:len(magic)] != magic:
+                raise ValueError(f"{filepath} is not an indexed manifest")
+
+            def load(location):
+                offset, length = location
+                return json.loads(data[offset:offset + length])
+
+            index_offset = int(data[len(data) - footer:])
+            index = json.loads(data[index_offset:len(data) - footer])
+
+            manifest = load(index["header"])
+
+            sections = index["sections"]
+            if keypaths is None:
+                keypaths = [(key,) for key in sections.keys()]
+
+            for keypath in keypaths:
+                key = keypath[0]
+                if key not in sections:
+                    continue
+                section_index = sections[key]
+
+                if key not in manifest:
+                    manifest[key] = load(section_index[""])
+                section = manifest[key]
+
+                if len(keypath) == 1:
+                    subkeys = section_index.keys()
+                else:
+                    subkeys = [keypath[1]]
+                for subkey in subkeys:
+                    if subkey and subkey in section_index and subkey not in section:
+                        section[subkey] = load(section_index[subkey])
+
+        return manifest
+
+    @staticmethod
+    def __compact_manifest(manifest: Dict) -> Dict:
+        """
+        Removes the parameter fields and default values which are provided by
+        the schema classes from a manifest.
+        """
+        compact = {}
+        for key, data in manifest.items():
+            if key == "default":
+                continue
+            if key.startswith("__") or not isinstance(data, dict):
+                compact[key] = data
+            elif BaseSchema.__is_section(key, data):
+                compact[key] = BaseSchema.__compact_manifest(data)
+            else:
+                param = {field: value for field, value in data.items()
+                         if field not in BaseSchema.__COMPACT_FIELDS}
+                param["node"] = {step: indexdata for step, indexdata in data["node"].items()
+                                 if step != "default"}
+                compact[key] = param
+        return compact
+
+    def __getdict_manifest(self, compact: bool) -> Dict:
+        """
+        Returns the dictionary to write to a manifest.
+        """
+        manifest = self.getdict()
+        if not compact:
+            return manifest
+
+        # Imported here since the schema version is defined with the schema classes
+        from .schema_cfg import SCHEMA_VERSION
+
+        manifest = BaseSchema.__compact_manifest(manifest)
+        manifest["__compact__"] = {"version": SCHEMA_VERSION}
+        return manifest
+
+    def __write_indexed_manifest(self, filepath: str, compact: bool):
+        """
+        Writes an indexed manifest.
+
+        Each top level section and each schema within a top level section is
+        encoded separately, followed by an index of the locations of the
+        sections and a fixed size footer pointing to the index.
+        """
+        def encode(data):
+            if _has_orjson:
+                return json.dumps(data)
+            return json.dumps(data).encode("utf-8")
+
+        manifest = self.__getdict_manifest(compact)
+
+        with open(filepath, "wb") as fout:
+            fout.write(BaseSchema.__INDEXED_MAGIC)
+
+            def write(data):
+                blob = encode(data)
+                location = [fout.tell(), len(blob)]
+                fout.write(blob)
+                return location
+
+            header = {}
+            sections = {}
+            for key, data in manifest.items():
+                if key.startswith("__") or not isinstance(data, dict):
+                    header[key] = data
+                    continue
+
+                section_index = {}
+                remainder = {}
+                for subkey, subdata in data.items():
+                    if BaseSchema.__is_section(subkey, subdata):
+                        section_index[subkey] = write(subdata)
+                    else:
+                        remainder[subkey] = subdata
+                section_index[""] = write(remainder)
+                sections[key] = section_index
+
+            index = {
+                "header": write(header),
+                "sections": sections
+            }
+            index_offset = fout.tell()
+            fout.write(encode(index))
+            fout.write(f"{index_offset:020d}\n".encode("utf-8"))
+
+    @staticmethod
+    def _read_manifest(filepath: str, keypaths: List[Tuple[str]] = None):
         """
         Reads a manifest from disk and returns dictionary.
 
+        Manifests ending in ``.idx`` are read as indexed manifests, which
+        only decode the requested sections, all other manifests are read as
+        json, optionally gzip compressed.
+
         Args:
             filename (path): Path to a manifest file to be loaded.
+            keypaths (list of keypaths): If provided, only the sections along these
+                keypaths are returned. The selection is done on the top level
+                keys and the schema sections one level below them.
         """
 
+        if BaseSchema.__is_indexed_file(filepath):
+            return BaseSchema.__read_indexed_manifest(filepath, keypaths=keypaths)
+
         fin = BaseSchema.__open_file(filepath)
         try:
             manifest = json.loads(fin.read())
         finally:
             fin.close()
 
+        if keypaths is not None:
+            manifest = BaseSchema.__select_keypaths(manifest, keypaths)
+
         return manifest
 
-    def read_manifest(self, filepath: str):
+    def read_manifest(self, filepath: str, keypaths: List[Tuple[str]] = None):
         """
         Reads a manifest from disk and replaces the current data with the data in the file.
 
         Args:
             filename (path): Path to a manifest file to be loaded.
+            keypaths (list of keypaths): If provided, only the sections along these
+                keypaths are loaded, see :meth:`_read_manifest`.
 
         Examples:
             >>> schema.read_manifest('mychip.json')
             Loads the file mychip.json into the current Schema object.
         """
 
-        self._from_dict(BaseSchema._read_manifest(filepath), [])
+        self._from_dict(BaseSchema._read_manifest(filepath, keypaths=keypaths), [])
 
-    def write_manifest(self, filepath: str):
+    def write_manifest(self, filepath: str, compact: bool = False):
         '''
         Writes the manifest to a file.
 
+        The format is selected based on the file extension, ``.idx`` files are
+        written as indexed manifests, which allow individual sections to be loaded
+        without decoding the full manifest, and all other files are written as json,
+        ``.gz`` files will be compressed.
+
+        Compact manifests only contain the values of the parameters, the help,
+        shorthelp, example, switch, notes, scope and require fields and the
+        default values are restored from the schema classes when the manifest
+        is loaded with :meth:`from_manifest`. The complete manifest should be
+        used when the manifest is archived or loaded without the schema classes.
+
         Args:
             filename (filepath): Output filepath.
+            compact (bool): If true, writes a compact manifest.
 
         Examples:
             >>> schema.write_manifest('mydump.json')
             Dumps the current manifest into mydump.json
         '''
 
+        if BaseSchema.__is_indexed_file(filepath):
+            self.__write_indexed_manifest(filepath, compact)
+            return
+
+        manifest = self.__getdict_manifest(compact)
+
         fout = BaseSchema.__open_file(filepath, is_read=False)
 
         if _has_orjson:
-            manifest_str = json.dumps(self.getdict(), option=json.OPT_INDENT_2).decode()
+            manifest_str = json.dumps(manifest, option=json.OPT_INDENT_2).decode()
         else:
-            manifest_str = json.dumps(self.getdict(), indent=2)
+            manifest_str = json.dumps(manifest, indent=2)
         fout.write(manifest_str)
 
         fout.close()
 
     # Accessor methods
+    @staticmethod
+    def _invalidate_search_cache() -> None:
+        """
+        Invalidates the keypath search caches of all schemas.
+
+        This must be called whenever schema sections or parameters are added,
+        replaced or removed.
+        """
+        BaseSchema.__search_version += 1
+
     def __search(self,
                  *keypath: str,
                  insert_defaults: bool = False,
                  use_default: bool = False,
-                 require_leaf: bool = True,
-                 complete_path: bool = None) -> Union["BaseSchema", Parameter]:
+                 require_leaf: bool = True) -> Union["BaseSchema", Parameter]:
         if len(keypath) == 0:
             if require_leaf:
                 raise KeyError
             else:
                 return self
 
-        if complete_path is None:
-            complete_path = []
-        complete_path.append(keypath[0])
+        if self.__search_cache_version != BaseSchema.__search_version:
+            self.__search_cache = {}
+            self.__search_cache_version = BaseSchema.__search_version
 
-        if keypath[0] == "default":
-            key_param = self.__default
-        else:
-            key_param = self.__manifest.get(keypath[0], None)
-        if not key_param:
-            if insert_defaults and self.__default:
-                if isinstance(self.__default, Parameter) and self.__default.get(field='lock'):
-                    raise KeyError
-                key_param = self.__default.copy(key=complete_path)
-                self.__manifest[keypath[0]] = key_param
-            elif use_default and self.__default:
-                key_param = self.__default
+        # Parameters found without relying on defaults can be reused
+        param = self.__search_cache.get(keypath, None)
+        if param is not None:
+            return param
+
+        cacheable = True
+        key_param = self
+        for n, key in enumerate(keypath):
+            schema = key_param
+            if key == "default":
+                key_param = schema.__default
+                cacheable = False
             else:
-                raise KeyError
-        if isinstance(key_param, BaseSchema):
-            if len(keypath) == 1:
-                if require_leaf:
-                    raise KeyError
+                key_param = schema.__manifest.get(key, None)
+            if not key_param:
+                if insert_defaults and schema.__default:
+                    if isinstance(schema.__default, Parameter) and \
+                            schema.__default.get(field='lock'):
+                        raise KeyError
+                    key_param = schema.__default.copy(key=list(keypath[0:n+1]))
+                    schema.__manifest[key] = key_param
+                    BaseSchema._invalidate_search_cache()
+                    cacheable = False
+                elif use_default and schema.__default:
+                    key_param = schema.__default
+                    cacheable = False
                 else:
-                    return key_param
-            return key_param.__search(*keypath[1:],
-                                      insert_defaults=insert_defaults,
-                                      use_default=use_default,
-                                      require_leaf=require_leaf,
-                                      complete_path=complete_path)
+                    raise KeyError
+            if not isinstance(key_param, BaseSchema):
+                if cacheable and n == len(keypath) - 1:
+                    self.__search_cache[keypath] = key_param
+                return key_param
+
+        if require_leaf:
+            raise KeyError
         return key_param
 
     def get(self, *keypath: str, field: str = 'value',
@@ -373,7 +626,8 @@ class BaseSchema:
                 if isinstance(param, Parameter):
                     raise ValueError(f"{self.__format_key(*keypath)} is a complete keypath")
                 self.__journal.record("get", keypath, field=field, step=step, index=index)
-                param.__journal = self.__journal.get_child(*keypath)
+                if not self.__journal.is_child(param.__journal, *keypath):
+                    param.__journal = self.__journal.get_child(*keypath)
                 return param
         except KeyError:
             raise KeyError(f"{self.__format_key(*keypath)} is not a valid keypath")
@@ -546,6 +800,7 @@ class BaseSchema:
             return
 
         del key_param.__manifest[removal_key]
+        BaseSchema._invalidate_search_cache()
         self.__journal.record("remove", keypath)
 
     def valid(self, *keypath: str, default_valid: bool = False,
@@ -710,14 +965,20 @@ class BaseSchema:
         """
         Returns a copy of this schema.
 
+        The parameters of the copy share their values with the parameters of
+        this schema until either is modified.
+
         Args:
             key (list of str): keypath to this schema
         """
 
         parent = self.__parent
+        search_cache = self.__search_cache
         self.__parent = None
+        self.__search_cache = {}
         schema_copy = copy.deepcopy(self)
         self.__parent = parent
+        self.__search_cache = search_cache
 
         if self is not self.__parent:
             schema_copy.__parent = self.__parent
@@ -866,7 +1127,7 @@ class BaseSchema:
         if packages is None:
             packages = base_schema._find_files_dataroot_resolvers()
 
-        resolved_paths = []
+        lookups = []
         root_search_paths = base_schema._find_files_search_paths(keypath[-1], step, index)
         for path in paths:
             search_paths = root_search_paths.copy()
@@ -888,25 +1149,45 @@ class BaseSchema:
                 if cwd:
                     search_paths.append(os.path.abspath(cwd))
 
-            try:
-                if hash:
-                    resolved = path.hash(hashalgo,
-                                         search=search_paths,
-                                         collection_dir=collection_dir)
-                else:
-                    resolved = path.resolve_path(search=search_paths,
-                                                 collection_dir=collection_dir)
-            except FileNotFoundError:
-                resolved = None
-                if not missing_ok:
-                    if package:
-                        raise FileNotFoundError(
-                            f'Could not find "{path.get()}" in {package} '
-                            f'{self.__format_key(*keypath)}')
+            lookups.append((path, package, search_paths))
+
+        def lookup(path, search_paths):
+            if hash:
+                return path.hash(hashalgo,
+                                 search=search_paths,
+                                 collection_dir=collection_dir)
+            return path.resolve_path(search=search_paths,
+                                     collection_dir=collection_dir)
+
+        with contextlib.ExitStack() as stack:
+            if hash and len(lookups) > 1:
+                # Hash files concurrently, hashing releases the GIL on large blocks
+                pool = stack.enter_context(ThreadPoolExecutor(
+                    max_workers=min(len(lookups), os.cpu_count() or 1, 8)))
+                results = [pool.submit(lookup, path, search_paths)
+                           for path, _, search_paths in lookups]
+            else:
+                results = [functools.partial(lookup, path, search_paths)
+                           for path, _, search_paths in lookups]
+
+            resolved_paths = []
+            for (path, package, _), result in zip(lookups, results):
+                try:
+                    if isinstance(result, Future):
+                        resolved = result.result()
                     else:
-                        raise FileNotFoundError(
-                            f'Could not find "{path.get()}" {self.__format_key(*keypath)}')
-            resolved_paths.append(resolved)
+                        resolved = result()
+                except FileNotFoundError:
+                    resolved = None
+                    if not missing_ok:
+                        if package:
+                            raise FileNotFoundError(
+                                f'Could not find "{path.get()}" in {package} '
+                                f'{self.__format_key(*keypath)}')
+                        else:
+                            raise FileNotFoundError(
+                                f'Could not find "{path.get()}" {self.__format_key(*keypath)}')
+                resolved_paths.append(resolved)
 
         if not is_list:
             if not resolved_paths:
@@ -105,6 +105,7 @@ class EditableSchema:
             raise ValueError(f"Value ({type(value)}) must be schema type: Parameter, BaseSchema")
 
         self.__insert(keypath, value, keypath, clobber=clobber)
+        BaseSchema._invalidate_search_cache()
 
     def remove(self, *keypath: str) -> None:
         '''
@@ -125,6 +126,7 @@ class EditableSchema:
             raise ValueError("Keypath must only be strings")
 
         self.__remove(keypath, keypath)
+        BaseSchema._invalidate_search_cache()
 
     def search(self, *keypath: str) -> Union[BaseSchema, Parameter]:
         '''
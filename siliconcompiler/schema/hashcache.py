@@ -0,0 +1,207 @@
+# Copyright 2025 Silicon Compiler Authors. All Rights Reserved.
+
+# NOTE: this file cannot rely on any third-party dependencies, including other
+# SC dependencies outside of its directory, since it may be used by tool drivers
+# that have isolated Python environments.
+
+import hashlib
+import os
+import pathlib
+import threading
+import time
+
+import os.path
+
+try:
+    import sqlite3
+    _has_sqlite = True
+except ModuleNotFoundError:
+    _has_sqlite = False
+
+
+class FileHashCache:
+    '''
+    Persistent cache of file and directory hashes.
+
+    Entries are keyed on the device, inode, size and modification time of the
+    file along with the hashing algorithm, so a file is only rehashed when it
+    changes. Directories are keyed on the same information for every file in
+    the directory. The cache is stored in a sqlite database and the least
+    recently used entries are evicted once the cache grows beyond max_entries.
+
+    Args:
+        path (path): path to the cache database
+        max_entries (int): maximum number of entries to keep in the cache
+    '''
+
+    # Files modified within this window are not cached, since the timestamp
+    # may not change if the file is modified again.
+    __RACY_WINDOW = 2.0
+
+    def __init__(self, path: str, max_entries: int = 100000):
+        self.__path = os.path.abspath(path)
+        self.__max_entries = max_entries
+
+        self.__lock = threading.Lock()
+        self.__conn = None
+        self.__pid = None
+        self.__failed = not _has_sqlite
+
+    @property
+    def path(self) -> str:
+        '''
+        Returns the path to the cache database
+        '''
+        return self.__path
+
+    def __connect(self):
+        if self.__failed:
+            return None
+
+        if self.__conn is not None and self.__pid == os.getpid():
+            return self.__conn
+
+        try:
+            os.makedirs(os.path.dirname(self.__path), exist_ok=True)
+            conn = sqlite3.connect(self.__path, timeout=30, check_same_thread=False)
+            conn.execute("CREATE TABLE IF NOT EXISTS hashes ("
+                         "key TEXT PRIMARY KEY, "
+                         "digest TEXT NOT NULL, "
+                         "last_used REAL NOT NULL)")
+            conn.execute("CREATE INDEX IF NOT EXISTS hashes_last_used ON hashes (last_used)")
+            conn.commit()
+        except (sqlite3.Error, OSError):
+            self.__failed = True
+            return None
+
+        self.__conn = conn
+        self.__pid = os.getpid()
+        return conn
+
+    @staticmethod
+    def __is_racy(stat) -> bool:
+        return time.time() - stat.st_mtime < FileHashCache.__RACY_WINDOW
+
+    @staticmethod
+    def file_key(filename: str, algorithm: str) -> str:
+        '''
+        Returns the cache key for a file or None if it cannot be cached.
+
+        Args:
+            filename (path): path to file
+            algorithm (str): name of hashing function
+        '''
+        stat = os.stat(filename)
+        if FileHashCache.__is_racy(stat):
+            return None
+        return f"file:{stat.st_dev}:{stat.st_ino}:{stat.st_size}:{stat.st_mtime_ns}:{algorithm}"
+
+    @staticmethod
+    def directory_key(dirname: str, algorithm: str) -> str:
+        '''
+        Returns the cache key for a directory or None if it cannot be cached.
+
+        Args:
+            dirname (path): path to directory
+            algorithm (str): name of hashing function
+        '''
+        signature = hashlib.sha1()
+        for root, _, files in os.walk(dirname):
+            for f in sorted(files):
+                path = os.path.join(root, f)
+                stat = os.stat(path)
+                if FileHashCache.__is_racy(stat):
+                    return None
+                relpath = pathlib.PureWindowsPath(os.path.relpath(path, dirname)).as_posix()
+                signature.update(f"{relpath}:{stat.st_dev}:{stat.st_ino}:{stat.st_size}:"
+                                 f"{stat.st_mtime_ns}\n".encode("utf-8"))
+        stat = os.stat(dirname)
+        return f"dir:{stat.st_dev}:{stat.st_ino}:{signature.hexdigest()}:{algorithm}"
+
+    def get(self, key: str) -> str:
+        '''
+        Returns the cached digest for a key, or None if it is not cached.
+
+        Args:
+            key (str): cache key
+        '''
+        if key is None:
+            return None
+
+        with self.__lock:
+            conn = self.__connect()
+            if not conn:
+                return None
+
+            try:
+                row = conn.execute("SELECT digest FROM hashes WHERE key = ?", (key,)).fetchone()
+                if row:
+                    conn.execute("UPDATE hashes SET last_used = ? WHERE key = ?",
+                                 (time.time(), key))
+                    conn.commit()
+            except sqlite3.Error:
+                return None
+
+        if row:
+            return row[0]
+        return None
+
+    def put(self, key: str, digest: str) -> None:
+        '''
+        Records the digest for a key, evicting the least recently used entries
+        if the cache is full.
+
+        Args:
+            key (str): cache key
+            digest (str): hash digest
+        '''
+        if key is None or digest is None:
+            return
+
+        with self.__lock:
+            conn = self.__connect()
+            if not conn:
+                return
+
+            try:
+                conn.execute("INSERT OR REPLACE INTO hashes (key, digest, last_used) "
+                             "VALUES (?, ?, ?)", (key, digest, time.time()))
+                count = conn.execute("SELECT COUNT(*) FROM hashes").fetchone()[0]
+                if count > self.__max_entries:
+                    conn.execute("DELETE FROM hashes WHERE key IN "
+                                 "(SELECT key FROM hashes ORDER BY last_used ASC LIMIT ?)",
+                                 (count - self.__max_entries,))
+                conn.commit()
+            except sqlite3.Error:
+                pass
+
+    def __len__(self) -> int:
+        with self.__lock:
+            conn = self.__connect()
+            if not conn:
+                return 0
+            try:
+                return conn.execute("SELECT COUNT(*) FROM hashes").fetchone()[0]
+            except sqlite3.Error:
+                return 0
+
+    def close(self) -> None:
+        '''
+        Closes the connection to the cache database
+        '''
+        with self.__lock:
+            if self.__conn is not None and self.__pid == os.getpid():
+                self.__conn.close()
+            self.__conn = None
+            self.__pid = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_FileHashCache__lock"]
+        state["_FileHashCache__conn"] = None
+        state["_FileHashCache__pid"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__ = state
+        self.__lock = threading.Lock()
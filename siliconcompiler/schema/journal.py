@@ -45,6 +45,18 @@ class Journal:
         child.__parent = self.__parent
         return child
 
+    def is_child(self, child: "Journal", *keypath: Tuple[str]) -> bool:
+        '''
+        Returns true if the journal is equivalent to a child journal of this journal
+
+        Args:
+            child (:class:`Journal`): journal to check
+            keypath (list of str): keypath the child is expected to prefix
+        '''
+
+        return child.__parent is self.__parent and \
+            child.__keyprefix == (*self.__keyprefix, *keypath)
+
     def from_dict(self, manifest: Dict):
         '''
         Import a journal from a manifest dictionary
@@ -4,7 +4,7 @@
 # SC dependencies outside of its directory, since it may be used by tool drivers
 # that have isolated Python environments.
 
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
 
 from .baseschema import BaseSchema
 
@@ -64,7 +64,8 @@ class NamedSchema(BaseSchema):
         raise NotImplementedError("Must be implemented by the child classes.")
 
     @classmethod
-    def from_manifest(cls, name: str, filepath: str = None, cfg: Dict = None):
+    def from_manifest(cls, name: str, filepath: str = None, cfg: Dict = None,
+                      keypaths: List[Tuple[str]] = None):
         '''
         Create a new schema based on the provided source files.
 
@@ -74,6 +75,8 @@ class NamedSchema(BaseSchema):
             name (str): name of the schema
             filepath (path): Initial manifest.
             cfg (dict): Initial configuration dictionary.
+            keypaths (list of keypaths): If provided, only the sections along these
+                keypaths are loaded from the manifest.
         '''
 
         if not filepath and cfg is None:
@@ -82,7 +85,7 @@ class NamedSchema(BaseSchema):
         schema = cls()
         schema.set_name(name)
         if filepath:
-            schema.read_manifest(filepath)
+            schema.read_manifest(filepath, keypaths=keypaths)
         if cfg:
             schema._from_dict(cfg, [])
         return schema
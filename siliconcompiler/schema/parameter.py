@@ -8,6 +8,7 @@ import argparse
 import copy
 import re
 import shlex
+import weakref
 
 from enum import Enum
 
@@ -40,6 +41,63 @@ class PerNode(Enum):
         return self == PerNode.NEVER
 
 
+class _ParameterDefinition:
+    '''
+    Static fields of a parameter, which are shared by all the parameters with
+    the same definition. A definition must not be modified, instead a new one
+    is obtained with :meth:`replace`.
+    '''
+
+    __fields = ("type", "scope", "lock", "require", "switch", "shorthelp", "example", "help",
+                "notes", "pernode", "unit", "hashalgo", "copy")
+    __slots__ = (*__fields, "__weakref__")
+
+    __definitions = weakref.WeakValueDictionary()
+
+    @classmethod
+    def get(cls, type, scope, lock, require, switch, shorthelp, example, help, notes,
+            pernode, unit, hashalgo, copy):
+        '''
+        Returns the definition with these fields.
+        '''
+        switch = tuple(switch)
+        example = tuple(example)
+
+        key = (type.__class__, NodeType.encode(type), scope, lock, require, switch,
+               shorthelp, example, help, notes, pernode, unit, hashalgo, copy)
+        definition = cls.__definitions.get(key)
+        if definition is None:
+            definition = object.__new__(cls)
+            definition.type = type
+            definition.scope = scope
+            definition.lock = lock
+            definition.require = require
+            definition.switch = switch
+            definition.shorthelp = shorthelp
+            definition.example = example
+            definition.help = help
+            definition.notes = notes
+            definition.pernode = pernode
+            definition.unit = unit
+            definition.hashalgo = hashalgo
+            definition.copy = copy
+            cls.__definitions[key] = definition
+        return definition
+
+    def replace(self, **fields):
+        '''
+        Returns the definition with the provided fields changed.
+        '''
+        return _ParameterDefinition.get(**{
+            **{field: getattr(self, field) for field in _ParameterDefinition.__fields},
+            **fields})
+
+    def __reduce__(self):
+        # Unpickled definitions are shared with the existing definitions
+        return (_ParameterDefinition.get,
+                tuple(getattr(self, field) for field in _ParameterDefinition.__fields))
+
+
 class Parameter:
     '''
     Leaf nodes in the schema. This holds all the information for a given keypath.
@@ -63,6 +121,8 @@ class Parameter:
         kwargs: forwarded to default value constructor
     '''
 
+    __slots__ = ("__definition", "__defvalue", "__node", "__shared")
+
     GLOBAL_KEY = 'global'
 
     def __init__(self,
@@ -82,77 +142,86 @@ class Parameter:
                  pernode=PerNode.NEVER,
                  **kwargs):
 
-        self.__type = NodeType.parse(type)
-        self.__scope = Scope(scope)
-        self.__lock = lock
-        self.__require = require
+        type = NodeType.parse(type)
 
         if switch is None:
             switch = []
         elif isinstance(switch, str):
             switch = [switch]
-        self.__switch = switch
-
-        self.__shorthelp = shorthelp
 
         if example is None:
             example = []
         elif isinstance(example, str):
             example = [example]
-        self.__example = example
-
-        self.__help = help
 
-        self.__notes = notes
-
-        if self.__type == 'bool':
-            if defvalue is None:
-                defvalue = False
+        if unit is not None and \
+                (NodeType.contains(type, 'int') or NodeType.contains(type, 'float')):
+            unit = str(unit)
+        else:
+            unit = None
 
-        self.__pernode = PerNode(pernode)
+        if NodeType.contains(type, 'dir') or NodeType.contains(type, 'file'):
+            hashalgo = str(hashalgo)
+            copy = bool(copy)
+        else:
+            hashalgo = None
+            copy = None
+
+        self.__definition = _ParameterDefinition.get(
+            type=type,
+            scope=Scope(scope),
+            lock=lock,
+            require=require,
+            switch=switch,
+            shorthelp=shorthelp,
+            example=example,
+            help=help,
+            notes=notes,
+            pernode=PerNode(pernode),
+            unit=unit,
+            hashalgo=hashalgo,
+            copy=copy)
 
         self.__setdefvalue(defvalue, **kwargs)
 
         self.__node = {}
 
-        self.__unit = None
-        if unit is not None and \
-                (NodeType.contains(self.__type, 'int') or NodeType.contains(self.__type, 'float')):
-            self.__unit = str(unit)
+        # True if the node values may be shared with a copy of this parameter
+        self.__shared = False
 
-        self.__hashalgo = None
-        self.__copy = None
-        if NodeType.contains(self.__type, 'dir') or NodeType.contains(self.__type, 'file'):
-            self.__hashalgo = str(hashalgo)
-            self.__copy = bool(copy)
+    def __redefine(self, **fields):
+        self.__definition = self.__definition.replace(**fields)
 
     def __setdefvalue(self, defvalue, **kwargs):
-        if NodeType.contains(self.__type, 'file'):
-            if isinstance(self.__type, list):
+        if NodeType.contains(self.__definition.type, 'file'):
+            if isinstance(self.__definition.type, list):
                 self.__defvalue = NodeListValue(FileNodeValue(defvalue, **kwargs))
-            elif isinstance(self.__type, set):
+            elif isinstance(self.__definition.type, set):
                 self.__defvalue = NodeSetValue(FileNodeValue(defvalue, **kwargs))
             else:
                 self.__defvalue = FileNodeValue(defvalue, **kwargs)
-        elif NodeType.contains(self.__type, 'dir'):
-            if isinstance(self.__type, list):
+        elif NodeType.contains(self.__definition.type, 'dir'):
+            if isinstance(self.__definition.type, list):
                 self.__defvalue = NodeListValue(DirectoryNodeValue(defvalue, **kwargs))
-            elif isinstance(self.__type, set):
+            elif isinstance(self.__definition.type, set):
                 self.__defvalue = NodeSetValue(DirectoryNodeValue(defvalue, **kwargs))
             else:
                 self.__defvalue = DirectoryNodeValue(defvalue, **kwargs)
         else:
             kwargs = {}
-            if isinstance(self.__type, list):
-                self.__defvalue = NodeListValue(NodeValue(self.__type[0], **kwargs))
+            if isinstance(self.__definition.type, list):
+                self.__defvalue = NodeListValue(NodeValue(self.__definition.type[0], **kwargs))
                 if defvalue:
                     self.__defvalue.set(defvalue)
-            elif isinstance(self.__type, set):
-                self.__defvalue = NodeSetValue(NodeValue(list(self.__type)[0], **kwargs))
+            elif isinstance(self.__definition.type, set):
+                self.__defvalue = NodeSetValue(NodeValue(list(self.__definition.type)[0], **kwargs))
                 if defvalue:
                     self.__defvalue.set(defvalue)
             else:
-                self.__defvalue = NodeValue(self.__type, value=defvalue, **kwargs)
+                if self.__definition.type == 'bool':
+                    if defvalue is None:
+                        defvalue = False
+                self.__defvalue = NodeValue(self.__definition.type, value=defvalue, **kwargs)
 
     def __str__(self):
         return str(self.getvalues())
@@ -185,7 +254,7 @@ class Parameter:
             try:
                 return self.__node[step][index].get(field=field)
             except KeyError:
-                if self.__pernode == PerNode.REQUIRED:
+                if self.__definition.pernode == PerNode.REQUIRED:
                     return self.__defvalue.get(field=field)
 
             try:
@@ -198,31 +267,31 @@ class Parameter:
             except KeyError:
                 return self.__defvalue.get(field=field)
         elif field == "type":
-            return NodeType.encode(self.__type)
+            return NodeType.encode(self.__definition.type)
         elif field == "scope":
-            return self.__scope
+            return self.__definition.scope
         elif field == "lock":
-            return self.__lock
+            return self.__definition.lock
         elif field == "switch":
-            return copy.deepcopy(self.__switch)
+            return list(self.__definition.switch)
         elif field == "shorthelp":
-            return self.__shorthelp
+            return self.__definition.shorthelp
         elif field == "example":
-            return copy.deepcopy(self.__example)
+            return list(self.__definition.example)
         elif field == "help":
-            return self.__help
+            return self.__definition.help
         elif field == "notes":
-            return self.__notes
+            return self.__definition.notes
         elif field == "pernode":
-            return self.__pernode
+            return self.__definition.pernode
         elif field == "unit":
-            return self.__unit
+            return self.__definition.unit
         elif field == "hashalgo":
-            return self.__hashalgo
+            return self.__definition.hashalgo
         elif field == "copy":
-            return self.__copy
+            return self.__definition.copy
         elif field == "require":
-            return self.__require
+            return self.__definition.require
 
         raise ValueError(f'"{field}" is not a valid field')
 
@@ -234,10 +303,10 @@ class Parameter:
                     f': {", ".join([field for field in self.__defvalue.fields if field])}')
             return
 
-        if self.__pernode == PerNode.NEVER and (step is not None or index is not None):
+        if self.__definition.pernode == PerNode.NEVER and (step is not None or index is not None):
             raise KeyError('use of step and index are not valid')
 
-        if self.__pernode == PerNode.REQUIRED and (step is None or index is None):
+        if self.__definition.pernode == PerNode.REQUIRED and (step is None or index is None):
             raise KeyError('step and index are required')
 
         if step is None and index is not None:
@@ -269,7 +338,7 @@ class Parameter:
         '''
 
         if field != "lock":
-            if self.__lock:
+            if self.__definition.lock:
                 return False
 
         if self.is_set(step, index) and not clobber:
@@ -284,6 +353,7 @@ class Parameter:
             step = step if step is not None else Parameter.GLOBAL_KEY
             index = index if index is not None else Parameter.GLOBAL_KEY
 
+            self.__unshare()
             if step not in self.__node:
                 self.__node[step] = {}
             if index not in self.__node[step]:
@@ -291,40 +361,36 @@ class Parameter:
 
             return self.__node[step][index].set(value, field=field)
         elif field == "type":
-            self.__type = NodeType.normalize(value, "str")
+            self.__redefine(type=NodeType.normalize(value, "str"))
         elif field == "scope":
-            if isinstance(value, Scope):
-                self.__scope = value
-            else:
-                self.__scope = Scope(NodeType.normalize(value,
-                                                        NodeEnumType(*[v.value for v in Scope])))
+            if not isinstance(value, Scope):
+                value = Scope(NodeType.normalize(value, NodeEnumType(*[v.value for v in Scope])))
+            self.__redefine(scope=value)
         elif field == "lock":
-            self.__lock = NodeType.normalize(value, "bool")
+            self.__redefine(lock=NodeType.normalize(value, "bool"))
         elif field == "switch":
-            self.__switch = NodeType.normalize(value, ["str"])
+            self.__redefine(switch=NodeType.normalize(value, ["str"]))
         elif field == "shorthelp":
-            self.__shorthelp = NodeType.normalize(value, "str")
+            self.__redefine(shorthelp=NodeType.normalize(value, "str"))
         elif field == "example":
-            self.__example = NodeType.normalize(value, ["str"])
+            self.__redefine(example=NodeType.normalize(value, ["str"]))
         elif field == "help":
-            self.__help = NodeType.normalize(value, "str")
+            self.__redefine(help=NodeType.normalize(value, "str"))
         elif field == "notes":
-            self.__notes = NodeType.normalize(value, "str")
+            self.__redefine(notes=NodeType.normalize(value, "str"))
         elif field == "pernode":
-            if isinstance(value, PerNode):
-                self.__pernode = value
-            else:
-                self.__pernode = PerNode(NodeType.normalize(value,
-                                                            NodeEnumType(
-                                                                *[v.value for v in PerNode])))
+            if not isinstance(value, PerNode):
+                value = PerNode(NodeType.normalize(value,
+                                                   NodeEnumType(*[v.value for v in PerNode])))
+            self.__redefine(pernode=value)
         elif field == "unit":
-            self.__unit = NodeType.normalize(value, "str")
+            self.__redefine(unit=NodeType.normalize(value, "str"))
         elif field == "hashalgo":
-            self.__hashalgo = NodeType.normalize(value, "str")
+            self.__redefine(hashalgo=NodeType.normalize(value, "str"))
         elif field == "copy":
-            self.__copy = NodeType.normalize(value, "bool")
+            self.__redefine(copy=NodeType.normalize(value, "bool"))
         elif field == "require":
-            self.__require = NodeType.normalize(value, "bool")
+            self.__redefine(require=NodeType.normalize(value, "bool"))
         else:
             raise ValueError(f'"{field}" is not a valid field')
 
@@ -347,7 +413,7 @@ class Parameter:
             Adds the file 'hello.v' the parameter.
         '''
 
-        if self.__lock:
+        if self.__definition.lock:
             return False
 
         self.__assert_step_index(field, step, index)
@@ -362,6 +428,7 @@ class Parameter:
             step = step if step is not None else Parameter.GLOBAL_KEY
             index = index if index is not None else Parameter.GLOBAL_KEY
 
+            self.__unshare()
             if step not in self.__node:
                 self.__node[step] = {}
             if index not in self.__node[step]:
@@ -369,9 +436,11 @@ class Parameter:
 
             return self.__node[step][index].add(value, field=field)
         elif field == "switch":
-            self.__switch.extend(NodeType.normalize(value, ["str"]))
+            self.__redefine(switch=[*self.__definition.switch,
+                                    *NodeType.normalize(value, ["str"])])
         elif field == "example":
-            self.__example.extend(NodeType.normalize(value, ["str"]))
+            self.__redefine(example=[*self.__definition.example,
+                                     *NodeType.normalize(value, ["str"])])
         else:
             raise ValueError(f'"{field}" is not a valid field')
 
@@ -402,7 +471,7 @@ class Parameter:
                 on a per-node basis.
         '''
 
-        if self.__lock:
+        if self.__definition.lock:
             return False
 
         if isinstance(index, int):
@@ -411,6 +480,7 @@ class Parameter:
         step = step if step is not None else Parameter.GLOBAL_KEY
         index = index if index is not None else Parameter.GLOBAL_KEY
 
+        self.__unshare()
         try:
             del self.__node[step][index]
         except KeyError:
@@ -454,16 +524,16 @@ class Parameter:
             return dictvals
 
         dictvals = {
-            "type": NodeType.encode(self.__type),
-            "require": self.__require,
-            "scope": self.__scope.value,
-            "lock": self.__lock,
-            "switch": self.__switch.copy(),
-            "shorthelp": self.__shorthelp,
-            "example": self.__example.copy(),
-            "help": self.__help,
-            "notes": self.__notes,
-            "pernode": self.__pernode.value,
+            "type": NodeType.encode(self.__definition.type),
+            "require": self.__definition.require,
+            "scope": self.__definition.scope.value,
+            "lock": self.__definition.lock,
+            "switch": list(self.__definition.switch),
+            "shorthelp": self.__definition.shorthelp,
+            "example": list(self.__definition.example),
+            "help": self.__definition.help,
+            "notes": self.__definition.notes,
+            "pernode": self.__definition.pernode.value,
             "node": {}
         }
 
@@ -475,12 +545,12 @@ class Parameter:
         if include_default:
             dictvals["node"].setdefault("default", {})["default"] = self.__defvalue.getdict()
 
-        if self.__unit:
-            dictvals["unit"] = self.__unit
-        if self.__hashalgo:
-            dictvals["hashalgo"] = self.__hashalgo
-        if self.__copy is not None:
-            dictvals["copy"] = self.__copy
+        if self.__definition.unit:
+            dictvals["unit"] = self.__definition.unit
+        if self.__definition.hashalgo:
+            dictvals["hashalgo"] = self.__definition.hashalgo
+        if self.__definition.copy is not None:
+            dictvals["copy"] = self.__definition.copy
         return dictvals
 
     @classmethod
@@ -509,34 +579,36 @@ class Parameter:
             version (packaging.Version): Version of the dictionary schema
         '''
 
-        if self.__lock:
+        if self.__definition.lock:
             return
 
         if version and version > (0, 50, 0):
-            self.__type = NodeType.parse(manifest["type"])
+            sctype = NodeType.parse(manifest["type"])
         else:
             if "enum" in manifest:
-                self.__type = NodeType.parse(
+                sctype = NodeType.parse(
                     re.sub("enum", f"<{','.join(manifest['enum'])}>", manifest['type']))
             else:
-                self.__type = NodeType.parse(manifest["type"])
-
-        self.__require = manifest.get("require", self.__require)
-        self.__scope = Scope(manifest.get("scope", self.__scope))
-        self.__lock = manifest.get("lock", self.__lock)
-        self.__switch = manifest.get("switch", self.__switch)
-        self.__shorthelp = manifest.get("shorthelp", self.__shorthelp)
-        self.__example = manifest.get("example", self.__example)
-        self.__help = manifest.get("help", self.__help)
-        self.__notes = manifest.get("notes", self.__notes)
-        self.__pernode = PerNode(manifest.get("pernode", self.__pernode))
+                sctype = NodeType.parse(manifest["type"])
+
+        definition = self.__definition
+        self.__definition = _ParameterDefinition.get(
+            type=sctype,
+            require=manifest.get("require", definition.require),
+            scope=Scope(manifest.get("scope", definition.scope)),
+            lock=manifest.get("lock", definition.lock),
+            switch=manifest.get("switch", definition.switch),
+            shorthelp=manifest.get("shorthelp", definition.shorthelp),
+            example=manifest.get("example", definition.example),
+            help=manifest.get("help", definition.help),
+            notes=manifest.get("notes", definition.notes),
+            pernode=PerNode(manifest.get("pernode", definition.pernode)),
+            unit=manifest.get("unit", definition.unit),
+            hashalgo=manifest.get("hashalgo", definition.hashalgo),
+            copy=manifest.get("copy", definition.copy))
         self.__node = {}
 
-        self.__unit = manifest.get("unit", self.__unit)
-        self.__hashalgo = manifest.get("hashalgo", self.__hashalgo)
-        self.__copy = manifest.get("copy", self.__copy)
-
-        requires_set = NodeType.contains(self.__type, tuple) or NodeType.contains(self.__type, set)
+        requires_set = NodeType.contains(sctype, tuple) or NodeType.contains(sctype, set)
 
         try:
             defvalue = manifest["node"]["default"]["default"]
@@ -544,9 +616,12 @@ class Parameter:
         except KeyError:
             defvalue = None
 
-        self.__setdefvalue(None)
-        if defvalue:
-            self.__defvalue._from_dict(defvalue, keypath, version)
+        # Without a default value in the manifest, such as in compact manifests,
+        # the default value of this parameter is kept if the type is unchanged
+        if defvalue or sctype != definition.type:
+            self.__setdefvalue(None)
+            if defvalue:
+                self.__defvalue._from_dict(defvalue, keypath, version)
 
         for step, indexdata in manifest["node"].items():
             self.__node[step] = {}
@@ -572,7 +647,7 @@ class Parameter:
                 on a per-node basis.
         """
 
-        if self.__pernode == PerNode.REQUIRED and (step is None or index is None):
+        if self.__definition.pernode == PerNode.REQUIRED and (step is None or index is None):
             return None
 
         if isinstance(index, int):
@@ -581,7 +656,7 @@ class Parameter:
         try:
             return self.__node[step][index].gettcl()
         except KeyError:
-            if self.__pernode == PerNode.REQUIRED:
+            if self.__definition.pernode == PerNode.REQUIRED:
                 return self.__defvalue.gettcl()
 
         try:
@@ -604,6 +679,10 @@ class Parameter:
         list in place of a global value if a global value is not set.
         """
 
+        if not return_values:
+            # Node values are returned to the caller and may be modified
+            self.__unshare()
+
         vals = []
         has_global = False
         for step in self.__node:
@@ -617,7 +696,7 @@ class Parameter:
                 else:
                     vals.append((self.__node[step][index], step_arg, index_arg))
 
-        if self.__pernode != PerNode.REQUIRED and not has_global and return_defvalue:
+        if self.__definition.pernode != PerNode.REQUIRED and not has_global and return_defvalue:
             if return_values:
                 vals.append((self.__defvalue.get(), None, None))
             else:
@@ -635,13 +714,41 @@ class Parameter:
 
         return copy.deepcopy(self)
 
+    def __deepcopy__(self, memo):
+        """
+        Returns a copy of this parameter which shares the node values with
+        this parameter, until either parameter modifies them.
+        """
+
+        param = object.__new__(type(self))
+        param.__definition = self.__definition
+        param.__defvalue = self.__defvalue
+        param.__node = self.__node
+        self.__shared = True
+        param.__shared = True
+        memo[id(self)] = param
+        return param
+
+    def __unshare(self):
+        """
+        Copies the node values if they may be shared with another parameter,
+        this must be called before modifying them.
+        """
+
+        if not self.__shared:
+            return
+
+        self.__node = {step: {index: value.copy() for index, value in indexdata.items()}
+                       for step, indexdata in self.__node.items()}
+        self.__shared = False
+
     # Utility functions
     def is_list(self):
         """
         Returns true is this parameter is a list type
         """
 
-        return isinstance(self.__type, (list, set))
+        return isinstance(self.__definition.type, (list, set))
 
     def is_empty(self):
         '''
@@ -689,7 +796,7 @@ class Parameter:
         try:
             return self.__node[step][index].has_value
         except KeyError:
-            if self.__pernode == PerNode.REQUIRED:
+            if self.__definition.pernode == PerNode.REQUIRED:
                 return self.__defvalue.has_value
 
         try:
@@ -723,7 +830,7 @@ class Parameter:
             dest (str): key for argument parsing to lookup values in.
             switches (list of str): list of switches added.
         '''
-        if not self.__switch:
+        if not self.__definition.switch:
             # no switches available to this parameter
             return None, None
 
@@ -734,7 +841,7 @@ class Parameter:
 
         switches = []
         metavar = None
-        for switch in self.__switch:
+        for switch in self.__definition.switch:
             switchmatch = re.match(r'(-[\w_]+)\s+(\'([\w]+\s)*<.*>\'|<.*>)', switch)
             gccmatch = re.match(r'(-[\w_]+)(<.*>)', switch)
             plusmatch = re.match(r'(\+[\w_\+]+)(<.*>)', switch)
@@ -762,16 +869,16 @@ class Parameter:
         # argparse 'dest' must be a string, so join keypath with commas
         dest = '_'.join(keypath)
 
-        if self.__type == "bool":
+        if self.__definition.type == "bool":
             # Boolean type arguments
-            if self.__pernode.is_never():
+            if self.__definition.pernode.is_never():
                 argparser.add_argument(
                     *switches,
                     nargs='?',
                     metavar=metavar,
                     dest=dest,
                     const='true',
-                    help=self.__shorthelp,
+                    help=self.__definition.shorthelp,
                     default=argparse.SUPPRESS)
             else:
                 argparser.add_argument(
@@ -781,16 +888,16 @@ class Parameter:
                     dest=dest,
                     action='append',
                     const='true',
-                    help=self.__shorthelp,
+                    help=self.__definition.shorthelp,
                     default=argparse.SUPPRESS)
-        elif isinstance(self.__type, list) or self.__pernode != PerNode.NEVER:
+        elif isinstance(self.__definition.type, list) or self.__definition.pernode != PerNode.NEVER:
             # list type arguments
             argparser.add_argument(
                 *switches,
                 metavar=metavar,
                 dest=dest,
                 action='append',
-                help=self.__shorthelp,
+                help=self.__definition.shorthelp,
                 default=argparse.SUPPRESS)
         else:
             # all the rest
@@ -798,7 +905,7 @@ class Parameter:
                 *switches,
                 metavar=metavar,
                 dest=dest,
-                help=self.__shorthelp,
+                help=self.__definition.shorthelp,
                 default=argparse.SUPPRESS)
 
         return dest, switches
@@ -812,11 +919,12 @@ class Parameter:
             keypath (list of str): leypath to this parameter
         """
         num_free_keys = keypath.count('default')
+        switches = "/".join(self.__definition.switch)
 
         if num_free_keys > 0:
             valueitem = shlex.split(value)
             if len(valueitem) != num_free_keys + 1:
-                raise ValueError(f'Invalid value "{value}" for switch {"/".join(self.__switch)}')
+                raise ValueError(f'Invalid value "{value}" for switch {switches}')
 
             free_keys = valueitem[0:num_free_keys]
             remainder = valueitem[-1]
@@ -825,19 +933,19 @@ class Parameter:
             remainder = value
 
         step, index = None, None
-        if self.__pernode == PerNode.REQUIRED:
+        if self.__definition.pernode == PerNode.REQUIRED:
             try:
                 step, index, val = shlex.split(remainder)
             except ValueError:
-                raise ValueError(f'Invalid value "{value}" for switch {"/".join(self.__switch)}: '
+                raise ValueError(f'Invalid value "{value}" for switch {switches}: '
                                  'Requires step and index before final value')
-        elif self.__pernode == PerNode.OPTIONAL:
+        elif self.__definition.pernode == PerNode.OPTIONAL:
             # Split on spaces, preserving items that are grouped in quotes
             items = shlex.split(remainder)
             if len(items) > 3:
-                raise ValueError(f'Invalid value "{value}" for switch {"/".join(self.__switch)}: '
+                raise ValueError(f'Invalid value "{value}" for switch {switches}: '
                                  'Too many arguments')
-            if self.__type == 'bool':
+            if self.__definition.type == 'bool':
                 if len(items) == 3:
                     step, index, val = items
                 elif len(items) == 2:
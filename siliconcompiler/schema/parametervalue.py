@@ -1,5 +1,7 @@
+import contextlib
 import copy
 import hashlib
+import mmap
 import os
 import pathlib
 
@@ -23,6 +25,8 @@ class NodeListValue:
         base (:class:`NodeValue`): base type for this list.
     '''
 
+    __slots__ = ("__base", "__values")
+
     def __init__(self, base):
         self.__base = base
         self.__values = []
@@ -209,6 +213,8 @@ class NodeSetValue:
         base (:class:`NodeValue`): base type for this set.
     '''
 
+    __slots__ = ("__base", "__values")
+
     def __init__(self, base):
         self.__base = base
         self.__values = []
@@ -408,6 +414,8 @@ class NodeValue:
         value (any): default value for this parameter
     '''
 
+    __slots__ = ("__type", "__value", "__signature")
+
     def __init__(self, sctype, value=None):
         self._set_type(sctype)
         self.__value = value
@@ -618,6 +626,14 @@ class PathNodeValue(NodeValue):
         value (any): default value for this parameter
     '''
 
+    __slots__ = ("__filehash", "__package")
+
+    # Active :class:`FileHashCache` used when hashing files and directories
+    __hash_cache = None
+
+    # Size of the blocks passed to the hashing function
+    __hash_block_size = 8 * 1024 * 1024
+
     def __init__(self, type, value=None, package=None):
         super().__init__(type, value=value)
         self.__filehash = None
@@ -769,6 +785,27 @@ class PathNodeValue(NodeValue):
         """
         raise NotImplementedError
 
+    @staticmethod
+    @contextlib.contextmanager
+    def use_hash_cache(cache):
+        """
+        Use this context to look up and record file and directory hashes in a cache.
+
+        Args:
+            cache (:class:`FileHashCache`): cache to use, if None caching is disabled.
+
+        Example:
+            >>> with PathNodeValue.use_hash_cache(FileHashCache("hashes.db")):
+            ...     schema.hash_files("input", "rtl", "verilog")
+            Computes the hashes and stores them in hashes.db
+        """
+        prev_cache = PathNodeValue.__hash_cache
+        PathNodeValue.__hash_cache = cache
+        try:
+            yield
+        finally:
+            PathNodeValue.__hash_cache = prev_cache
+
     @staticmethod
     def hash_directory(dirname, hashobj=None, hashfunction=None):
         """
@@ -783,6 +820,8 @@ class PathNodeValue(NodeValue):
         if dirname is None:
             return None
 
+        cache = None
+        cache_key = None
         if not hashobj:
             hashfunc = getattr(hashlib, hashfunction, None)
             if not hashfunc:
@@ -790,19 +829,51 @@ class PathNodeValue(NodeValue):
                                    f"hash function: {hashfunction}")
             hashobj = hashfunc()
 
+            cache = PathNodeValue.__hash_cache
+            if cache is not None:
+                cache_key = cache.directory_key(dirname, hashfunction)
+                dirhash = cache.get(cache_key)
+                if dirhash:
+                    return dirhash
+
         all_files = []
         for root, _, files in os.walk(dirname):
             all_files.extend([os.path.join(root, f) for f in files])
         dirhash = None
-        hashobj = hashfunc()
         for file in sorted(all_files):
             # Cast everything to a windows path and convert to posix.
             # https://stackoverflow.com/questions/73682260
             posix_path = pathlib.PureWindowsPath(os.path.relpath(file, dirname)).as_posix()
             hashobj.update(posix_path.encode("utf-8"))
-            dirhash = PathNodeValue.hash_file(file, hashobj=hashobj)
+            dirhash = PathNodeValue.__hash_file_contents(file, hashobj)
+
+        if cache is not None:
+            cache.put(cache_key, dirhash)
         return dirhash
 
+    @staticmethod
+    def __hash_file_contents(filename, hashobj):
+        """
+        Feeds the contents of a file into the hashing object.
+
+        Files are memory mapped and hashed in large blocks, which allows the
+        hashing functions to release the GIL while hashing.
+        """
+        block_size = PathNodeValue.__hash_block_size
+        with open(filename, "rb") as f:
+            try:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # Empty or special files cannot be mapped
+                for byte_block in iter(lambda: f.read(block_size), b""):
+                    hashobj.update(byte_block)
+                return hashobj.hexdigest()
+
+            with data, memoryview(data) as view:
+                for offset in range(0, len(view), block_size):
+                    hashobj.update(view[offset:offset + block_size])
+        return hashobj.hexdigest()
+
     @staticmethod
     def hash_file(filename, hashobj=None, hashfunction=None):
         """
@@ -817,6 +888,8 @@ class PathNodeValue(NodeValue):
         if filename is None:
             return None
 
+        cache = None
+        cache_key = None
         if not hashobj:
             hashfunc = getattr(hashlib, hashfunction, None)
             if not hashfunc:
@@ -824,10 +897,18 @@ class PathNodeValue(NodeValue):
                                    f"hash function: {hashfunction}")
             hashobj = hashfunc()
 
-        with open(filename, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                hashobj.update(byte_block)
-        return hashobj.hexdigest()
+            cache = PathNodeValue.__hash_cache
+            if cache is not None:
+                cache_key = cache.file_key(filename, hashfunction)
+                filehash = cache.get(cache_key)
+                if filehash:
+                    return filehash
+
+        filehash = PathNodeValue.__hash_file_contents(filename, hashobj)
+
+        if cache is not None:
+            cache.put(cache_key, filehash)
+        return filehash
 
     @property
     def fields(self):
@@ -846,6 +927,8 @@ class DirectoryNodeValue(PathNodeValue):
         value (any): default value for this parameter
     '''
 
+    __slots__ = ()
+
     def __init__(self, value=None, package=None):
         super().__init__("dir", value=value, package=package)
 
@@ -874,10 +957,12 @@ class FileNodeValue(PathNodeValue):
         value (any): default value for this parameter
     '''
 
+    __slots__ = ("__date", "__author")
+
     def __init__(self, value=None, package=None):
         super().__init__("file", value=value, package=package)
         self.__date = None
-        self.__author = []
+        self.__author = ()
 
     def getdict(self):
         return {
@@ -896,7 +981,7 @@ class FileNodeValue(PathNodeValue):
         if field == 'date':
             return self.__date
         if field == 'author':
-            return self.__author.copy()
+            return list(self.__author)
         return super().get(field=field)
 
     def set(self, value, field='value'):
@@ -904,7 +989,7 @@ class FileNodeValue(PathNodeValue):
             self.__date = NodeType.normalize(value, "str")
             return self
         if field == 'author':
-            self.__author = NodeType.normalize(value, ["str"])
+            self.__author = tuple(NodeType.normalize(value, ["str"]))
             return self
         return super().set(value, field=field)
 
@@ -921,7 +1006,7 @@ class FileNodeValue(PathNodeValue):
         """
 
         if field == 'author':
-            self.__author.extend(NodeType.normalize(value, ["str"]))
+            self.__author += tuple(NodeType.normalize(value, ["str"]))
             return self
         return super().add(value, field=field)
 
@@ -4,7 +4,7 @@
 # SC dependencies outside of its directory, since it may be used by tool drivers
 # that have isolated Python environments.
 
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
 
 from .parameter import Parameter
 from .baseschema import BaseSchema
@@ -35,6 +35,8 @@ class SafeSchema(BaseSchema):
         if not isinstance(manifest, dict):
             return
 
+        BaseSchema._invalidate_search_cache()
+
         if "__meta__" in manifest:
             del manifest["__meta__"]
 
@@ -50,9 +52,10 @@ class SafeSchema(BaseSchema):
                 self._BaseSchema__manifest[key] = obj
 
     @classmethod
-    def from_manifest(cls, filepath: str = None, cfg: Dict = None) -> "SafeSchema":
+    def from_manifest(cls, filepath: str = None, cfg: Dict = None,
+                      keypaths: List[Tuple[str]] = None) -> "SafeSchema":
         if filepath:
-            cfg = BaseSchema._read_manifest(filepath)
+            cfg = BaseSchema._read_manifest(filepath, keypaths=keypaths)
 
         if cfg and "__meta__" in cfg:
             del cfg["__meta__"]
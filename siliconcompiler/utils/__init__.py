@@ -249,27 +249,21 @@ def safecompare(value, op, goal):
 
 
 ###########################################################################
-def grep(chip, args, line):
+def compile_grep(chip, args):
     """
-    Emulates the Unix grep command on a string.
+    Parses the arguments of a grep command.
 
-    Emulates the behavior of the Unix grep command that is etched into
-    our muscle memory. Partially implemented, not all features supported.
-    The function returns None if no match is found.
+    The arguments are parsed once, so the result can be used to match many
+    lines with :func:`grep` semantics.
 
     Args:
-        arg (string): Command line arguments for grep command
-        line (string): Line to process
+        args (string): Command line arguments for grep command
 
     Returns:
-        Result of grep command (string).
-
+        Tuple of the compiled regular expression and a flag indicating if the
+        sense of matching is inverted.
     """
 
-    # Quick return if input is None
-    if line is None:
-        return None
-
     # Partial list of supported grep options
     options = {
         '-v': False,  # Invert the sense of matching
@@ -303,8 +297,32 @@ def grep(chip, args, line):
 
     # REGEX
     # TODO: add all the other optinos
-    match = re.search(rf"({pattern})", line)
-    if bool(match) == bool(options["-v"]):
+    return re.compile(rf"({pattern})"), options["-v"]
+
+
+def grep(chip, args, line):
+    """
+    Emulates the Unix grep command on a string.
+
+    Emulates the behavior of the Unix grep command that is etched into
+    our muscle memory. Partially implemented, not all features supported.
+    The function returns None if no match is found.
+
+    Args:
+        arg (string): Command line arguments for grep command
+        line (string): Line to process
+
+    Returns:
+        Result of grep command (string).
+
+    """
+
+    # Quick return if input is None
+    if line is None:
+        return None
+
+    regex, invert = compile_grep(chip, args)
+    if bool(regex.search(line)) == invert:
         return None
     else:
         return line
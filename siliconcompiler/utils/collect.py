@@ -0,0 +1,293 @@
+import hashlib
+import os
+import shutil
+import sys
+import uuid
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
+
+try:
+    import fcntl
+    _has_fcntl = True
+except ModuleNotFoundError:
+    _has_fcntl = False
+
+
+# ioctl request to clone a file on linux filesystems which support reflinks
+_FICLONE = 0x40049409
+
+
+class FileCollector:
+    """
+    Copies files and directories into a collection directory.
+
+    Sources are registered with :meth:`add_file` and :meth:`add_directory`
+    and are copied by :meth:`collect` using a pool of threads. Files with
+    identical content are only copied once and the duplicates are hardlinked
+    to the first copy. When a source is on the same filesystem as the
+    collection directory, it is cloned or hardlinked instead of being copied.
+
+    Collecting into an existing directory only replaces the files which have
+    changed since they were collected, and removes the files which are no
+    longer part of the collection.
+
+    Args:
+        directory (path): path to the collection directory.
+        link (bool): if True, allow cloning or hardlinking the source files,
+            otherwise the files are always copied.
+        max_workers (int): maximum number of files to copy at once.
+    """
+
+    def __init__(self, directory: str, link: bool = True, max_workers: int = 8):
+        self.__directory = os.path.abspath(directory)
+        self.__link = link
+        self.__max_workers = max(1, max_workers)
+
+        # relative destination path to source path
+        self.__files: Dict[str, str] = {}
+        self.__dirs = set()
+
+    @property
+    def directory(self) -> str:
+        '''
+        Returns the path to the collection directory
+        '''
+        return self.__directory
+
+    def has(self, name: str) -> bool:
+        '''
+        Returns true if a file or directory is part of the collection.
+
+        Args:
+            name (path): path relative to the collection directory.
+        '''
+        name = os.path.normpath(name)
+        return name in self.__files or name in self.__dirs
+
+    def add_file(self, path: str, name: str) -> bool:
+        '''
+        Adds a file to the collection.
+
+        Args:
+            path (path): path to the source file.
+            name (str): name of the file in the collection directory.
+
+        Returns:
+            False if the name is already part of the collection, otherwise True.
+        '''
+        name = os.path.normpath(name)
+        if self.has(name):
+            return False
+
+        self.__files[name] = os.path.abspath(path)
+        return True
+
+    def add_directory(self, path: str, name: str,
+                      ignore: Callable[[str, List[str]], List[str]] = None) -> bool:
+        '''
+        Adds a directory and its content to the collection.
+
+        Args:
+            path (path): path to the source directory.
+            name (str): name of the directory in the collection directory.
+            ignore (function): function used to filter the directory content,
+                as in :func:`shutil.copytree`.
+
+        Returns:
+            False if the name is already part of the collection, otherwise True.
+        '''
+        name = os.path.normpath(name)
+        if self.has(name):
+            return False
+
+        path = os.path.abspath(path)
+        for root, dirnames, filenames in os.walk(path, followlinks=True):
+            reldir = os.path.normpath(os.path.join(name, os.path.relpath(root, path)))
+            self.__dirs.add(reldir)
+
+            if ignore:
+                ignored = set(ignore(root, sorted(dirnames + filenames)))
+            else:
+                ignored = set()
+
+            dirnames[:] = sorted(d for d in dirnames if d not in ignored)
+            for filename in sorted(filenames):
+                if filename in ignored:
+                    continue
+                self.__files[os.path.join(reldir, filename)] = os.path.join(root, filename)
+
+        return True
+
+    def collect(self) -> None:
+        '''
+        Copies the files into the collection directory.
+        '''
+        os.makedirs(self.__directory, exist_ok=True)
+
+        self.__remove_stale()
+
+        for reldir in sorted(self.__dirs):
+            os.makedirs(os.path.join(self.__directory, reldir), exist_ok=True)
+
+        changed = {}
+        for name, path in self.__files.items():
+            src_stat = os.stat(path)
+            if not self.__is_current(os.path.join(self.__directory, name), src_stat):
+                changed[name] = (path, src_stat)
+
+        if not changed:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self.__max_workers, len(changed)),
+                                thread_name_prefix="sc_collect") as pool:
+            groups = self.__group_by_content(pool, changed)
+
+            # Copy one file per group before linking the duplicates to it
+            primaries = {}
+            for names in groups:
+                primary = names[0]
+                path, src_stat = changed[primary]
+                primaries[primary] = pool.submit(self.__transfer, path, src_stat,
+                                                 os.path.join(self.__directory, primary))
+            for future in primaries.values():
+                future.result()
+
+            duplicates = []
+            for names in groups:
+                source = os.path.join(self.__directory, names[0])
+                for name in names[1:]:
+                    duplicates.append(pool.submit(self.__duplicate, source,
+                                                  os.path.join(self.__directory, name)))
+            for future in duplicates:
+                future.result()
+
+    def __remove_stale(self) -> None:
+        '''
+        Removes the entries in the collection directory which are not part of
+        the collection.
+        '''
+        for root, dirnames, filenames in os.walk(self.__directory, topdown=False):
+            for filename in filenames:
+                path = os.path.join(root, filename)
+                if os.path.relpath(path, self.__directory) not in self.__files:
+                    os.remove(path)
+            for dirname in dirnames:
+                path = os.path.join(root, dirname)
+                if os.path.islink(path):
+                    os.remove(path)
+                elif os.path.relpath(path, self.__directory) not in self.__dirs:
+                    shutil.rmtree(path)
+
+    @staticmethod
+    def __is_current(path: str, src_stat: os.stat_result) -> bool:
+        '''
+        Returns true if the collected file matches the source file.
+        '''
+        try:
+            dst_stat = os.lstat(path)
+        except FileNotFoundError:
+            return False
+
+        if (dst_stat.st_dev, dst_stat.st_ino) == (src_stat.st_dev, src_stat.st_ino):
+            return True
+
+        return dst_stat.st_size == src_stat.st_size and \
+            dst_stat.st_mtime_ns == src_stat.st_mtime_ns
+
+    @staticmethod
+    def __hash_file(path: str) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def __group_by_content(self, pool: ThreadPoolExecutor, files: Dict) -> List[List[str]]:
+        '''
+        Groups the files with identical content.
+
+        Only files of the same size, which are not the same file, are hashed.
+        '''
+        by_size = {}
+        for name in sorted(files):
+            _, src_stat = files[name]
+            by_size.setdefault(src_stat.st_size, []).append(name)
+
+        inodes = {}
+        to_hash = {}
+        for names in by_size.values():
+            for name in names:
+                path, src_stat = files[name]
+                inode = (src_stat.st_dev, src_stat.st_ino)
+                inodes[name] = inode
+                if len(names) > 1 and inode not in to_hash:
+                    to_hash[inode] = pool.submit(self.__hash_file, path)
+
+        groups = {}
+        for name in sorted(files):
+            inode = inodes[name]
+            if inode in to_hash:
+                key = (files[name][1].st_size, to_hash[inode].result())
+            else:
+                key = inode
+            groups.setdefault(key, []).append(name)
+
+        return list(groups.values())
+
+    @staticmethod
+    def __tempname(path: str) -> str:
+        return os.path.join(os.path.dirname(path),
+                            f".{os.path.basename(path)}.{uuid.uuid4().hex}.tmp")
+
+    @staticmethod
+    def __replace(path: str, create: Callable[[str], None]) -> None:
+        '''
+        Creates a file through a temporary file, so an existing file, which may
+        be linked to a source file, is never written to.
+        '''
+        tmp_path = FileCollector.__tempname(path)
+        try:
+            create(tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.lexists(tmp_path):
+                os.remove(tmp_path)
+
+    @staticmethod
+    def __reflink(src: str, dst: str) -> None:
+        if not _has_fcntl or not sys.platform.startswith("linux"):
+            raise OSError("reflinks are not supported")
+
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        shutil.copystat(src, dst)
+
+    def __transfer(self, path: str, src_stat: os.stat_result, dst: str) -> None:
+        '''
+        Clones, hardlinks or copies a source file into the collection.
+        '''
+        def create(tmp_path):
+            if self.__link and src_stat.st_dev == os.stat(os.path.dirname(dst)).st_dev:
+                for method in (self.__reflink, os.link):
+                    try:
+                        method(path, tmp_path)
+                        return
+                    except OSError:
+                        if os.path.lexists(tmp_path):
+                            os.remove(tmp_path)
+            shutil.copy2(path, tmp_path)
+
+        self.__replace(dst, create)
+
+    def __duplicate(self, source: str, dst: str) -> None:
+        '''
+        Links a collected file to a file with the same content.
+        '''
+        def create(tmp_path):
+            try:
+                os.link(source, tmp_path)
+            except OSError:
+                shutil.copy2(source, tmp_path)
+
+        self.__replace(dst, create)
@@ -0,0 +1,83 @@
+import re
+
+from typing import Dict, List, Tuple
+
+from siliconcompiler.utils import compile_grep
+
+
+class LogScanner:
+    """
+    Scans a log file for multiple sets of grep-style patterns in a single pass.
+
+    Each set of patterns is identified by a suffix (such as ``errors`` or
+    ``warnings``) and a line matches the set when it passes every pattern in
+    the set, as if the patterns were chained with :func:`utils.grep`.
+    The patterns are compiled once, and lines which cannot match any of the
+    sets are rejected with a single combined expression.
+
+    Args:
+        chip (object): object used to report invalid grep switches.
+        checks (dict of str to list of str): grep arguments for each suffix.
+    """
+
+    def __init__(self, chip, checks: Dict[str, List[str]]):
+        self.__checks = {}
+        for suffix, args in checks.items():
+            self.__checks[suffix] = [compile_grep(chip, arg) for arg in args]
+
+        self.__prefilter = self.__build_prefilter()
+
+    def __build_prefilter(self):
+        """
+        Builds an expression which matches every line that any of the checks
+        could match, or None if there is no such expression.
+        """
+        required = []
+        for filters in self.__checks.values():
+            patterns = [regex.pattern for regex, invert in filters if not invert]
+            if not patterns:
+                # Inverted only checks match most lines
+                return None
+            required.append(patterns[0])
+
+        if not required:
+            return None
+
+        for pattern in required:
+            if re.search(r'\\[1-9]|\(\?P=', pattern):
+                # Back references are renumbered when combining patterns
+                return None
+
+        try:
+            return re.compile("|".join(f"(?:{pattern})" for pattern in required))
+        except re.error:
+            return None
+
+    def scan(self, fileobj) -> Tuple[int, Dict[str, List[Tuple[int, str]]]]:
+        """
+        Scans a log file.
+
+        Args:
+            fileobj (file): text file object to read the log from.
+
+        Returns:
+            tuple of the number of lines in the log and a dictionary of the
+            matching line numbers and lines for each suffix.
+        """
+        matches = {suffix: [] for suffix in self.__checks}
+        checks = [(matches[suffix], filters) for suffix, filters in self.__checks.items()]
+        prefilter = self.__prefilter.search if self.__prefilter else None
+
+        num = 0
+        for num, line in enumerate(fileobj, start=1):
+            if prefilter and not prefilter(line):
+                continue
+
+            for found, filters in checks:
+                for regex, invert in filters:
+                    if bool(regex.search(line)) == invert:
+                        break
+                else:
+                    found.append((num, line))
+
+        return num, matches
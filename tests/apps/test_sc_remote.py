@@ -67,7 +67,7 @@ def mock_results(chip, node):
 
 
 ###########################
-def mock_post(url, data={}, files={}, stream=True, timeout=0):
+def mock_post(url, data={}, files={}, headers={}, stream=True, timeout=0):
     '''Mocked 'post' method which imitates a successful quick job run.
     '''
 
@@ -1,7 +1,11 @@
+import http.server
 import logging
 import pytest
 import re
 import responses
+import tarfile
+import threading
+import tracemalloc
 
 import os.path
 
@@ -60,3 +64,129 @@ def test_dependency_path_download_http_failed():
 
     with pytest.raises(FileNotFoundError, match="Failed to download sc-data data source."):
         resolver.resolve()
+
+
+class _RangeHandler(http.server.BaseHTTPRequestHandler):
+    archive = None
+    drop_after = None
+    requests = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        size = os.path.getsize(self.archive)
+
+        range_header = self.headers.get("Range")
+        type(self).requests.append(range_header)
+
+        start = 0
+        if range_header:
+            start = int(range_header[len("bytes="):-1])
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{size - 1}/{size}")
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(size - start))
+        self.end_headers()
+
+        remaining = size - start
+        if type(self).drop_after is not None:
+            remaining = type(self).drop_after
+            type(self).drop_after = None
+
+        with open(self.archive, "rb") as f:
+            f.seek(start)
+            while remaining > 0:
+                block = f.read(min(remaining, 65536))
+                self.wfile.write(block)
+                remaining -= len(block)
+
+
+@pytest.fixture
+def http_server():
+    _RangeHandler.drop_after = None
+    _RangeHandler.requests = []
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _RangeHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _make_archive(path, size):
+    os.makedirs("archive", exist_ok=True)
+    with open("archive/data.bin", "wb") as f:
+        f.write(os.urandom(size))
+    with open("archive/pyproject.toml", "w") as f:
+        f.write("test")
+    with tarfile.open(path, "w:gz") as tar:
+        tar.add("archive/data.bin", arcname="data.bin")
+        tar.add("archive/pyproject.toml", arcname="pyproject.toml")
+
+
+def test_dependency_path_download_http_streamed(http_server, tmp_path, caplog):
+    _make_archive("data.tar.gz", 16 * 1024 * 1024)
+    _RangeHandler.archive = os.path.abspath("data.tar.gz")
+
+    proj = Project("testproj")
+    proj.set("option", "cachedir", tmp_path)
+    setattr(proj, "_Project__logger", logging.getLogger())
+    proj.logger.setLevel(logging.INFO)
+
+    url = f"http://127.0.0.1:{http_server.server_port}/data.tar.gz"
+    resolver = HTTPResolver("sc-data", proj, url, "v1")
+
+    tracemalloc.start()
+    try:
+        path = resolver.resolve()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert peak < 8 * 1024 * 1024
+    assert os.path.getsize(os.path.join(path, "data.bin")) == 16 * 1024 * 1024
+    assert os.path.isfile(os.path.join(path, "pyproject.toml"))
+    assert not os.path.exists(resolver.download_path)
+    assert "Downloaded 100% of sc-data data" in caplog.text
+
+
+def test_dependency_path_download_http_resume(http_server, tmp_path, caplog):
+    _make_archive("data.tar.gz", 1024 * 1024)
+    _RangeHandler.archive = os.path.abspath("data.tar.gz")
+    _RangeHandler.drop_after = 300000
+
+    proj = Project("testproj")
+    proj.set("option", "cachedir", tmp_path)
+    setattr(proj, "_Project__logger", logging.getLogger())
+    proj.logger.setLevel(logging.INFO)
+
+    url = f"http://127.0.0.1:{http_server.server_port}/data.tar.gz"
+    resolver = HTTPResolver("sc-data", proj, url, "v1")
+
+    path = resolver.resolve()
+    with open(os.path.join(path, "data.bin"), "rb") as f:
+        with open("archive/data.bin", "rb") as f_ref:
+            assert f.read() == f_ref.read()
+
+    # Only complete chunks are written before the connection drops
+    assert _RangeHandler.requests == [None, "bytes=262144-"]
+    assert "Download of sc-data data interrupted" in caplog.text
+
+
+def test_dependency_path_download_http_invalid_archive(http_server, tmp_path):
+    with open("data.tar.gz", "w") as f:
+        f.write("not an archive")
+    _RangeHandler.archive = os.path.abspath("data.tar.gz")
+
+    url = f"http://127.0.0.1:{http_server.server_port}/data.tar.gz"
+    proj = Project("testproj")
+    proj.set("option", "cachedir", tmp_path)
+    resolver = HTTPResolver("sc-data", proj, url, "v1")
+
+    with pytest.raises(TypeError, match="File is not a valid tar.gz or zip archive."):
+        resolver.resolve()
+    assert not os.path.exists(resolver.cache_path)
+    assert not os.path.exists(resolver.download_path)
@@ -1,15 +1,17 @@
 import contextlib
 import logging
 import pytest
+import threading
+import time
 
 import os.path
 
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import patch, PropertyMock
 
 import siliconcompiler
 
-from siliconcompiler.package import Resolver, RemoteResolver
+from siliconcompiler.package import Resolver, RemoteResolver, ResolverPool
 from siliconcompiler.package import FileResolver, PythonPathResolver, KeyPathResolver
 from siliconcompiler.package import InterProcessLock as dut_ipl
 
@@ -718,3 +720,118 @@ def test_reset_cache():
 
     Resolver.reset_cache(chip)
     assert Resolver.get_cache(chip) == {}
+
+
+def test_update_cache():
+    chip = Project("testproj")
+
+    Resolver.set_cache(chip, "test", "path")
+    Resolver.update_cache(chip, {"test0": "path0", "test1": "path1"})
+    assert Resolver.get_cache(chip) == {
+        "test": "path",
+        "test0": "path0",
+        "test1": "path1",
+    }
+
+
+class SlowResolver(RemoteResolver):
+    counter_lock = threading.Lock()
+    active = 0
+    max_active = 0
+
+    def check_cache(self):
+        return os.path.exists(self.cache_path)
+
+    def resolve_remote(self):
+        with SlowResolver.counter_lock:
+            SlowResolver.active += 1
+            SlowResolver.max_active = max(SlowResolver.max_active, SlowResolver.active)
+        time.sleep(0.2)
+        os.makedirs(self.cache_path)
+        with SlowResolver.counter_lock:
+            SlowResolver.active -= 1
+
+
+def test_resolver_pool():
+    SlowResolver.max_active = 0
+
+    chip = Project("testproj")
+    chip.set("option", "cachedir", ".")
+
+    pool = ResolverPool(chip, max_workers=4)
+    resolvers = [SlowResolver(f"data{n}", chip, f"https://data{n}", "ref") for n in range(4)]
+    for resolver in resolvers:
+        pool.add(resolver)
+
+    paths = pool.resolve()
+    assert SlowResolver.max_active > 1
+    assert paths == {resolver.cache_id: resolver.cache_path for resolver in resolvers}
+    assert Resolver.get_cache(chip) == paths
+
+    # Pool is empty after resolving
+    assert pool.resolve() == {}
+
+
+def test_resolver_pool_skip_cached():
+    chip = Project("testproj")
+    chip.set("option", "cachedir", ".")
+
+    resolver = SlowResolver("data", chip, "https://data", "ref")
+    Resolver.set_cache(chip, resolver.cache_id, "path")
+
+    pool = ResolverPool(chip)
+    pool.add(resolver)
+    with patch("siliconcompiler.package.RemoteResolver.resolve") as resolve:
+        assert pool.resolve() == {}
+        resolve.assert_not_called()
+
+
+def test_resolver_pool_duplicate():
+    chip = Project("testproj")
+    chip.set("option", "cachedir", ".")
+
+    pool = ResolverPool(chip)
+    pool.add(SlowResolver("data", chip, "https://data", "ref"))
+    pool.add(SlowResolver("data", chip, "https://data", "ref"))
+    with patch("siliconcompiler.package.RemoteResolver.resolve") as resolve:
+        resolve.return_value = "."
+        assert len(pool.resolve()) == 1
+        resolve.assert_called_once()
+
+
+def test_resolver_pool_error():
+    chip = Project("testproj")
+    chip.set("option", "cachedir", ".")
+
+    class FailedResolver(SlowResolver):
+        def resolve_remote(self):
+            raise FileNotFoundError("failed to fetch")
+
+    good = SlowResolver("good", chip, "https://good", "ref")
+    pool = ResolverPool(chip)
+    pool.add(FailedResolver("bad", chip, "https://bad", "ref"))
+    pool.add(good)
+
+    with pytest.raises(FileNotFoundError, match="failed to fetch"):
+        pool.resolve()
+    assert Resolver.get_cache(chip) == {good.cache_id: good.cache_path}
+
+
+def test_project_resolve_dataroots():
+    chip = Project("testproj")
+    chip.set("option", "cachedir", ".")
+
+    design = DesignSchema("test")
+    design.set_dataroot("remote", "https://remote/data.tar.gz", "v1")
+    design.set_dataroot("local", os.path.abspath("."))
+    chip.add_dep(design)
+
+    os.makedirs("remote-v1")
+    with patch("siliconcompiler.package.https.HTTPResolver.resolve_remote") as resolve_remote, \
+         patch("siliconcompiler.package.https.HTTPResolver.cache_path",
+               new_callable=PropertyMock) as cache_path:
+        cache_path.return_value = Path(os.path.abspath("remote-v1"))
+        chip._resolve_dataroots()
+        resolve_remote.assert_not_called()
+
+    assert list(Resolver.get_cache(chip).values()) == [Path(os.path.abspath("remote-v1"))]
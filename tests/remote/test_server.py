@@ -1,8 +1,16 @@
+import asyncio
+import json
 import pytest
+import requests
+import threading
+import time
 
 import os.path
 
+from collections import deque
+
 from siliconcompiler import NodeStatus
+from siliconcompiler.remote import JobStatus, Server
 
 
 ###########################
@@ -132,3 +140,148 @@ def test_server_slurm(gcd_remote_test):
 
     assert gcd_project.get("record", "status", step="stepone", index="0") == NodeStatus.SUCCESS
     assert gcd_project.get("record", "status", step="steptwo", index="0") == NodeStatus.SUCCESS
+
+
+def test_server_check_server_progress(scserver):
+    port = scserver()
+
+    resp = requests.post(f"http://localhost:{port}/check_server/", data=json.dumps({}))
+    assert resp.ok
+    assert resp.json()["progress_wait"] == 30
+    assert "gzip" in resp.json()["codecs"]
+
+
+def test_server_check_progress_wait_no_job(scserver):
+    port = scserver()
+
+    start = time.time()
+    resp = requests.post(f"http://localhost:{port}/check_progress/", data=json.dumps({
+        "job_hash": "0123456789abcdeffedcba9876543210",
+        "job_id": "job0",
+        "version": 0,
+        "wait": 20
+    }))
+    assert resp.ok
+    assert resp.json()["status"] == JobStatus.COMPLETED
+    assert time.time() - start < 10
+
+
+def test_server_wait_for_progress():
+    server = Server()
+    server.sc_jobs["job"] = {}
+
+    async def wait():
+        await server._Server__on_startup(None)
+
+        def notify():
+            time.sleep(0.5)
+            with server.sc_jobs_lock:
+                server._Server__notify_progress("job")
+
+        start = time.time()
+        thread = threading.Thread(target=notify)
+        thread.start()
+        await server._Server__wait_for_progress("job", 0, 20)
+        thread.join()
+        return time.time() - start
+
+    assert asyncio.run(wait()) < 10
+    assert server.sc_jobs_version["job"] == 1
+    assert server._Server__progress_waiters == {}
+
+
+def test_server_wait_for_progress_timeout():
+    server = Server()
+    server.sc_jobs["job"] = {}
+
+    async def wait():
+        await server._Server__on_startup(None)
+        start = time.time()
+        await server._Server__wait_for_progress("job", 0, 0.5)
+        return time.time() - start
+
+    assert asyncio.run(wait()) >= 0.5
+    assert server._Server__progress_waiters == {}
+
+
+def test_server_wait_for_progress_changed():
+    server = Server()
+    server.sc_jobs["job"] = {}
+    server.sc_jobs_version["job"] = 2
+
+    async def wait():
+        await server._Server__on_startup(None)
+        start = time.time()
+        await server._Server__wait_for_progress("job", 1, 20)
+        return time.time() - start
+
+    assert asyncio.run(wait()) < 10
+
+
+def _queue(server, username, job, queued_at):
+    server._Server__job_queue.setdefault(username, deque()).append((queued_at, job))
+
+
+def test_server_next_job_fair_share():
+    server = Server()
+
+    _queue(server, "a", "a0", 0)
+    _queue(server, "a", "a1", 1)
+    _queue(server, "a", "a2", 2)
+    _queue(server, "b", "b0", 3)
+
+    assert server._Server__next_job() == ("a", "a0")
+    assert server._Server__next_job() == ("b", "b0")
+    assert server._Server__next_job() == ("a", "a1")
+    assert server._Server__next_job() == ("a", "a2")
+    assert server._Server__next_job() is None
+
+    assert server._Server__job_running == {"a": 3, "b": 1}
+    assert server._Server__job_queue == {}
+
+
+def test_server_next_job_user_limit():
+    server = Server()
+    server.set('option', 'maxuserjobs', 1)
+
+    _queue(server, "a", "a0", 0)
+    _queue(server, "a", "a1", 1)
+    _queue(server, "b", "b0", 2)
+
+    assert server._Server__next_job() == ("a", "a0")
+    assert server._Server__next_job() == ("b", "b0")
+    assert server._Server__next_job() is None
+
+    server._Server__job_running["a"] = 0
+    assert server._Server__next_job() == ("a", "a1")
+
+
+def test_server_queue_status():
+    server = Server()
+    server.set('option', 'maxqueue', 2)
+
+    assert not server._Server__queue_full()
+    _queue(server, "a", "a0", time.time())
+    _queue(server, "b", "b0", time.time())
+    assert server._Server__queue_full()
+
+    server._Server__next_job()
+    status = server._Server__queue_status()
+    assert status["depth"] == 1
+    assert status["running"] == 1
+    assert status["max_jobs"] == 4
+    assert status["wait_time"] >= 0
+
+
+def test_server_check_server_queue(scserver):
+    port = scserver()
+
+    resp = requests.post(f"http://localhost:{port}/check_server/", data=json.dumps({}))
+    assert resp.ok
+    assert resp.json()["status"] == "ready"
+    assert resp.json()["queue"] == {
+        "depth": 0,
+        "running": 0,
+        "max_jobs": 4,
+        "wait_time": 0
+    }
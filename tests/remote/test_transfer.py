@@ -0,0 +1,81 @@
+import io
+import pytest
+
+import os.path
+
+from siliconcompiler.remote import transfer
+from siliconcompiler.remote.transfer import Codec
+
+
+def _make_dir():
+    os.makedirs('data/sub', exist_ok=True)
+    with open('data/file.txt', 'w') as f:
+        f.write('test')
+    with open('data/sub/large.bin', 'wb') as f:
+        f.write(os.urandom(3 * transfer.CHUNK_SIZE))
+
+
+def test_select_codec():
+    assert transfer.select_codec(None) == Codec.GZIP
+    assert transfer.select_codec([]) == Codec.GZIP
+    assert transfer.select_codec(['gzip']) == Codec.GZIP
+    assert transfer.select_codec(['unknown']) == Codec.GZIP
+    assert transfer.select_codec(transfer.available_codecs()) == transfer.available_codecs()[0]
+
+
+def test_invalid_codec():
+    with pytest.raises(ValueError, match="lz4 is not supported"):
+        with transfer.open_writer(io.BytesIO(), "lz4"):
+            pass
+    with pytest.raises(ValueError, match="lz4 is not supported"):
+        with transfer.open_reader(io.BytesIO(), "lz4"):
+            pass
+
+
+@pytest.mark.parametrize("codec", transfer.available_codecs())
+def test_stream_directory(codec):
+    _make_dir()
+
+    blocks = list(transfer.stream_directory('data', codec))
+    assert len(blocks) > 1
+    assert all(len(block) <= 2 * transfer.CHUNK_SIZE for block in blocks)
+
+    with transfer.open_reader(io.BytesIO(b''.join(blocks)), codec) as tar:
+        tar.extractall(path='extract')
+
+    assert os.path.isfile('extract/file.txt')
+    with open('extract/sub/large.bin', 'rb') as f, open('data/sub/large.bin', 'rb') as f_ref:
+        assert f.read() == f_ref.read()
+
+
+def test_stream_directory_stop_early():
+    _make_dir()
+
+    stream = transfer.stream_directory('data', Codec.GZIP)
+    next(stream)
+    stream.close()
+
+
+def test_stream_directory_missing():
+    with pytest.raises(FileNotFoundError):
+        list(transfer.stream_directory('data', Codec.GZIP))
+
+
+def test_multipart_stream():
+    body = transfer.MultipartStream({
+        'params': {'test': 1},
+        'import': lambda: iter([b'abc', b'def'])
+    })
+
+    boundary = body.content_type.split('boundary=')[1]
+    assert body.content_type.startswith('multipart/form-data; ')
+    assert b''.join(body) == (
+        f'--{boundary}\r\n'
+        'Content-Disposition: form-data; name="params"\r\n'
+        'Content-Type: application/json\r\n\r\n'
+        '{"test": 1}\r\n'
+        f'--{boundary}\r\n'
+        'Content-Disposition: form-data; name="import"; filename="import"\r\n'
+        'Content-Type: application/octet-stream\r\n\r\n'
+        'abcdef\r\n'
+        f'--{boundary}--\r\n').encode('utf-8')
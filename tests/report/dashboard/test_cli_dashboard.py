@@ -20,6 +20,7 @@ from siliconcompiler.report.dashboard.cli.board import (
     Layout,
 )
 from siliconcompiler import NodeStatus
+from siliconcompiler.report.dashboard import DashboardEvent, DashboardEventType
 from siliconcompiler.utils.multiprocessing import MPManager
 
 
@@ -1064,3 +1065,154 @@ def test_get_job_with_status(mock_project, fake_console):
     assert job.design == "test_design"
     assert job.complete is False
     assert len(job.nodes) == 18
+
+
+def test_get_search_distances_diamond():
+    search = {
+        ("a", "0"): [("b", "0"), ("c", "0")],
+        ("b", "0"): [("d", "0")],
+        ("c", "0"): [("e", "0")],
+        ("e", "0"): [("d", "0")],
+    }
+
+    dists = Board._get_search_distances(search)
+    assert dists[("a", "0")] == {
+        ("b", "0"): 1,
+        ("c", "0"): 1,
+        ("d", "0"): 2,
+        ("e", "0"): 2
+    }
+    assert dists[("c", "0")] == {
+        ("e", "0"): 1,
+        ("d", "0"): 2
+    }
+
+
+def test_get_node_distances_cached(dashboard):
+    board = dashboard._dashboard
+
+    nodes = [("a", "0"), ("b", "0"), ("c", "0")]
+    node_inputs = {
+        ("a", "0"): [],
+        ("b", "0"): [("a", "0")],
+        ("c", "0"): [("b", "0")]
+    }
+    node_outputs = {
+        ("a", "0"): {("b", "0")},
+        ("b", "0"): {("c", "0")}
+    }
+
+    dists = board._get_node_distances(nodes, node_inputs, node_outputs)
+    assert dists[("c", "0")] == {("b", "0"): 3, ("a", "0"): 5}
+    assert dists[("a", "0")] == {("b", "0"): 2, ("c", "0"): 4}
+
+    with patch.object(Board, "_get_search_distances") as search:
+        assert board._get_node_distances(nodes, node_inputs, node_outputs) is dists
+        search.assert_not_called()
+
+    # Changing the flowgraph invalidates the cache
+    node_inputs[("c", "0")] = [("a", "0")]
+    node_outputs = {
+        ("a", "0"): {("b", "0"), ("c", "0")}
+    }
+    dists = board._get_node_distances(nodes, node_inputs, node_outputs)
+    assert dists[("c", "0")] == {("a", "0"): 3}
+
+
+def test_get_node_distances_wide_diamonds(dashboard):
+    board = dashboard._dashboard
+
+    # Chain of 40 diamonds, which is exponential with a recursive walk
+    nodes = [("start", "0")]
+    node_inputs = {("start", "0"): []}
+    node_outputs = {}
+    prev = ("start", "0")
+    for n in range(40):
+        join = (f"join{n}", "0")
+        for branch in range(5):
+            node = (f"branch{n}", str(branch))
+            nodes.append(node)
+            node_inputs[node] = [prev]
+            node_outputs.setdefault(prev, set()).add(node)
+            node_outputs.setdefault(node, set()).add(join)
+        nodes.append(join)
+        node_inputs[join] = [(f"branch{n}", str(branch)) for branch in range(5)]
+        prev = join
+
+    dists = board._get_node_distances(nodes, node_inputs, node_outputs)
+    assert dists[prev][("start", "0")] == 2 * 80 + 1
+    assert dists[("start", "0")][prev] == 2 * 80
+
+
+def test_update_status(dashboard, mock_project):
+    board = dashboard._dashboard
+
+    board.update_manifest(mock_project)
+    with board._job_data_lock:
+        job = board._job_data["test_design/test_job"]
+    assert job.finished == 0
+
+    step, index = job.nodes[0]["step"], job.nodes[0]["index"]
+    with patch.object(Board, "_get_job") as get_job:
+        board.update_status(mock_project, [
+            DashboardEvent(DashboardEventType.NODE_STARTED, step, index,
+                           status=NodeStatus.RUNNING, time=10.0)
+        ])
+        with board._job_data_lock:
+            job = board._job_data["test_design/test_job"]
+        assert job.nodes[0]["status"] == NodeStatus.RUNNING
+        assert job.nodes[0]["time"]["start"] == 10.0
+        assert job.nodes[0]["print"]["priority"] == 0
+
+        board.update_status(mock_project, [
+            DashboardEvent(DashboardEventType.NODE_FINISHED, step, index,
+                           status=NodeStatus.SUCCESS),
+            DashboardEvent(DashboardEventType.METRIC, step, index,
+                           metric="tasktime", value=5.0),
+            DashboardEvent(DashboardEventType.METRIC, step, index,
+                           metric="totaltime", value=7.0),
+            DashboardEvent(DashboardEventType.METRIC, step, index,
+                           metric="warnings", value=3)
+        ])
+        get_job.assert_not_called()
+
+    with board._job_data_lock:
+        job = board._job_data["test_design/test_job"]
+        assert board._board_info.data_modified
+    assert job.nodes[0]["status"] == NodeStatus.SUCCESS
+    assert job.nodes[0]["time"]["duration"] == 5.0
+    assert job.nodes[0]["metrics"] == ["3", ""]
+    assert job.finished == 1
+    assert job.success == 1
+    assert job.runtime == 7.0
+
+
+def test_update_status_skipped(dashboard, mock_project):
+    board = dashboard._dashboard
+
+    board.update_manifest(mock_project)
+    with board._job_data_lock:
+        job = board._job_data["test_design/test_job"]
+    total = len(job.nodes)
+    step, index = job.nodes[0]["step"], job.nodes[0]["index"]
+
+    board.update_status(mock_project, [
+        DashboardEvent(DashboardEventType.NODE_FINISHED, step, index,
+                       status=NodeStatus.SKIPPED)
+    ])
+    with board._job_data_lock:
+        job = board._job_data["test_design/test_job"]
+    assert len(job.nodes) == total - 1
+    assert job.skipped == 1
+    assert job.total == total
+
+
+def test_update_status_without_job(dashboard, mock_project):
+    board = dashboard._dashboard
+
+    with patch.object(Board, "_update_render_data") as update:
+        board.update_status(mock_project, [
+            DashboardEvent(DashboardEventType.NODE_STARTED, "import", "0",
+                           status=NodeStatus.RUNNING, time=10.0)
+        ])
+        update.assert_called_once_with(mock_project, starttimes={("import", "0"): 10.0})
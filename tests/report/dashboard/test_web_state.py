@@ -0,0 +1,93 @@
+import fasteners
+import pytest
+import streamlit
+
+from unittest.mock import patch
+
+from siliconcompiler import NodeStatus, Project
+from siliconcompiler.report.dashboard import DashboardEvent, DashboardEventType
+from siliconcompiler.report.dashboard.web import WebDashboard
+from siliconcompiler.report.dashboard.web import state
+
+
+@pytest.fixture
+def session(monkeypatch):
+    session_state = {}
+    monkeypatch.setattr(streamlit, "session_state", session_state)
+    return session_state
+
+
+@pytest.fixture
+def dashboard(asic_gcd, session):
+    dashboard = WebDashboard(asic_gcd, port=1)
+    config = dashboard._WebDashboard__config
+
+    state._add_default(state.LOADED_CHIPS, {})
+    state._add_default(state.MANIFEST_FILE, config["manifest"])
+    state._add_default(state.MANIFEST_LOCK, fasteners.InterProcessLock(config["lock"]))
+    state._add_default(state.MANIFEST_TIME, None)
+    state._add_default(state.STATUS_FILE, config["status"])
+    state._add_default(state.STATUS_TIME, None)
+    state._add_default(state.STATUS_APPLIED, 0)
+
+    return dashboard
+
+
+def test_update_manifest_lazy_history(asic_gcd, dashboard, session):
+    asic_gcd.set('option', 'jobname', 'job0')
+    asic_gcd._record_history()
+    asic_gcd.set('option', 'jobname', 'job1')
+    dashboard.update_manifest()
+
+    assert state.update_manifest()
+    assert state.get_chips() == ['default', 'job0']
+    assert callable(session[state.LOADED_CHIPS]['job0'])
+
+    chip = state.get_chip('job0')
+    assert isinstance(chip, Project)
+    assert chip.get('option', 'jobname') == 'job0'
+    assert session[state.LOADED_CHIPS]['job0'] is chip
+    assert state.get_chip('default').history('job0') is chip
+
+    assert not state.update_manifest()
+
+
+def test_update_manifest_status(asic_gcd, dashboard):
+    dashboard.update_manifest()
+    assert state.update_manifest()
+
+    chip = state.get_chip('default')
+    assert chip.get('record', 'status', step='synthesis', index='0') is None
+
+    dashboard.update_status([
+        DashboardEvent(DashboardEventType.NODE_STARTED, 'synthesis', '0',
+                       status=NodeStatus.RUNNING, time=1.0)
+    ])
+    with patch.object(Project, "from_manifest") as from_manifest:
+        assert state.update_manifest()
+        from_manifest.assert_not_called()
+    assert state.get_chip('default') is chip
+    assert chip.get('record', 'status', step='synthesis', index='0') == NodeStatus.RUNNING
+
+    dashboard.update_status([
+        DashboardEvent(DashboardEventType.NODE_FINISHED, 'synthesis', '0',
+                       status=NodeStatus.SUCCESS),
+        DashboardEvent(DashboardEventType.METRIC, 'synthesis', '0',
+                       metric='cells', value=10)
+    ])
+    with patch.object(Project, "from_manifest") as from_manifest:
+        assert state.update_manifest()
+        from_manifest.assert_not_called()
+    assert chip.get('record', 'status', step='synthesis', index='0') == NodeStatus.SUCCESS
+    assert chip.get('metric', 'cells', step='synthesis', index='0') == 10
+
+    assert not state.update_manifest()
+
+    # A full update reloads the manifest and resets the events
+    asic_gcd.set('record', 'status', NodeStatus.ERROR, step='synthesis', index='0')
+    dashboard.update_manifest()
+    assert state.update_manifest()
+    chip = state.get_chip('default')
+    assert chip.get('record', 'status', step='synthesis', index='0') == NodeStatus.ERROR
+    assert chip.get('metric', 'cells', step='synthesis', index='0') is None
+    assert state.get_key(state.STATUS_APPLIED) == 0
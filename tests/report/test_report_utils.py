@@ -0,0 +1,105 @@
+import os
+
+from unittest.mock import patch
+
+from siliconcompiler import NodeStatus
+from siliconcompiler.report import utils
+from siliconcompiler.report import report
+
+
+def _setup_metrics(project):
+    flow = project.get('option', 'flow')
+    for step, index in project.get("flowgraph", flow, field="schema").get_nodes():
+        project.set('record', 'status', NodeStatus.SUCCESS, step=step, index=index)
+    project.set('record', 'status', NodeStatus.SKIPPED, step='place.detailed', index='0')
+    project.set('record', 'status', NodeStatus.ERROR, step='route.detailed', index='0')
+
+    project.set('metric', 'cells', 10, step='synthesis', index='0')
+    project.set('metric', 'cells', 20, step='place.global', index='0')
+    project.set('metric', 'cells', 30, step='place.detailed', index='0')
+
+
+def _write_manifest(project):
+    manifest = os.path.join(project.getworkdir(), f"{project.name}.pkg.json")
+    os.makedirs(os.path.dirname(manifest), exist_ok=True)
+    project.write_manifest(manifest)
+    return manifest
+
+
+def test_collect_data(asic_gcd):
+    _setup_metrics(asic_gcd)
+
+    nodes, errors, metrics, metrics_unit, metrics_to_show, reports = \
+        utils._collect_data(asic_gcd)
+
+    assert ('synthesis', '0') in nodes
+    assert ('place.detailed', '0') not in nodes
+    assert errors[('route.detailed', '0')]
+    assert not errors[('synthesis', '0')]
+    assert metrics[('synthesis', '0')]['cells'] == '10'
+    assert metrics[('place.global', '0')]['cells'] == '20'
+    assert metrics[('floorplan.init', '0')]['cells'] is None
+    assert 'cells' in metrics_to_show
+    assert 'cells' in metrics_unit
+    assert reports[('synthesis', '0')]['cells'] == []
+
+
+def test_collect_data_no_flow(asic_gcd):
+    asic_gcd.unset('option', 'flow')
+    assert utils._collect_data(asic_gcd) == ([], {}, {}, {}, [], {})
+
+
+def test_collect_data_not_cached(asic_gcd):
+    _setup_metrics(asic_gcd)
+    _write_manifest(asic_gcd)
+
+    utils._collect_data(asic_gcd)
+    asic_gcd.set('metric', 'cells', 15, step='synthesis', index='0')
+
+    _, _, metrics, _, _, _ = utils._collect_data(asic_gcd)
+    assert metrics[('synthesis', '0')]['cells'] == '15'
+
+
+def test_collect_data_cached(asic_gcd):
+    _setup_metrics(asic_gcd)
+    manifest = _write_manifest(asic_gcd)
+
+    first = utils._collect_data(asic_gcd, cache=True)
+
+    with patch("siliconcompiler.report.utils._MetricStore") as store:
+        assert utils._collect_data(asic_gcd, cache=True) == first
+        store.assert_not_called()
+
+    # Changing the manifest invalidates the cache
+    asic_gcd.set('metric', 'cells', 15, step='synthesis', index='0')
+    stat = os.stat(manifest)
+    os.utime(manifest, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+
+    _, _, metrics, _, _, _ = utils._collect_data(asic_gcd, cache=True)
+    assert metrics[('synthesis', '0')]['cells'] == '15'
+
+
+def test_collect_data_cached_no_manifest(asic_gcd):
+    _setup_metrics(asic_gcd)
+
+    utils._collect_data(asic_gcd, cache=True)
+    asic_gcd.set('metric', 'cells', 15, step='synthesis', index='0')
+
+    _, _, metrics, _, _, _ = utils._collect_data(asic_gcd, cache=True)
+    assert metrics[('synthesis', '0')]['cells'] == '15'
+
+
+def test_get_chart_data(asic_gcd):
+    _setup_metrics(asic_gcd)
+
+    data, unit = report.get_chart_data(
+        [{'chip_object': asic_gcd, 'chip_name': 'job0'}],
+        'cells',
+        [('synthesis', '0'), ('place.global', '0'), ('place.detailed', '0'),
+         ('floorplan.init', '0')])
+
+    assert data == {
+        ('synthesis', '0'): {'job0': 10},
+        ('place.global', '0'): {'job0': 20}
+    }
+    assert unit == ''
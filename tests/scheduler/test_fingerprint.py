@@ -0,0 +1,44 @@
+import os.path
+
+from siliconcompiler.scheduler.fingerprint import FingerprintDatabase
+
+
+def test_get_missing():
+    database = FingerprintDatabase("fingerprints.db")
+    assert database.get("step", "0") is None
+    database.close()
+
+
+def test_put_get():
+    database = FingerprintDatabase("fingerprints.db")
+    database.put("step", "0", {"tool": "tool0"})
+    database.put("step", "1", {"tool": "tool1"})
+    database.close()
+
+    database = FingerprintDatabase("fingerprints.db")
+    assert database.get("step", "0") == {"tool": "tool0"}
+    assert database.get("step", "1") == {"tool": "tool1"}
+    database.close()
+
+
+def test_put_replace():
+    database = FingerprintDatabase("fingerprints.db")
+    database.put("step", "0", {"tool": "tool0"})
+    database.put("step", "0", {"tool": "tool1"})
+    assert database.get("step", "0") == {"tool": "tool1"}
+    database.close()
+
+
+def test_remove():
+    database = FingerprintDatabase("fingerprints.db")
+    database.put("step", "0", {"tool": "tool0"})
+    database.remove("step", "0")
+    assert database.get("step", "0") is None
+    database.close()
+
+
+def test_remove_missing_database():
+    database = FingerprintDatabase("fingerprints.db")
+    database.remove("step", "0")
+    database.close()
+    assert not os.path.exists("fingerprints.db")
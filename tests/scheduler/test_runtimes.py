@@ -0,0 +1,46 @@
+import json
+import os
+
+from siliconcompiler.scheduler.runtimes import RuntimeDatabase
+
+
+def test_get_empty():
+    db = RuntimeDatabase("runtimes.json")
+    assert db.get("syn", "0", "yosys", "syn_asic") is None
+
+
+def test_record():
+    db = RuntimeDatabase("runtimes.json")
+    db.record("syn", "0", "yosys", "syn_asic", 10.0)
+    assert db.get("syn", "0") == 10.0
+    assert db.get("syn", "1") is None
+    assert db.get("syn", "1", "yosys", "syn_asic") == 10.0
+
+    db.record("syn", "0", "yosys", "syn_asic", 20.0)
+    assert db.get("syn", "0") == 15.0
+
+
+def test_write_and_load():
+    db = RuntimeDatabase(os.path.join("build", "runtimes.json"))
+    db.write()
+    assert not os.path.exists(db.path)
+
+    db.record("syn", "0", "yosys", "syn_asic", 10.0)
+    db.write()
+    assert os.listdir("build") == ["runtimes.json"]
+
+    db = RuntimeDatabase(os.path.join("build", "runtimes.json"))
+    assert db.get("syn", "0") == 10.0
+    assert db.get("place", "0", "yosys", "syn_asic") == 10.0
+
+
+def test_load_invalid():
+    with open("runtimes.json", "w") as f:
+        f.write("not json")
+    assert RuntimeDatabase("runtimes.json").get("syn", "0") is None
+
+    with open("runtimes.json", "w") as f:
+        json.dump({"nodes": {"syn/0": "fast", "syn/1": 5}, "tasks": []}, f)
+    db = RuntimeDatabase("runtimes.json")
+    assert db.get("syn", "0") is None
+    assert db.get("syn", "1") == 5.0
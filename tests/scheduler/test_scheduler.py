@@ -1,3 +1,4 @@
+import json
 import logging
 import os
 import pytest
@@ -9,6 +10,7 @@ from unittest.mock import patch
 
 from siliconcompiler import Project, FlowgraphSchema, DesignSchema, NodeStatus
 from siliconcompiler.scheduler import Scheduler
+from siliconcompiler.scheduler.fingerprint import FingerprintDatabase
 from siliconcompiler.schema import EditableSchema, Parameter
 
 from siliconcompiler.tools.builtin.nop import NOPTask
@@ -483,6 +485,64 @@ def test_resume_normal(gcd_nop_project):
         NodeStatus.SUCCESS
 
 
+def test_resume_fingerprint(gcd_nop_project):
+    assert gcd_nop_project.run()
+
+    database = FingerprintDatabase(os.path.join(gcd_nop_project.getworkdir(),
+                                                "fingerprints.db"))
+    for step in ("steptwo", "stepthree", "stepfour"):
+        assert database.get(step, "0")["task"] == "nop"
+    database.close()
+
+    # Previous manifests are not needed to resume
+    for step in ("steptwo", "stepthree", "stepfour"):
+        os.remove(os.path.join(gcd_nop_project.getworkdir(step=step, index="0"),
+                               "inputs", "gcd.pkg.json"))
+
+    run_copy = gcd_nop_project.copy()
+    time.sleep(1)  # delay to ensure timestamps differ
+    assert gcd_nop_project.run()
+
+    for step in ("steptwo", "stepthree", "stepfour"):
+        assert run_copy.get("record", "endtime", step=step, index="0") == \
+            gcd_nop_project.get("record", "endtime", step=step, index="0")
+
+
+def test_run_compact_manifest(gcd_nop_project):
+    assert gcd_nop_project.set("option", "compactmanifest", True)
+    assert gcd_nop_project.run()
+
+    for step in ("stepone", "steptwo", "stepthree", "stepfour"):
+        for manifest in ("inputs", "outputs"):
+            path = os.path.join(gcd_nop_project.getworkdir(step=step, index="0"),
+                                manifest, "gcd.pkg.json")
+            with open(path) as f:
+                data = json.load(f)
+            assert "__compact__" in data
+            assert "help" not in data["option"]["jobname"]
+
+    # Job manifest is complete
+    with open(os.path.join(gcd_nop_project.getworkdir(), "gcd.pkg.json")) as f:
+        data = json.load(f)
+    assert "__compact__" not in data
+    assert "help" in data["option"]["jobname"]
+
+    output = Project.from_manifest(filepath=os.path.join(
+        gcd_nop_project.getworkdir(step="stepfour", index="0"), "outputs", "gcd.pkg.json"))
+    assert output.get("record", "status", step="stepfour", index="0") == NodeStatus.SUCCESS
+    assert output.get("option", "jobname", field="help") == \
+        gcd_nop_project.get("option", "jobname", field="help")
+
+    # Resume from the compact manifests
+    run_copy = gcd_nop_project.copy()
+    time.sleep(1)  # delay to ensure timestamps differ
+    assert gcd_nop_project.run()
+
+    for step in ("steptwo", "stepthree", "stepfour"):
+        assert run_copy.get("record", "endtime", step=step, index="0") == \
+            gcd_nop_project.get("record", "endtime", step=step, index="0")
+
+
 def test_resume_value_changed(gcd_nop_project):
     EditableSchema(gcd_nop_project).insert("option", "testing", Parameter("str"))
 
@@ -519,3 +579,99 @@ def test_resume_value_changed(gcd_nop_project):
         NodeStatus.SUCCESS
     assert gcd_nop_project.get("record", "status", step="stepfour", index="0") == \
         NodeStatus.SUCCESS
+
+
+@pytest.fixture
+def parallel_project(gcd_design, monkeypatch):
+    monkeypatch.setattr("siliconcompiler.scheduler.scheduler.utils.get_cores", lambda: 4)
+
+    project = Project(gcd_design)
+    project.add_fileset("rtl")
+    project.add_fileset("sdc")
+
+    flow = FlowgraphSchema("nopflow")
+    flow.node("stepone", NOPTask())
+    for index in range(4):
+        flow.node("steptwo", NOPTask(), index=index)
+        flow.edge("stepone", "steptwo", head_index=index)
+    project.set_flow(flow)
+
+    return project
+
+
+def test_configure_layer_parallel(parallel_project):
+    scheduler = Scheduler(parallel_project)
+    nodes = [("steptwo", str(index)) for index in range(4)]
+
+    def configure(step, index):
+        parallel_project.logger.info(f"configuring {step}/{index}")
+        parallel_project.set("tool", "builtin", "task", "nop", "option",
+                             f"PID{index}={os.getpid()}", step=step, index=index)
+        return int(index)
+
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    parallel_project.logger.addHandler(handler)
+    try:
+        assert scheduler._Scheduler__configure_layer(configure, nodes) == {
+            ("steptwo", "0"): 0,
+            ("steptwo", "1"): 1,
+            ("steptwo", "2"): 2,
+            ("steptwo", "3"): 3
+        }
+    finally:
+        parallel_project.logger.removeHandler(handler)
+    assert [record.getMessage() for record in records] == [
+        f"configuring steptwo/{index}" for index in range(4)]
+
+    for index in range(4):
+        option = parallel_project.get("tool", "builtin", "task", "nop", "option",
+                                      step="steptwo", index=str(index))
+        assert len(option) == 1
+        assert option[0].startswith(f"PID{index}=")
+        assert option[0] != f"PID{index}={os.getpid()}"
+
+
+def test_configure_layer_parallel_error(parallel_project):
+    scheduler = Scheduler(parallel_project)
+    nodes = [("steptwo", str(index)) for index in range(4)]
+
+    def configure(step, index):
+        if index == "2":
+            raise ValueError("setup failed")
+        return True
+
+    with pytest.raises(ValueError, match="setup failed"):
+        scheduler._Scheduler__configure_layer(configure, nodes)
+
+
+def test_configure_layer_single_node(parallel_project):
+    scheduler = Scheduler(parallel_project)
+
+    def configure(step, index):
+        return os.getpid()
+
+    assert scheduler._Scheduler__configure_layer(configure, [("stepone", "0")]) == {
+        ("stepone", "0"): os.getpid()
+    }
+
+
+def test_resume_parallel(parallel_project):
+    assert parallel_project.run()
+    run_copy = parallel_project.copy()
+    time.sleep(1)  # delay to ensure timestamps differ
+
+    parallel_project.set("tool", "builtin", "task", "nop", "option", "-changed",
+                         step="steptwo", index="2")
+    assert parallel_project.run()
+
+    for index in ("0", "1", "3"):
+        assert run_copy.get("record", "endtime", step="steptwo", index=index) == \
+            parallel_project.get("record", "endtime", step="steptwo", index=index)
+    assert run_copy.get("record", "endtime", step="steptwo", index="2") != \
+        parallel_project.get("record", "endtime", step="steptwo", index="2")
+
+    for index in ("0", "1", "2", "3"):
+        assert parallel_project.get("record", "status", step="steptwo", index=index) == \
+            NodeStatus.SUCCESS
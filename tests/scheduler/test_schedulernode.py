@@ -20,6 +20,7 @@ from siliconcompiler.tools.builtin.join import JoinTask
 from scheduler.tools.echo.echo import EchoTask
 
 from siliconcompiler.scheduler import SchedulerNode
+from siliconcompiler.scheduler.fingerprint import FingerprintDatabase
 
 
 @pytest.fixture
@@ -868,6 +869,144 @@ def test_requires_run_all_files_changed(project, monkeypatch, caplog):
     assert "Files changed" in caplog.text
 
 
+def _record_fingerprint(project, node):
+    os.makedirs(os.path.dirname(node.get_manifest()), exist_ok=True)
+    project.write_manifest(node.get_manifest())
+
+    with node.runtime():
+        fingerprint = node.get_fingerprint()
+
+    database = FingerprintDatabase(os.path.join(project.getworkdir(), "fingerprints.db"))
+    database.put(node.step, node.index, fingerprint)
+    database.close()
+
+    return fingerprint
+
+
+def test_get_fingerprint(project):
+    project.set("library", "testdesign", "fileset", "rtl", "idir", "testdir")
+
+    node = SchedulerNode(project, "steptwo", "0")
+    with node.runtime():
+        fingerprint = node.get_fingerprint(inputs=[("stepone", "0")])
+
+    assert fingerprint["flow"] == "testflow"
+    assert fingerprint["tool"] == "builtin"
+    assert fingerprint["task"] == "nop"
+    assert fingerprint["inputnode"] == [["stepone", "0"]]
+    assert "tool,builtin,task,nop,option" in fingerprint["values"]
+    assert "tool,builtin,task,nop,script" in fingerprint["files"]
+    assert fingerprint["filehashes"] is None
+
+
+def test_requires_run_fingerprint_pass(project, monkeypatch):
+    node = SchedulerNode(project, "steptwo", "0")
+    _record_fingerprint(project, node)
+
+    def dummy_from_manifest(*args, **kwargs):
+        raise RuntimeError("manifest should not be loaded")
+    monkeypatch.setattr(Project, "from_manifest", dummy_from_manifest)
+
+    assert node.requires_run() is False
+
+
+def test_requires_run_fingerprint_no_output(project, caplog):
+    setattr(project, "_Project__logger", logging.getLogger())
+    project.logger.setLevel(logging.DEBUG)
+
+    node = SchedulerNode(project, "steptwo", "0")
+    _record_fingerprint(project, node)
+    os.remove(node.get_manifest())
+
+    assert node.requires_run() is True
+    assert "Previous run did not generate input manifest" in caplog.text
+
+
+def test_requires_run_fingerprint_values_changed(project, caplog):
+    setattr(project, "_Project__logger", logging.getLogger())
+    project.logger.setLevel(logging.INFO)
+
+    node = SchedulerNode(project, "steptwo", "0")
+    _record_fingerprint(project, node)
+
+    project.set("tool", "builtin", "task", "nop", "option", "-a", step="steptwo", index="0")
+
+    assert node.requires_run() is True
+    assert "[tool,builtin,task,nop,option] in steptwo/0 has been modified from previous run" in \
+        caplog.text
+
+
+def test_requires_run_fingerprint_task_changed(project, caplog):
+    setattr(project, "_Project__logger", logging.getLogger())
+    project.logger.setLevel(logging.DEBUG)
+
+    node = SchedulerNode(project, "steptwo", "0")
+    fingerprint = _record_fingerprint(project, node)
+
+    fingerprint["task"] = "join"
+    database = FingerprintDatabase(os.path.join(project.getworkdir(), "fingerprints.db"))
+    database.put("steptwo", "0", fingerprint)
+    database.close()
+
+    assert node.requires_run() is True
+    assert "Task name changed" in caplog.text
+
+
+def test_requires_run_fingerprint_files_changed(project, monkeypatch, caplog):
+    setattr(project, "_Project__logger", logging.getLogger())
+    project.logger.setLevel(logging.INFO)
+
+    os.makedirs("testdir", exist_ok=True)
+    with open("testdir/testfile.txt", "w") as f:
+        f.write("test")
+    project.set("library", "testdesign", "fileset", "rtl", "idir", "testdir")
+
+    node = SchedulerNode(project, "steptwo", "0")
+
+    def dummy_get_check_changed_keys(*args):
+        return set(), {("library", "testdesign", "fileset", "rtl", "idir")}
+    monkeypatch.setattr(node, "get_check_changed_keys", dummy_get_check_changed_keys)
+
+    _record_fingerprint(project, node)
+    assert node.requires_run() is False
+
+    with open("testdir/newfile.txt", "w") as f:
+        f.write("test")
+
+    assert node.requires_run() is True
+    assert "[library,testdesign,fileset,rtl,idir] (timestamp) in steptwo/0 has been modified " \
+        "from previous run" in caplog.text
+
+
+def test_requires_run_fingerprint_hash(project, monkeypatch, caplog):
+    setattr(project, "_Project__logger", logging.getLogger())
+    project.logger.setLevel(logging.INFO)
+
+    with open("testfile.txt", "w") as f:
+        f.write("test")
+    project.set("library", "testdesign", "fileset", "rtl", "file", "verilog", "testfile.txt")
+    project.set("option", "hash", True)
+
+    node = SchedulerNode(project, "steptwo", "0")
+
+    def dummy_get_check_changed_keys(*args):
+        return set(), {("library", "testdesign", "fileset", "rtl", "file", "verilog")}
+    monkeypatch.setattr(node, "get_check_changed_keys", dummy_get_check_changed_keys)
+
+    _record_fingerprint(project, node)
+
+    # Same content does not require a rerun
+    os.utime("testfile.txt", ns=(0, os.stat("testfile.txt").st_mtime_ns + 1000000000))
+    assert node.requires_run() is False
+
+    with open("testfile.txt", "w") as f:
+        f.write("changed")
+
+    assert node.requires_run() is True
+    assert "[library,testdesign,fileset,rtl,file,verilog] (file hash) in steptwo/0 has been " \
+        "modified from previous run" in caplog.text
+
+
 def test_check_logfile(project, datadir, caplog):
     setattr(project, "_Project__logger", logging.getLogger())
     project.logger.setLevel(logging.INFO)
@@ -1481,6 +1620,47 @@ def test_run_with_queue(project):
         assert pipe.calls == 1
 
 
+def test_run_with_queue_sends_journal(project):
+    node = SchedulerNode(project, "stepone", "0")
+
+    class DummyPipe:
+        messages = []
+
+        def send(self, msg):
+            self.messages.append(msg)
+    pipe = DummyPipe()
+    node.set_queue(pipe, Queue())
+
+    node.task.setup_work_directory(node.workdir)
+    with patch("logging.Logger.removeHandler"), \
+         patch("siliconcompiler.scheduler.SchedulerNode.execute"):
+        node.run()
+
+    assert len(pipe.messages) == 1
+    assert set(pipe.messages[0].keys()) == {"packages", "journal"}
+    keys = [(record["type"], record["key"]) for record in pipe.messages[0]["journal"]]
+    assert ("set", ("record", "scversion")) in keys
+    assert ("set", ("record", "starttime")) in keys
+
+
+def test_halt_with_queue_sends_journal(project):
+    node = SchedulerNode(project, "steptwo", "0")
+    node.task.setup_work_directory(node.workdir)
+
+    class DummyPipe:
+        messages = []
+
+        def send(self, msg):
+            self.messages.append(msg)
+    pipe = DummyPipe()
+    node.set_queue(pipe, Queue())
+
+    with pytest.raises(SystemExit):
+        node.halt()
+    assert len(pipe.messages) == 1
+    assert pipe.messages[0]["journal"] is None
+
+
 def test_run_called_testcase_on_error(project):
     node = SchedulerNode(project, "stepone", "0")
     assert node._SchedulerNode__generate_test_case is True
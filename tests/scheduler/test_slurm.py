@@ -1,4 +1,8 @@
+import json
+import os
 import pytest
+import subprocess
+import sys
 
 import os.path
 
@@ -8,6 +12,7 @@ from siliconcompiler import Project, FlowgraphSchema, DesignSchema, NodeStatus
 from siliconcompiler.tools.builtin.nop import NOPTask
 
 from siliconcompiler.scheduler import SlurmSchedulerNode
+from siliconcompiler.scheduler.slurm import SlurmJobTracker
 
 
 @pytest.fixture
@@ -91,3 +96,154 @@ def test_slurm_local_py(project):
 
     assert project.get("record", "status", step="stepone", index="0") == NodeStatus.SUCCESS
     assert project.get("record", "status", step="steptwo", index="0") == NodeStatus.SUCCESS
+
+
+@pytest.fixture
+def fake_slurm(monkeypatch, tmp_path):
+    '''Installs fake sbatch/squeue/sacct/scancel commands which run the jobs
+    as soon as they are submitted and record every call.'''
+    bindir = tmp_path / "fake_slurm"
+    bindir.mkdir()
+    db = bindir / "db.json"
+    db.write_text(json.dumps({"calls": [], "jobs": {}}))
+
+    shim = f'''#!{sys.executable}
+import json
+import os
+import subprocess
+import sys
+
+db_path = {str(db)!r}
+cmd = os.path.basename(sys.argv[0])
+args = sys.argv[1:]
+
+with open(db_path) as f:
+    db = json.load(f)
+db["calls"].append([cmd, *args])
+
+if cmd == "sbatch":
+    jobid = str(1000 + len(db["jobs"]))
+    opts = {{}}
+    n = 0
+    while args[n].startswith("--"):
+        if "=" in args[n] or args[n] in ("--parsable", "--exclusive"):
+            n += 1
+            continue
+        opts[args[n]] = args[n + 1]
+        n += 2
+    script = args[n]
+    tasks = [None]
+    if "--array" in opts:
+        first, last = opts["--array"].split("-")
+        tasks = list(range(int(first), int(last) + 1))
+    for task in tasks:
+        env = dict(os.environ)
+        name = jobid
+        if task is not None:
+            env["SLURM_ARRAY_TASK_ID"] = str(task)
+            name = f"{{jobid}}_{{task}}"
+        with open(opts["--output"], "w") as log:
+            ret = subprocess.call([script], env=env, stdout=log, stderr=log,
+                                  cwd=opts["--chdir"])
+        db["jobs"][name] = "COMPLETED|0:0" if ret == 0 else f"FAILED|{{ret}}:0"
+    print(jobid)
+elif cmd == "sacct":
+    for name, state in db["jobs"].items():
+        print(f"{{name}}|{{state}}")
+
+with open(db_path, "w") as f:
+    json.dump(db, f)
+'''
+    for cmd in ("sbatch", "squeue", "sacct", "scancel"):
+        path = bindir / cmd
+        path.write_text(shim)
+        path.chmod(0o755)
+
+    monkeypatch.setenv("PATH", f"{bindir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setattr(SlurmJobTracker, "poll_interval", 0.1)
+
+    def calls(cmd=None):
+        with open(db) as f:
+            return [call for call in json.load(f)["calls"] if not cmd or call[0] == cmd]
+
+    return calls
+
+
+def test_create_job_tracker(project):
+    assert SlurmSchedulerNode.create_job_tracker(project) is None
+
+    project.set('option', 'scheduler', 'async', True)
+    assert isinstance(SlurmSchedulerNode.create_job_tracker(project), SlurmJobTracker)
+
+
+def test_async_run(project, fake_slurm):
+    flow = project.get("flowgraph", "testflow", field="schema")
+    for n in range(1, 3):
+        flow.node("steptwo", NOPTask(), index=n)
+        flow.edge("stepone", "steptwo", head_index=n)
+
+    project.set('option', 'scheduler', 'name', 'slurm')
+    project.set('option', 'scheduler', 'async', True)
+    project.set('option', 'scheduler', 'queue', 'testqueue')
+
+    assert project.run()
+
+    for step, index in flow.get_nodes():
+        assert project.get("record", "status", step=step, index=index) == NodeStatus.SUCCESS
+
+    # One submission for stepone and one job array for the steptwo indices
+    sbatch = fake_slurm("sbatch")
+    assert len(sbatch) == 2
+    assert "--array" not in sbatch[0]
+    assert sbatch[1][sbatch[1].index("--array") + 1] == "0-2"
+    assert sbatch[1][sbatch[1].index("--partition") + 1] == "testqueue"
+
+    # One poll per submission
+    assert len(fake_slurm("squeue")) == 2
+    assert len(fake_slurm("sacct")) == 2
+
+
+def test_async_poll_failed_job(project, fake_slurm):
+    project.set('option', 'scheduler', 'queue', 'testqueue')
+
+    tracker = SlurmJobTracker(project)
+    node = SlurmSchedulerNode(project, "stepone", "0")
+    job = tracker.add(node)
+
+    # Replace the run script with a failing one
+    os.makedirs(SlurmSchedulerNode.get_configuration_directory(project), exist_ok=True)
+    _, _, script = node.get_runtime_files()
+    with open(script, "w") as f:
+        f.write("#!/bin/bash\nexit 3\n")
+
+    job.start()
+    tracker.submit()
+    assert job.jobid == "1000"
+    assert tracker.poll() == [job]
+    assert job.exitcode == 3
+    assert tracker.poll() == []
+
+
+def test_async_submit_failure(project, fake_slurm, monkeypatch):
+    project.set('option', 'scheduler', 'queue', 'testqueue')
+
+    tracker = SlurmJobTracker(project)
+    job = tracker.add(SlurmSchedulerNode(project, "stepone", "0"))
+
+    class Result:
+        returncode = 1
+        stdout = b"sbatch: error: invalid partition"
+
+    monkeypatch.setattr(subprocess, "run", lambda *args, **kwargs: Result)
+
+    job.start()
+    tracker.submit()
+    assert job.jobid is None
+    assert tracker.poll() == [job]
+    assert job.exitcode == 1
+
+
+def test_parse_job_ids():
+    assert SlurmJobTracker._SlurmJobTracker__parse_job_ids(
+        "10\n11_2\n12_[0-2,5%2]\n\n13|COMPLETED|0:0\n") == \
+        {"10", "11_2", "12_0", "12_1", "12_2", "12_5", "13"}
@@ -1,14 +1,20 @@
 import logging
+import psutil
+import subprocess
+import time
 
 import pytest
 
 from threading import Lock
 
-from siliconcompiler import NodeStatus
+from siliconcompiler import NodeStatus, SiliconCompilerError
 from siliconcompiler import Project, FlowgraphSchema, DesignSchema
 from siliconcompiler.scheduler import TaskScheduler
 from siliconcompiler.scheduler.taskscheduler import utils as imported_utils
 from siliconcompiler.scheduler import SchedulerNode
+from siliconcompiler.scheduler.runtimes import RuntimeDatabase
+from siliconcompiler.schema import Journal
+from siliconcompiler.report.dashboard import DashboardEventType
 
 from siliconcompiler.tools.builtin.nop import NOPTask
 from siliconcompiler.tools.builtin.join import JoinTask
@@ -146,11 +152,16 @@ def test_run_dashboard(large_flow, make_tasks, monkeypatch):
     class FakeDashboard:
         lock = Lock()
         calls = []
+        events = []
 
         def update_manifest(self, payload=None):
             with self.lock:
                 self.calls.append(payload)
 
+        def update_status(self, events):
+            with self.lock:
+                self.events.append(events)
+
     def dummy_get_cores(*args, **kwargs):
         return 1
     monkeypatch.setattr(imported_utils, "get_cores", dummy_get_cores)
@@ -161,10 +172,52 @@ def test_run_dashboard(large_flow, make_tasks, monkeypatch):
     scheduler = TaskScheduler(large_flow, make_tasks(large_flow))
     scheduler.run(logging.NullHandler())
 
-    assert len(dashboard.calls) == 14
-    assert dashboard.calls[0] is None
-    assert all(["starttimes" in c for c in dashboard.calls[1:]])
-    assert len(dashboard.calls[-1]["starttimes"]) == 13
+    # Full update only before the run
+    assert dashboard.calls == [None]
+
+    assert len(dashboard.events) == 13
+    events = [event for batch in dashboard.events for event in batch]
+    started = [(event.step, event.index) for event in events
+               if event.type == DashboardEventType.NODE_STARTED]
+    finished = [(event.step, event.index, event.status) for event in events
+                if event.type == DashboardEventType.NODE_FINISHED]
+    assert len(started) == 12
+    assert all([event.time is not None for event in events
+                if event.type == DashboardEventType.NODE_STARTED])
+    assert len(finished) == 12
+    assert all([status == NodeStatus.SUCCESS for _, _, status in finished])
+    assert ("jointhree", "0", NodeStatus.SUCCESS) == finished[-1]
+
+    metrics = [(event.step, event.index, event.metric) for event in events
+               if event.type == DashboardEventType.METRIC]
+    assert ("jointhree", "0", "tasktime") in metrics
+
+
+def test_run_dashboard_dependency_failed(large_flow, make_tasks):
+    class FakeDashboard:
+        def __init__(self):
+            self.events = []
+
+        def update_manifest(self, payload=None):
+            pass
+
+        def update_status(self, events):
+            self.events.extend(events)
+
+    large_flow.set("record", "status", NodeStatus.ERROR, step="stepone", index="0")
+    large_flow.set("record", "status", NodeStatus.ERROR, step="stepone", index="1")
+    large_flow.set("record", "status", NodeStatus.ERROR, step="stepone", index="2")
+    large_flow.set("record", "status", NodeStatus.PENDING, step="joinone", index="0")
+
+    dashboard = FakeDashboard()
+    large_flow._Project__dashboard = dashboard
+
+    scheduler = TaskScheduler(large_flow, make_tasks(large_flow))
+    scheduler.run(logging.NullHandler())
+
+    assert all([event.type == DashboardEventType.NODE_FINISHED for event in dashboard.events])
+    finished = {(event.step, event.index): event.status for event in dashboard.events}
+    assert finished == {node: NodeStatus.ERROR for node in scheduler.get_nodes()}
 
 
 def test_run_control_c(large_flow, make_tasks, monkeypatch):
@@ -189,3 +242,293 @@ def test_check_invalid(large_flow, make_tasks):
 
     with pytest.raises(RuntimeError, match="These final steps could not be reached: jointhree"):
         scheduler.check()
+
+
+def test_get_nodes_waiting_to_run(large_flow, make_tasks):
+    scheduler = TaskScheduler(large_flow, make_tasks(large_flow))
+    assert scheduler.get_nodes_waiting_to_run() == scheduler.get_nodes()
+    assert scheduler.get_running_nodes() == []
+
+
+def test_ready_queue_initial(large_flow, make_tasks):
+    scheduler = TaskScheduler(large_flow, make_tasks(large_flow))
+    assert sorted(scheduler._TaskScheduler__ready) == [
+        ('stepone', '0'), ('stepone', '1'), ('stepone', '2')]
+
+
+def test_ready_queue_with_complete(large_flow, make_tasks):
+    for n in range(3):
+        large_flow.set("record", "status", NodeStatus.SUCCESS, step="stepone", index=n)
+    scheduler = TaskScheduler(large_flow, make_tasks(large_flow))
+    assert sorted(scheduler._TaskScheduler__ready) == [('joinone', '0')]
+
+
+def test_run_dependency_failed(large_flow, make_tasks):
+    large_flow.set("record", "status", NodeStatus.ERROR, step="stepone", index="0")
+    large_flow.set("record", "status", NodeStatus.ERROR, step="stepone", index="1")
+    large_flow.set("record", "status", NodeStatus.ERROR, step="stepone", index="2")
+    large_flow.set("record", "status", NodeStatus.PENDING, step="joinone", index="0")
+
+    scheduler = TaskScheduler(large_flow, make_tasks(large_flow))
+    scheduler.run(logging.NullHandler())
+
+    for step, index in scheduler.get_nodes():
+        assert large_flow.get("record", "status", step=step, index=index) == NodeStatus.ERROR
+    assert scheduler.get_nodes_waiting_to_run() == []
+
+
+def test_run_missing_input(large_flow, make_tasks):
+    large_flow.set("record", "status", None, step="stepone", index="0")
+    large_flow.set("record", "status", None, step="stepone", index="1")
+    large_flow.set("record", "status", None, step="stepone", index="2")
+
+    scheduler = TaskScheduler(large_flow, make_tasks(large_flow))
+    with pytest.raises(SiliconCompilerError,
+                       match="Nodes left to run, but no running nodes"):
+        scheduler.run(logging.NullHandler())
+
+
+def test_run_merges_journal_from_pipe(large_flow, make_tasks, monkeypatch):
+    def no_replay_file(*args, **kwargs):
+        raise RuntimeError("manifest should not be replayed")
+    monkeypatch.setattr(Journal, "replay_file", no_replay_file)
+
+    scheduler = TaskScheduler(large_flow, make_tasks(large_flow))
+    scheduler.run(logging.NullHandler())
+
+    for step, index in large_flow.get("flowgraph", "testflow", field="schema").get_nodes():
+        assert large_flow.get("record", "status", step=step, index=index) == NodeStatus.SUCCESS
+        assert large_flow.get("record", "scversion", step=step, index=index)
+
+
+def test_critical_path_priorities(large_flow, make_tasks):
+    large_flow.set('option', 'scheduler', 'policy', 'criticalpath')
+
+    runtimes = RuntimeDatabase(TaskScheduler.get_runtime_database_path(large_flow))
+    for step, index in large_flow.get("flowgraph", "testflow", field="schema").get_nodes():
+        runtimes.record(step, index, "builtin", "nop", 1.0)
+    runtimes.record("stepone", "2", "builtin", "nop", 21.0)
+    runtimes.record("steptwo", "0", "builtin", "nop", 21.0)
+    runtimes.write()
+
+    scheduler = TaskScheduler(large_flow, make_tasks(large_flow))
+    priorities = scheduler._TaskScheduler__priorities
+    assert priorities[("jointhree", "0")] == 1.0
+    assert priorities[("steptwo", "0")] == 14.0
+    assert priorities[("stepone", "0")] == 16.0
+    assert priorities[("stepone", "2")] == 26.0
+
+    assert sorted(scheduler._TaskScheduler__ready,
+                  key=scheduler._TaskScheduler__get_priority) == [
+        ('stepone', '2'), ('stepone', '0'), ('stepone', '1')]
+
+
+def test_critical_path_from_history(large_flow, make_tasks):
+    large_flow.set('option', 'scheduler', 'policy', 'criticalpath')
+    large_flow.set("metric", "tasktime", 50.0, step="stepone", index="1")
+    large_flow.set("metric", "exetime", 10.0, step="stepone", index="2")
+    large_flow._record_history()
+    large_flow.unset("metric", "tasktime", step="stepone", index="1")
+    large_flow.unset("metric", "exetime", step="stepone", index="2")
+
+    scheduler = TaskScheduler(large_flow, make_tasks(large_flow))
+    estimates = scheduler._TaskScheduler__estimates
+    assert estimates[("stepone", "1")] == 50.0
+    assert estimates[("stepone", "2")] == 10.0
+    # Nodes without a runtime use the average of the known runtimes
+    assert estimates[("stepone", "0")] == 30.0
+
+    assert sorted(scheduler._TaskScheduler__ready,
+                  key=scheduler._TaskScheduler__get_priority)[0] == ('stepone', '1')
+
+
+def test_critical_path_run(large_flow, make_tasks, monkeypatch):
+    large_flow.set('option', 'scheduler', 'policy', 'criticalpath')
+    large_flow.set('option', 'scheduler', 'maxnodes', 1)
+
+    runtimes = RuntimeDatabase(TaskScheduler.get_runtime_database_path(large_flow))
+    runtimes.record("stepone", "0", "builtin", "nop", 1.0)
+    runtimes.record("stepone", "1", "builtin", "nop", 10.0)
+    runtimes.write()
+
+    started = []
+    monkeypatch.setitem(TaskScheduler._TaskScheduler__callbacks, "pre_node",
+                        lambda proj, step, index: started.append((step, index)))
+
+    scheduler = TaskScheduler(large_flow, make_tasks(large_flow))
+    scheduler.run(logging.NullHandler())
+
+    assert started[0] == ("stepone", "1")
+    for step, index in large_flow.get("flowgraph", "testflow", field="schema").get_nodes():
+        assert large_flow.get("record", "status", step=step, index=index) == NodeStatus.SUCCESS
+
+    # Runtimes of the run are recorded
+    runtimes = RuntimeDatabase(TaskScheduler.get_runtime_database_path(large_flow))
+    assert runtimes.get("steptwo", "2") is not None
+
+
+def test_get_reservation(large_flow, make_tasks, monkeypatch):
+    large_flow.set('option', 'scheduler', 'policy', 'criticalpath')
+    monkeypatch.setattr(time, "time", lambda: 100.0)
+
+    scheduler = TaskScheduler(large_flow, make_tasks(large_flow))
+    scheduler._TaskScheduler__max_cores = 4
+    scheduler._TaskScheduler__max_parallel_run = 4
+    scheduler._TaskScheduler__estimates[("stepone", "0")] = 10.0
+    scheduler._TaskScheduler__estimates[("stepone", "1")] = 30.0
+    for n, node in enumerate((("stepone", "0"), ("stepone", "1"))):
+        scheduler._TaskScheduler__nodes[node]["threads"] = 2
+        scheduler._TaskScheduler__running[n] = node
+        scheduler._TaskScheduler__startTimes[node] = 100.0
+    scheduler._TaskScheduler__running_threads = 4
+
+    assert scheduler._TaskScheduler__get_reservation(2) == 110.0
+    assert scheduler._TaskScheduler__get_reservation(4) == 130.0
+
+
+class _MemoryUsage:
+    def __init__(self, percent):
+        self.percent = percent
+
+
+def _is_stopped(pid, stopped=True):
+    # Signals are delivered asynchronously
+    for _ in range(100):
+        if (psutil.Process(pid).status() == psutil.STATUS_STOPPED) == stopped:
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_memory_estimates(large_flow, make_tasks):
+    large_flow.set('option', 'scheduler', 'maxmemory', 1000)
+    large_flow.set('option', 'scheduler', 'memory', 200, step="stepone", index="0")
+    large_flow.set("metric", "memory", 300 * 1024 * 1024, step="stepone", index="1")
+    large_flow._record_history()
+
+    scheduler = TaskScheduler(large_flow, make_tasks(large_flow))
+    memory = scheduler._TaskScheduler__memory
+    assert memory[("stepone", "0")] == 200 * 1024 * 1024
+    assert memory[("stepone", "1")] == 300 * 1024 * 1024
+    assert memory[("stepone", "2")] == 0
+
+
+def test_allow_start_memory(large_flow, make_tasks):
+    large_flow.set('option', 'scheduler', 'maxmemory', 1000)
+    for n in range(3):
+        large_flow.set('option', 'scheduler', 'memory', 400, step="stepone", index=n)
+
+    scheduler = TaskScheduler(large_flow, make_tasks(large_flow))
+    allow_start = scheduler._TaskScheduler__allow_start
+
+    scheduler._TaskScheduler__max_parallel_run = 4
+    scheduler._TaskScheduler__max_cores = 4
+    scheduler._TaskScheduler__nodes[("stepone", "1")]["threads"] = 1
+
+    # Always allow a node when nothing is running
+    scheduler._TaskScheduler__running_memory = 2000 * 1024 * 1024
+    assert allow_start(("stepone", "1"))
+
+    scheduler._TaskScheduler__running[0] = ("stepone", "0")
+    assert not allow_start(("stepone", "1"))
+
+    scheduler._TaskScheduler__running_memory = 400 * 1024 * 1024
+    assert allow_start(("stepone", "1"))
+
+    scheduler._TaskScheduler__memory_pressure = True
+    assert not allow_start(("stepone", "1"))
+
+
+def test_run_memory_budget(large_flow, make_tasks, monkeypatch):
+    large_flow.set('option', 'scheduler', 'maxmemory', 1000)
+    for n in range(3):
+        large_flow.set('option', 'scheduler', 'memory', 600, step="stepone", index=n)
+
+    running = set()
+    max_running = []
+
+    def pre_node(proj, step, index):
+        if step == "stepone":
+            running.add(index)
+            max_running.append(len(running))
+
+    def post_node(proj, step, index):
+        running.discard(index)
+
+    monkeypatch.setitem(TaskScheduler._TaskScheduler__callbacks, "pre_node", pre_node)
+    monkeypatch.setitem(TaskScheduler._TaskScheduler__callbacks, "post_node", post_node)
+
+    scheduler = TaskScheduler(large_flow, make_tasks(large_flow))
+    scheduler._TaskScheduler__max_cores = 3
+    scheduler._TaskScheduler__max_parallel_run = 3
+    for info in scheduler._TaskScheduler__nodes.values():
+        info["threads"] = 1
+    scheduler.run(logging.NullHandler())
+
+    assert max(max_running) == 1
+    for step, index in large_flow.get("flowgraph", "testflow", field="schema").get_nodes():
+        assert large_flow.get("record", "status", step=step, index=index) == NodeStatus.SUCCESS
+
+
+def test_check_memory_pause(large_flow, make_tasks, monkeypatch):
+    large_flow.set('option', 'scheduler', 'memorypressure', 'pause')
+
+    scheduler = TaskScheduler(large_flow, make_tasks(large_flow))
+
+    procs = []
+    try:
+        for n, node in enumerate((("stepone", "0"), ("stepone", "1"))):
+            procs.append(subprocess.Popen(["sleep", "30"]))
+            scheduler._TaskScheduler__nodes[node]["proc"] = procs[-1]
+            scheduler._TaskScheduler__running[n] = node
+            scheduler._TaskScheduler__startTimes[node] = n
+
+        monkeypatch.setattr(psutil, "virtual_memory", lambda: _MemoryUsage(95))
+        scheduler._TaskScheduler__check_memory()
+        assert scheduler._TaskScheduler__paused == [("stepone", "1")]
+        assert _is_stopped(procs[1].pid)
+        assert psutil.Process(procs[0].pid).status() != psutil.STATUS_STOPPED
+
+        # Keep at least one node running
+        scheduler._TaskScheduler__check_memory()
+        assert scheduler._TaskScheduler__paused == [("stepone", "1")]
+
+        monkeypatch.setattr(psutil, "virtual_memory", lambda: _MemoryUsage(50))
+        scheduler._TaskScheduler__check_memory()
+        assert scheduler._TaskScheduler__paused == []
+        assert _is_stopped(procs[1].pid, stopped=False)
+    finally:
+        for proc in procs:
+            proc.kill()
+            proc.wait()
+
+
+def test_run_memory_requeue(large_flow, make_tasks, monkeypatch):
+    large_flow.set('option', 'scheduler', 'memorypressure', 'requeue')
+
+    usage = [95]
+
+    def virtual_memory():
+        if usage:
+            return _MemoryUsage(usage.pop())
+        return _MemoryUsage(50)
+
+    monkeypatch.setattr(psutil, "virtual_memory", virtual_memory)
+
+    started = []
+    monkeypatch.setitem(TaskScheduler._TaskScheduler__callbacks, "pre_node",
+                        lambda proj, step, index: started.append((step, index)))
+
+    scheduler = TaskScheduler(large_flow, make_tasks(large_flow))
+    scheduler._TaskScheduler__max_cores = 3
+    scheduler._TaskScheduler__max_parallel_run = 3
+    for info in scheduler._TaskScheduler__nodes.values():
+        info["threads"] = 1
+    scheduler.run(logging.NullHandler())
+
+    # One of the first nodes was started twice
+    assert len(started) == 13
+    assert len(set(started[:3])) == 3
+    assert started[3] in started[:3]
+    for step, index in large_flow.get("flowgraph", "testflow", field="schema").get_nodes():
+        assert large_flow.get("record", "status", step=step, index=index) == NodeStatus.SUCCESS
@@ -10,6 +10,7 @@ from siliconcompiler.schema import BaseSchema
 from siliconcompiler.schema import EditableSchema
 from siliconcompiler.schema import Parameter, PerNode
 from siliconcompiler.schema import Journal
+from siliconcompiler.schema import SCHEMA_VERSION
 
 
 def test_copy():
@@ -381,6 +382,133 @@ def test_remove_locked():
     assert schema.getkeys("test0") == tuple(["test2"])
 
 
+def test_search_cache():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "default", "test1", Parameter("str"))
+
+    assert schema.set("test0", "test2", "test1", "hello")
+    param = schema.get("test0", "test2", "test1", field=None)
+    assert schema._BaseSchema__search_cache == {("test0", "test2", "test1"): param}
+    assert schema.get("test0", "test2", "test1", field=None) is param
+
+
+def test_search_cache_no_defaults():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "default", "test1", Parameter("str"))
+
+    assert schema.get("test0", "default", "test1") is None
+    assert schema.get("test0", "test2", "test1") is None
+    assert schema._BaseSchema__search_cache == {}
+
+
+def test_search_cache_remove():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "default", "test1", Parameter("str"))
+
+    assert schema.set("test0", "test2", "test1", "hello")
+    assert schema.get("test0", "test2", "test1") == "hello"
+
+    schema.remove("test0", "test2")
+    assert schema.get("test0", "test2", "test1") is None
+
+
+def test_search_cache_editable_insert():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("str", defvalue="hello"))
+    assert schema.get("test0", "test1") == "hello"
+
+    edit.insert("test0", "test1", Parameter("str", defvalue="world"), clobber=True)
+    assert schema.get("test0", "test1") == "world"
+
+
+def test_search_cache_editable_remove():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("str", defvalue="hello"))
+    assert schema.get("test0", "test1") == "hello"
+
+    edit.remove("test0", "test1")
+    with pytest.raises(KeyError, match=r"\[test0,test1\] is not a valid keypath"):
+        schema.get("test0", "test1")
+
+
+def test_search_cache_from_dict():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "default", "test1", Parameter("str"))
+    assert schema.set("test0", "test2", "test1", "hello")
+    assert schema.get("test0", "test2", "test1") == "hello"
+
+    version = BaseSchema._BaseSchema__search_version
+    schema._from_dict(schema.getdict(), [])
+    assert BaseSchema._BaseSchema__search_version > version
+    assert schema.get("test0", "test2", "test1") == "hello"
+    assert schema._BaseSchema__search_cache_version == BaseSchema._BaseSchema__search_version
+
+
+def test_search_cache_not_copied():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", Parameter("str"))
+    assert schema.get("test0", "test1") is None
+    assert schema._BaseSchema__search_cache
+
+    assert schema.copy()._BaseSchema__search_cache == {}
+    assert schema._BaseSchema__search_cache
+
+
+def test_search_cache_get_schema_journal():
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("test0", "test1", "test2", Parameter("str"))
+
+    section = schema.get("test0", "test1", field="schema")
+    journal = Journal.access(section)
+    assert journal.keypath == ("test0", "test1")
+    assert schema.get("test0", "test1", field="schema") is section
+    assert Journal.access(section) is journal
+
+
+def test_search_cache_benchmark():
+    import time
+
+    schema = BaseSchema()
+    edit = EditableSchema(schema)
+    edit.insert("tool", "default", "task", "default", "var", "default", Parameter("[str]"))
+    keypaths = []
+    for tool in range(5):
+        for task in range(10):
+            for var in range(20):
+                keypath = ("tool", f"tool{tool}", "task", f"task{task}", "var", f"var{var}")
+                schema.set(*keypath, ["value"])
+                keypaths.append(keypath)
+
+    def access():
+        start = time.perf_counter()
+        for keypath in keypaths:
+            schema.get(*keypath)
+        return time.perf_counter() - start
+
+    def access_without_cache():
+        start = time.perf_counter()
+        for keypath in keypaths:
+            BaseSchema._invalidate_search_cache()
+            schema.get(*keypath)
+        return time.perf_counter() - start
+
+    # Warm up cache
+    access()
+
+    cached = min([access() for _ in range(5)])
+    uncached = min([access_without_cache() for _ in range(5)])
+
+    assert cached < uncached
+
+
 def test_insert_locked_default():
     schema = BaseSchema()
     edit = EditableSchema(schema)
@@ -1094,7 +1222,7 @@ def test_forward_exception_with_key_get(error, monkeypatch):
 
     def dummy_get(*args, **kwargs):
         raise error("this is an error from the param")
-    monkeypatch.setattr(param, 'get', dummy_get)
+    monkeypatch.setattr(Parameter, 'get', dummy_get)
 
     with pytest.raises(error,
                        match=r"error while accessing \[test0,test1\]: "
@@ -1111,7 +1239,7 @@ def test_forward_exception_with_key_set(error, monkeypatch):
 
     def dummy_set(*args, **kwargs):
         raise error("this is an error from the param")
-    monkeypatch.setattr(param, 'set', dummy_set)
+    monkeypatch.setattr(Parameter, 'set', dummy_set)
 
     with pytest.raises(error,
                        match=r"error while setting \[test0,test1\]: "
@@ -1128,7 +1256,7 @@ def test_forward_exception_with_key_add(error, monkeypatch):
 
     def dummy_add(*args, **kwargs):
         raise error("this is an error from the param")
-    monkeypatch.setattr(param, 'add', dummy_add)
+    monkeypatch.setattr(Parameter, 'add', dummy_add)
 
     with pytest.raises(error,
                        match=r"error while adding to \[test0,test1\]: "
@@ -1145,7 +1273,7 @@ def test_forward_exception_with_key_unset(error, monkeypatch):
 
     def dummy_unset(*args, **kwargs):
         raise error("this is an error from the param")
-    monkeypatch.setattr(param, 'unset', dummy_unset)
+    monkeypatch.setattr(Parameter, 'unset', dummy_unset)
 
     with pytest.raises(error,
                        match=r"error while unsetting \[test0,test1\]: "
@@ -2839,6 +2967,167 @@ def test_read_manifest_file():
     assert new_schema.getdict() == schema.getdict()
 
 
+class SectionedSchema(BaseSchema):
+    def __init__(self):
+        super().__init__()
+        edit = EditableSchema(self)
+        edit.insert("option", "var", Parameter("str"))
+        edit.insert("tool", "default", "var", Parameter("str"))
+        edit.insert("tool", "default", "sub", "var", Parameter("str"))
+        edit.insert("metric", "var", Parameter("int"))
+
+
+@pytest.fixture
+def sectioned_schema():
+    schema = SectionedSchema()
+    schema.set("option", "var", "option")
+    schema.set("tool", "tool0", "var", "tool0")
+    schema.set("tool", "tool0", "sub", "var", "tool0sub")
+    schema.set("tool", "tool1", "var", "tool1")
+    schema.set("metric", "var", 5)
+    return schema
+
+
+def test_write_manifest_indexed(sectioned_schema):
+    assert not os.path.isfile("test.idx")
+    sectioned_schema.write_manifest("test.idx")
+    assert os.path.isfile("test.idx")
+
+    with open("test.idx", "rb") as f:
+        assert f.read(7) == b"SCIDX1\n"
+
+
+def test_write_manifest_indexed_stdjson(sectioned_schema, monkeypatch):
+    import json
+    from siliconcompiler.schema import baseschema
+    monkeypatch.setattr(baseschema, 'json', json)
+    monkeypatch.setattr(baseschema, '_has_orjson', False)
+
+    sectioned_schema.write_manifest("test.idx")
+    assert BaseSchema._read_manifest("test.idx") == sectioned_schema.getdict()
+
+
+def test_read_manifest_indexed(sectioned_schema):
+    sectioned_schema.write_manifest("test.idx")
+    assert BaseSchema._read_manifest("test.idx") == sectioned_schema.getdict()
+
+
+def test_read_manifest_indexed_invalid():
+    with open("test.idx", "w") as f:
+        f.write("this is not an indexed manifest")
+
+    with pytest.raises(ValueError, match="test.idx is not an indexed manifest"):
+        BaseSchema._read_manifest("test.idx")
+
+
+@pytest.mark.parametrize("ext", ["json", "json.gz", "idx"])
+def test_read_manifest_keypaths(sectioned_schema, ext):
+    sectioned_schema.write_manifest(f"test.{ext}")
+
+    manifest = BaseSchema._read_manifest(f"test.{ext}", keypaths=[("option",)])
+    assert set(manifest.keys()) == {"__meta__", "option"}
+    assert manifest["option"] == sectioned_schema.getdict("option")
+
+
+@pytest.mark.parametrize("ext", ["json", "json.gz", "idx"])
+def test_read_manifest_keypaths_subsection(sectioned_schema, ext):
+    sectioned_schema.write_manifest(f"test.{ext}")
+
+    manifest = BaseSchema._read_manifest(f"test.{ext}",
+                                         keypaths=[("tool", "tool1"), ("metric",)])
+    assert set(manifest.keys()) == {"__meta__", "tool", "metric"}
+    assert set(manifest["tool"].keys()) == {"default", "tool1"}
+    assert manifest["tool"]["tool1"] == sectioned_schema.getdict("tool", "tool1")
+    assert manifest["metric"] == sectioned_schema.getdict("metric")
+
+
+@pytest.mark.parametrize("ext", ["json", "idx"])
+def test_read_manifest_keypaths_overlap(sectioned_schema, ext):
+    sectioned_schema.write_manifest(f"test.{ext}")
+
+    manifest = BaseSchema._read_manifest(f"test.{ext}",
+                                         keypaths=[("tool", "tool1"), ("tool",)])
+    assert manifest["tool"] == sectioned_schema.getdict("tool")
+
+
+@pytest.mark.parametrize("ext", ["json", "idx"])
+def test_read_manifest_keypaths_missing(sectioned_schema, ext):
+    sectioned_schema.write_manifest(f"test.{ext}")
+
+    assert set(BaseSchema._read_manifest(f"test.{ext}", keypaths=[("notakey",)]).keys()) == \
+        {"__meta__"}
+
+
+def test_from_manifest_indexed_keypaths(sectioned_schema):
+    sectioned_schema.write_manifest("test.idx")
+
+    new_schema = SectionedSchema.from_manifest(filepath="test.idx",
+                                               keypaths=[("tool", "tool0")])
+    assert new_schema.getkeys("tool") == ("tool0",)
+    assert new_schema.get("tool", "tool0", "sub", "var") == "tool0sub"
+    assert new_schema.get("option", "var") is None
+    assert new_schema.get("metric", "var") is None
+
+
+class CompactSchema(BaseSchema):
+    def __init__(self):
+        super().__init__()
+        edit = EditableSchema(self)
+        edit.insert("option", "var", Parameter("str", help="option help", switch="-var <str>"))
+        edit.insert("option", "flag", Parameter("bool", help="flag help"))
+        edit.insert("option", "list", Parameter("[str]", defvalue=["a", "b"], help="list help"))
+        edit.insert("tool", "default", "var", Parameter("int", defvalue=5, help="tool help"))
+
+
+@pytest.fixture
+def compact_schema():
+    schema = CompactSchema()
+    schema.set("option", "var", "option")
+    schema.set("tool", "tool0", "var", 10)
+    schema.set("tool", "tool1", "var", 10)
+    schema.unset("tool", "tool1", "var")
+    return schema
+
+
+@pytest.mark.parametrize("ext", ["json", "json.gz", "idx"])
+def test_write_manifest_compact(compact_schema, ext):
+    compact_schema.write_manifest(f"test.{ext}", compact=True)
+
+    manifest = BaseSchema._read_manifest(f"test.{ext}")
+    assert manifest["__compact__"] == {"version": SCHEMA_VERSION}
+    assert "default" not in manifest["tool"]
+    assert set(manifest["tool"].keys()) == {"tool0", "tool1"}
+
+    param = manifest["option"]["var"]
+    for field in ("help", "shorthelp", "example", "switch", "notes", "scope", "require"):
+        assert field not in param
+    assert param["type"] == "str"
+    assert set(param["node"].keys()) == {"global"}
+    assert manifest["option"]["list"]["node"] == {}
+
+
+@pytest.mark.parametrize("ext", ["json", "json.gz", "idx"])
+def test_from_manifest_compact(compact_schema, ext):
+    compact_schema.write_manifest(f"test.{ext}", compact=True)
+
+    new_schema = CompactSchema.from_manifest(filepath=f"test.{ext}")
+    assert new_schema.getdict() == compact_schema.getdict()
+    assert new_schema.get("option", "var") == "option"
+    assert new_schema.get("option", "var", field="help") == "option help"
+    assert new_schema.get("option", "var", field="switch") == ["-var <str>"]
+    assert new_schema.get("option", "flag") is False
+    assert new_schema.get("option", "list") == ["a", "b"]
+    assert new_schema.get("tool", "tool0", "var") == 10
+    assert new_schema.get("tool", "tool1", "var") == 5
+
+
+def test_write_manifest_compact_smaller(compact_schema):
+    compact_schema.write_manifest("verbose.json")
+    compact_schema.write_manifest("compact.json", compact=True)
+
+    assert os.path.getsize("compact.json") < os.path.getsize("verbose.json") / 2
+
+
 def test_hash_files_non_path():
     schema = BaseSchema()
     edit = EditableSchema(schema)
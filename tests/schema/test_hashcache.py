@@ -0,0 +1,103 @@
+import os
+import pickle
+import time
+
+import os.path
+
+from siliconcompiler.schema.hashcache import FileHashCache
+
+
+def _make_file(path, content='foobar\n', age=10):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w', newline='\n') as f:
+        f.write(content)
+    mtime = time.time() - age
+    os.utime(path, (mtime, mtime))
+
+
+def test_get_put():
+    cache = FileHashCache('hashes.db')
+    assert cache.get('key') is None
+    cache.put('key', 'digest')
+    assert cache.get('key') == 'digest'
+    assert len(cache) == 1
+    cache.close()
+
+    assert os.path.isfile('hashes.db')
+    assert FileHashCache('hashes.db').get('key') == 'digest'
+
+
+def test_get_put_none():
+    cache = FileHashCache('hashes.db')
+    cache.put(None, 'digest')
+    cache.put('key', None)
+    assert cache.get(None) is None
+    assert len(cache) == 0
+
+
+def test_eviction():
+    cache = FileHashCache('hashes.db', max_entries=2)
+    cache.put('key0', 'digest0')
+    cache.put('key1', 'digest1')
+    assert cache.get('key0') == 'digest0'
+    cache.put('key2', 'digest2')
+
+    assert len(cache) == 2
+    assert cache.get('key0') == 'digest0'
+    assert cache.get('key1') is None
+    assert cache.get('key2') == 'digest2'
+
+
+def test_file_key():
+    _make_file('foo.txt')
+
+    key = FileHashCache.file_key('foo.txt', 'sha256')
+    assert key.startswith('file:')
+    assert key.endswith(':sha256')
+    assert key == FileHashCache.file_key('foo.txt', 'sha256')
+    assert key != FileHashCache.file_key('foo.txt', 'md5')
+
+    _make_file('foo.txt', content='barfoo\n', age=5)
+    assert key != FileHashCache.file_key('foo.txt', 'sha256')
+
+
+def test_file_key_racy():
+    _make_file('foo.txt', age=0)
+    assert FileHashCache.file_key('foo.txt', 'sha256') is None
+
+
+def test_directory_key():
+    _make_file('test/foo.txt')
+    _make_file('test/sub/bar.txt')
+
+    key = FileHashCache.directory_key('test', 'sha256')
+    assert key.startswith('dir:')
+    assert key == FileHashCache.directory_key('test', 'sha256')
+
+    os.rename('test/sub/bar.txt', 'test/sub/bar2.txt')
+    assert key != FileHashCache.directory_key('test', 'sha256')
+
+
+def test_directory_key_racy():
+    _make_file('test/foo.txt')
+    _make_file('test/sub/bar.txt', age=0)
+
+    assert FileHashCache.directory_key('test', 'sha256') is None
+
+
+def test_invalid_path():
+    _make_file('notadir')
+
+    cache = FileHashCache('notadir/hashes.db')
+    cache.put('key', 'digest')
+    assert cache.get('key') is None
+    assert len(cache) == 0
+
+
+def test_pickle():
+    cache = FileHashCache('hashes.db')
+    cache.put('key', 'digest')
+
+    new_cache = pickle.loads(pickle.dumps(cache))
+    assert new_cache.path == cache.path
+    assert new_cache.get('key') == 'digest'
@@ -395,7 +395,7 @@ def test_forward_exception_with_key_set_replay(error, monkeypatch):
 
     def dummy_set(*args, **kwargs):
         raise error("this is an error from the param")
-    monkeypatch.setattr(param, 'set', dummy_set)
+    monkeypatch.setattr(Parameter, 'set', dummy_set)
 
     journal = Journal()
     journal._Journal__journal = [
@@ -424,7 +424,7 @@ def test_forward_exception_with_key_add_replay(error, monkeypatch):
 
     def dummy_add(*args, **kwargs):
         raise error("this is an error from the param")
-    monkeypatch.setattr(param, 'add', dummy_add)
+    monkeypatch.setattr(Parameter, 'add', dummy_add)
 
     journal = Journal()
     journal._Journal__journal = [
@@ -575,6 +575,36 @@ def test_from_dict_locked():
     assert expect == param_check.getdict()
 
 
+def test_from_dict_no_default():
+    param = Parameter("[str]", defvalue=["default"], help="long help",
+                      pernode=PerNode.OPTIONAL)
+    param.set(["test"], step="teststep", index="0")
+
+    manifest = {
+        "type": "[str]",
+        "node": {"teststep": {"0": {"value": ["value"], "signature": [None]}}}}
+    param._from_dict(manifest, [], None)
+
+    assert param.get() == ["default"]
+    assert param.get(field="help") == "long help"
+    assert param.get(step="teststep", index="0") == ["value"]
+
+
+def test_from_dict_no_default_type_changed():
+    param = Parameter("int", defvalue=5)
+
+    param._from_dict({"type": "str", "node": {}}, [], None)
+
+    assert param.get(field="type") == "str"
+    assert param.get() is None
+
+
+def test_from_dict_no_default_bool():
+    param = Parameter.from_dict({"type": "bool", "node": {}}, [], None)
+
+    assert param.get() is False
+
+
 def test_list_of_lists_str():
     param = Parameter("[[str]]")
     param.set([['foo']])
@@ -780,6 +810,139 @@ def test_copy():
     assert param.getdict() == copy_param.getdict()
 
 
+def test_copy_set_independent():
+    param = Parameter("str", pernode=PerNode.OPTIONAL)
+    param.set("original")
+    param.set("original_step", step="step", index="0")
+
+    copy_param = param.copy()
+    assert copy_param.get() == "original"
+    assert copy_param.get(step="step", index="0") == "original_step"
+
+    assert copy_param.set("copy")
+    assert copy_param.set("copy_step", step="step", index="0")
+    assert param.get() == "original"
+    assert param.get(step="step", index="0") == "original_step"
+
+    assert param.set("original_new")
+    assert copy_param.get() == "copy"
+
+
+def test_copy_original_modified():
+    param = Parameter("[str]")
+    param.set(["a"])
+
+    copy_param = param.copy()
+    assert param.add("b")
+    assert param.add("-switch <str>", field="switch")
+
+    assert param.get() == ["a", "b"]
+    assert copy_param.get() == ["a"]
+    assert copy_param.get(field="switch") == []
+
+
+def test_copy_unset_independent():
+    param = Parameter("str")
+    param.set("original")
+
+    copy_param = param.copy()
+    copy_param.unset()
+
+    assert param.get() == "original"
+    assert copy_param.get() is None
+
+
+def test_copy_getvalues_nodevalues_independent():
+    param = Parameter("str")
+    param.set("original")
+
+    copy_param = param.copy()
+    for value, _, _ in copy_param.getvalues(return_values=False):
+        value.set("copy")
+
+    assert param.get() == "original"
+    assert copy_param.get() == "copy"
+
+
+def test_copy_of_copy():
+    param = Parameter("str")
+    param.set("original")
+
+    copy_param = param.copy()
+    copy_copy_param = copy_param.copy()
+    copy_param.set("copy")
+    copy_copy_param.set("copy_copy")
+
+    assert param.get() == "original"
+    assert copy_param.get() == "copy"
+    assert copy_copy_param.get() == "copy_copy"
+
+
+def test_definition_shared():
+    param0 = Parameter("[str]", switch="-test <str>", help="test help")
+    param1 = Parameter("[str]", switch="-test <str>", help="test help")
+    param2 = Parameter("[str]", switch="-test <str>", help="other help")
+
+    assert param0._Parameter__definition is param1._Parameter__definition
+    assert param0._Parameter__definition is not param2._Parameter__definition
+
+
+def test_definition_set_independent():
+    param0 = Parameter("[str]", switch="-test <str>", help="test help")
+    param1 = Parameter("[str]", switch="-test <str>", help="test help")
+
+    assert param0.set("new help", field="help")
+    assert param0.add("-other <str>", field="switch")
+    assert param0.set(True, field="lock")
+
+    assert param0.get(field="help") == "new help"
+    assert param0.get(field="switch") == ["-test <str>", "-other <str>"]
+    assert param0.get(field="lock") is True
+    assert param1.get(field="help") == "test help"
+    assert param1.get(field="switch") == ["-test <str>"]
+    assert param1.get(field="lock") is False
+
+
+def test_definition_get_list_independent():
+    param = Parameter("[str]", switch="-test <str>", example="example")
+
+    param.get(field="switch").append("-other <str>")
+    param.get(field="example").append("other")
+
+    assert param.get(field="switch") == ["-test <str>"]
+    assert param.get(field="example") == ["example"]
+
+
+def test_definition_shared_from_dict():
+    param = Parameter("[str]", switch="-test <str>", help="test help")
+    param.set(["value"])
+
+    new_param = Parameter.from_dict(param.getdict(), None, None)
+
+    assert new_param._Parameter__definition is param._Parameter__definition
+    assert new_param.get() == ["value"]
+
+
+def test_definition_shared_pickle():
+    import pickle
+
+    param = Parameter("[file]", switch="-test <file>", help="test help")
+    param.set(["test.txt"])
+
+    new_param = pickle.loads(pickle.dumps(param))
+
+    assert new_param._Parameter__definition is param._Parameter__definition
+    assert new_param.get() == ["test.txt"]
+
+
+def test_slots():
+    param = Parameter("str")
+
+    assert not hasattr(param, "__dict__")
+    with pytest.raises(AttributeError):
+        param.test = "test"
+
+
 def test_tcl_optional():
     param = Parameter("str", pernode=PerNode.OPTIONAL)
 
@@ -8,6 +8,7 @@ from siliconcompiler.schema.parametervalue import \
     NodeValue, DirectoryNodeValue, FileNodeValue, NodeListValue, \
     PathNodeValue, NodeSetValue
 from siliconcompiler.schema.parametertype import NodeEnumType
+from siliconcompiler.schema.hashcache import FileHashCache
 
 enum1 = NodeEnumType("one", "two", "three")
 enum2 = NodeEnumType("one", "two", "three", "four")
@@ -135,6 +136,29 @@ def test_copy():
     assert value is not new_value
 
 
+@pytest.mark.parametrize("value", [
+    NodeValue("str"),
+    DirectoryNodeValue(),
+    FileNodeValue(),
+    NodeListValue(NodeValue("str")),
+    NodeSetValue(NodeValue("str"))])
+def test_slots(value):
+    assert not hasattr(value, "__dict__")
+    with pytest.raises(AttributeError):
+        value.test = "test"
+
+
+def test_copy_file_author_independent():
+    value = FileNodeValue()
+    value.set(["author0"], field="author")
+
+    new_value = value.copy()
+    new_value.add("author1", field="author")
+
+    assert value.get(field="author") == ["author0"]
+    assert new_value.get(field="author") == ["author0", "author1"]
+
+
 def test_value_init():
     assert NodeValue("str").get() is None
     assert NodeValue("str", value="test").get() == "test"
@@ -1448,3 +1472,65 @@ def test_set_has_value_with_value(type, value):
     node = NodeSetValue(NodeValue(type))
     node.set(value)
     assert node.has_value is True
+
+
+def test_file_hash_empty():
+    with open('foo.txt', 'w'):
+        pass
+
+    param = FileNodeValue()
+    param.set('foo.txt')
+
+    assert param.hash('md5') == 'd41d8cd98f00b204e9800998ecf8427e'
+
+
+def test_file_hash_large(monkeypatch):
+    monkeypatch.setattr(PathNodeValue, "_PathNodeValue__hash_block_size", 3)
+
+    with open('foo.txt', 'w', newline='\n') as f:
+        f.write('foobar\n')
+
+    param = FileNodeValue()
+    param.set('foo.txt')
+
+    assert param.hash('md5') == '14758f1afd44c09b7992073ccf00b43d'
+
+
+def test_file_hash_with_cache():
+    with open('foo.txt', 'w', newline='\n') as f:
+        f.write('foobar\n')
+    os.utime('foo.txt', (0, 0))
+
+    param = FileNodeValue()
+    param.set('foo.txt')
+
+    cache = FileHashCache('hashes.db')
+    with PathNodeValue.use_hash_cache(cache):
+        assert param.hash('md5') == '14758f1afd44c09b7992073ccf00b43d'
+    assert len(cache) == 1
+
+    cache.put(FileHashCache.file_key('foo.txt', 'md5'), 'cached')
+    with PathNodeValue.use_hash_cache(cache):
+        assert param.hash('md5') == 'cached'
+    assert param.hash('md5') == '14758f1afd44c09b7992073ccf00b43d'
+
+
+def test_directory_hash_with_cache():
+    os.makedirs('test1', exist_ok=True)
+    with open('test1/foo.txt', 'w', newline='\n') as f:
+        f.write('foobar\n')
+    with open('test1/foo1.txt', 'w', newline='\n') as f:
+        f.write('foobar\n')
+    os.utime('test1/foo.txt', (0, 0))
+    os.utime('test1/foo1.txt', (0, 0))
+
+    param = DirectoryNodeValue()
+    param.set("test1")
+
+    cache = FileHashCache('hashes.db')
+    with PathNodeValue.use_hash_cache(cache):
+        assert param.hash('md5') == 'b9e044ee9606b2b5ac73e2213c2eedc7'
+        assert len(cache) == 1
+
+        cache.put(FileHashCache.directory_key('test1', 'md5'), 'cached')
+        assert param.hash('md5') == 'cached'
@@ -925,3 +925,114 @@ def test_get_clock_none(running_project, running_node):
 
     assert name is None
     assert sdc_period is None
+
+
+def test_copy_independent(asic_gcd):
+    project_copy = asic_gcd.copy()
+
+    project_copy.set("option", "jobname", "copyjob")
+    project_copy.add("option", "to", "syn")
+    assert asic_gcd.get("option", "jobname") == "job0"
+    assert asic_gcd.get("option", "to") == []
+
+    asic_gcd.set("option", "clean", True)
+    assert project_copy.get("option", "clean") is False
+
+
+def test_copy_benchmark(asic_gcd):
+    import pickle
+    import time
+    import tracemalloc
+
+    def measure(func):
+        # Warm up
+        func()
+
+        duration = []
+        for _ in range(3):
+            start = time.perf_counter()
+            func()
+            duration.append(time.perf_counter() - start)
+
+        tracemalloc.start()
+        try:
+            result = func()
+            memory, _ = tracemalloc.get_traced_memory()
+            del result
+        finally:
+            tracemalloc.stop()
+
+        return min(duration), memory
+
+    def full_copy():
+        return pickle.loads(pickle.dumps(asic_gcd))
+
+    copy_time, copy_memory = measure(asic_gcd.copy)
+    full_time, full_memory = measure(full_copy)
+
+    assert copy_time < full_time
+    assert copy_memory < full_memory
+
+
+def test_load_memory_benchmark(asic_gcd):
+    import json
+    import tracemalloc
+
+    manifest = "asic.json"
+    asic_gcd.write_manifest(manifest)
+
+    def measure(func):
+        tracemalloc.start()
+        try:
+            result = func()
+            memory, _ = tracemalloc.get_traced_memory()
+            del result
+        finally:
+            tracemalloc.stop()
+        return memory
+
+    def load_json():
+        with open(manifest) as f:
+            return json.load(f)
+
+    def load_project():
+        return Project.from_manifest(filepath=manifest)
+
+    # Keep a loaded project, as in a job history
+    history = load_project()
+
+    json_memory = measure(load_json)
+    project_memory = measure(load_project)
+
+    # The static fields of the parameters are shared with the loaded project
+    assert project_memory < json_memory / 2
+    assert history.get("option", "design") == asic_gcd.get("option", "design")
+
+
+def test_compact_manifest(asic_gcd):
+    asic_gcd.write_manifest("verbose.json")
+    asic_gcd.write_manifest("compact.json", compact=True)
+
+    project = Project.from_manifest(filepath="compact.json")
+    assert isinstance(project, ASICProject)
+    assert project.getdict() == Project.from_manifest(filepath="verbose.json").getdict()
+
+
+def test_compact_manifest_benchmark(asic_gcd):
+    import json
+    import time
+
+    asic_gcd.write_manifest("verbose.json")
+    asic_gcd.write_manifest("compact.json", compact=True)
+
+    def parse_time(manifest):
+        duration = []
+        for _ in range(3):
+            start = time.perf_counter()
+            with open(manifest) as f:
+                json.load(f)
+            duration.append(time.perf_counter() - start)
+        return min(duration)
+
+    assert os.path.getsize("compact.json") < os.path.getsize("verbose.json") / 4
+    assert parse_time("compact.json") < parse_time("verbose.json") / 2
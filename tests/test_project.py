@@ -18,6 +18,7 @@ from siliconcompiler.schema import NamedSchema, EditableSchema, Parameter
 from siliconcompiler.utils.logging import SCColorLoggerFormatter, SCLoggerFormatter
 
 from siliconcompiler.project import SCColorLoggerFormatter as dut_sc_color_logger
+from siliconcompiler.project import _HistoryReference
 
 
 class FauxTask0(TaskSchema):
@@ -272,6 +273,80 @@ def test_history_missing():
         Project().history("job0")
 
 
+def test_record_history_external():
+    proj = Project("testname")
+    proj.set("option", "externalhistory", True)
+    proj._record_history()
+    proj.set("option", "jobname", "job1")
+    proj._record_history()
+
+    assert proj.getkeys("history") == ("job0", "job1")
+    ref = proj.get("history", "job0", field="schema")
+    assert isinstance(ref, _HistoryReference)
+    assert os.path.isfile(ref.path)
+    assert os.path.dirname(ref.path) == os.path.abspath(os.path.join("build", "testname",
+                                                                     "history"))
+
+    job0 = proj.history("job0")
+    assert isinstance(job0, Project)
+    assert job0.get("option", "jobname") == "job0"
+    assert job0.getkeys("history") == tuple()
+    assert proj.history("job0") is job0
+
+    assert proj.history("job1").get("option", "jobname") == "job1"
+
+
+def test_record_history_external_dedup():
+    proj = Project("testname")
+    proj.set("option", "externalhistory", True)
+    proj._record_history()
+    first = proj.get("history", "job0", field="schema")
+    proj._record_history()
+
+    assert len(os.listdir(os.path.join("build", "testname", "history"))) == 1
+    assert proj.get("history", "job0", field="schema").hash == first.hash
+
+    proj.set("option", "jobname", "job1")
+    proj._record_history()
+
+    assert len(os.listdir(os.path.join("build", "testname", "history"))) == 2
+    assert proj.get("history", "job1", field="schema").hash != first.hash
+
+
+def test_record_history_external_manifest_size():
+    proj = Project("testname")
+    proj.set("option", "externalhistory", True)
+    proj.write_manifest("start.json")
+
+    for n in range(5):
+        proj.set("option", "jobname", f"job{n}")
+        proj._record_history()
+    proj.write_manifest("end.json")
+
+    assert os.path.getsize("end.json") < 1.1 * os.path.getsize("start.json")
+
+    new_proj = Project.from_manifest(filepath="end.json")
+    assert new_proj.getkeys("history") == ("job0", "job1", "job2", "job3", "job4")
+    assert isinstance(new_proj.get("history", "job3", field="schema"), _HistoryReference)
+    assert new_proj.history("job3").get("option", "jobname") == "job3"
+
+
+def test_record_history_external_moved():
+    proj = Project("testname")
+    proj.set("option", "externalhistory", True)
+    proj._record_history()
+    proj.write_manifest("test.json")
+
+    os.rename("build", "newbuild")
+
+    new_proj = Project.from_manifest(filepath="test.json")
+    with pytest.raises(FileNotFoundError, match="history manifest not found"):
+        new_proj.history("job0")
+
+    new_proj.set("option", "builddir", "newbuild")
+    assert new_proj.history("job0").get("option", "jobname") == "job0"
+
+
 def test_add_fileset():
     design = DesignSchema("test")
     with design.active_fileset("rtl"):
@@ -1154,6 +1229,61 @@ def test_collect_file_whitelist_pass():
     assert len(os.listdir(proj.getcollectiondir())) == 1
 
 
+def test_collect_file_unchanged():
+    design = DesignSchema("testdesign")
+    with design.active_fileset("rtl"):
+        with design._active(copy=True):
+            design.add_file("top.v")
+            design.add_file("other.v")
+    with open("top.v", "w") as f:
+        f.write("top")
+    with open("other.v", "w") as f:
+        f.write("other")
+
+    proj = Project(design)
+    proj.collect(link=False)
+
+    top, other = [os.path.join(proj.getcollectiondir(), os.path.basename(f))
+                  for f in design.get_file(fileset="rtl", filetype="verilog")]
+    top_inode = os.stat(top).st_ino
+    other_inode = os.stat(other).st_ino
+
+    with open("other.v", "w") as f:
+        f.write("newother")
+    os.utime("other.v", ns=(0, os.stat("other.v").st_mtime_ns + 1000000000))
+
+    proj.collect(link=False)
+
+    assert os.stat(top).st_ino == top_inode
+    assert os.stat(other).st_ino != other_inode
+    with open(other) as f:
+        assert f.read() == "newother"
+
+
+def test_collect_file_deduplicate():
+    design = DesignSchema("testdesign")
+    with design.active_fileset("rtl"):
+        with design._active(copy=True):
+            design.add_file("a/top.v")
+    with design.active_fileset("sim"):
+        with design._active(copy=True):
+            design.add_file("b/top.v")
+    os.makedirs("a")
+    os.makedirs("b")
+    for path in ("a/top.v", "b/top.v"):
+        with open(path, "w") as f:
+            f.write("top")
+
+    proj = Project(design)
+    proj.collect(link=False)
+
+    assert len(os.listdir(proj.getcollectiondir())) == 2
+    rtl = design.get_file(fileset="rtl", filetype="verilog")[0]
+    sim = design.get_file(fileset="sim", filetype="verilog")[0]
+    assert rtl != sim
+    assert os.path.samefile(rtl, sim)
+
+
 def test_get_task():
     class FauxTask(TaskSchema):
         def tool(self):
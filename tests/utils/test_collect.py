@@ -0,0 +1,128 @@
+import os
+
+from siliconcompiler.utils.collect import FileCollector
+
+
+def _write(path, content):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(content)
+
+
+def _read(path):
+    with open(path) as f:
+        return f.read()
+
+
+def test_collect_file():
+    _write("src/a.v", "a")
+
+    collector = FileCollector("collect")
+    assert collector.add_file("src/a.v", "a_0.v")
+    assert not collector.add_file("src/a.v", "a_0.v")
+    collector.collect()
+
+    assert os.listdir("collect") == ["a_0.v"]
+    assert _read("collect/a_0.v") == "a"
+
+
+def test_collect_directory():
+    _write("src/a.v", "a")
+    _write("src/sub/b.v", "b")
+    _write("src/.hidden", "hidden")
+
+    collector = FileCollector("collect")
+    assert collector.add_directory(
+        "src", "src_0",
+        ignore=lambda path, names: [n for n in names if n.startswith(".")])
+    assert collector.has("src_0")
+    assert collector.has(os.path.join("src_0", "sub", "b.v"))
+    assert not collector.has(os.path.join("src_0", ".hidden"))
+    collector.collect()
+
+    assert sorted(os.listdir("collect/src_0")) == ["a.v", "sub"]
+    assert _read("collect/src_0/sub/b.v") == "b"
+
+
+def test_collect_no_link():
+    _write("src/a.v", "a")
+
+    collector = FileCollector("collect", link=False)
+    collector.add_file("src/a.v", "a_0.v")
+    collector.collect()
+
+    assert not os.path.samefile("src/a.v", "collect/a_0.v")
+    assert os.stat("collect/a_0.v").st_mtime_ns == os.stat("src/a.v").st_mtime_ns
+
+
+def test_collect_deduplicate():
+    _write("src0/a.v", "same")
+    _write("src1/a.v", "same")
+    _write("src2/a.v", "diff")
+
+    collector = FileCollector("collect", link=False)
+    collector.add_file("src0/a.v", "a_0.v")
+    collector.add_file("src1/a.v", "a_1.v")
+    collector.add_file("src2/a.v", "a_2.v")
+    collector.collect()
+
+    assert os.path.samefile("collect/a_0.v", "collect/a_1.v")
+    assert not os.path.samefile("collect/a_0.v", "collect/a_2.v")
+    assert _read("collect/a_1.v") == "same"
+    assert _read("collect/a_2.v") == "diff"
+
+
+def test_collect_only_changed():
+    _write("src/a.v", "a")
+    _write("src/b.v", "b")
+
+    collector = FileCollector("collect", link=False)
+    collector.add_file("src/a.v", "a_0.v")
+    collector.add_file("src/b.v", "b_0.v")
+    collector.collect()
+
+    a_inode = os.stat("collect/a_0.v").st_ino
+    b_inode = os.stat("collect/b_0.v").st_ino
+
+    _write("src/b.v", "newb")
+    os.utime("src/b.v", ns=(0, os.stat("src/b.v").st_mtime_ns + 1000000000))
+
+    collector = FileCollector("collect", link=False)
+    collector.add_file("src/a.v", "a_0.v")
+    collector.add_file("src/b.v", "b_0.v")
+    collector.collect()
+
+    assert os.stat("collect/a_0.v").st_ino == a_inode
+    assert os.stat("collect/b_0.v").st_ino != b_inode
+    assert _read("collect/b_0.v") == "newb"
+
+
+def test_collect_remove_stale():
+    _write("src/a.v", "a")
+    _write("collect/old.v", "old")
+    _write("collect/olddir/old.v", "old")
+
+    collector = FileCollector("collect")
+    collector.add_file("src/a.v", "a_0.v")
+    collector.collect()
+
+    assert os.listdir("collect") == ["a_0.v"]
+
+
+def test_collect_link_does_not_modify_source():
+    _write("src/a.v", "a")
+
+    collector = FileCollector("collect")
+    collector.add_file("src/a.v", "a_0.v")
+    collector.collect()
+
+    # The collected file may be linked to the source, so it must be replaced
+    # and not written through
+    _write("src/b.v", "b")
+
+    collector = FileCollector("collect", link=False)
+    collector.add_file("src/b.v", "a_0.v")
+    collector.collect()
+
+    assert _read("src/a.v") == "a"
+    assert _read("collect/a_0.v") == "b"
@@ -0,0 +1,135 @@
+import io
+import time
+
+from siliconcompiler import utils
+from siliconcompiler.utils.logscan import LogScanner
+
+
+def _log(lines):
+    return io.StringIO("".join(f"{line}\n" for line in lines))
+
+
+def test_scan():
+    scanner = LogScanner(None, {
+        "errors": ["^Error"],
+        "warnings": ["^Warning", "-v ignore"],
+    })
+
+    count, found = scanner.scan(_log([
+        "Info: start",
+        "Warning: first",
+        "Error: broken",
+        "Warning: ignore this",
+        "Info: done"
+    ]))
+
+    assert count == 5
+    assert found == {
+        "errors": [(3, "Error: broken\n")],
+        "warnings": [(2, "Warning: first\n")]
+    }
+
+
+def test_scan_empty():
+    scanner = LogScanner(None, {"errors": ["^Error"]})
+    assert scanner.scan(_log([])) == (0, {"errors": []})
+
+
+def test_scan_inverted_only():
+    scanner = LogScanner(None, {
+        "errors": ["^Error"],
+        "other": ["-v ^Info"],
+    })
+
+    count, found = scanner.scan(_log([
+        "Info: start",
+        "Error: broken",
+        "Done"
+    ]))
+
+    assert count == 3
+    assert found == {
+        "errors": [(2, "Error: broken\n")],
+        "other": [(2, "Error: broken\n"), (3, "Done\n")]
+    }
+
+
+def test_scan_backreference():
+    scanner = LogScanner(None, {
+        "errors": ["^Fatal"],
+        "repeat": [r"(\w)\2"],
+    })
+
+    count, found = scanner.scan(_log([
+        "Info: start",
+        "Fatal: bad",
+        "aabb"
+    ]))
+
+    assert count == 3
+    assert found == {
+        "errors": [(2, "Fatal: bad\n")],
+        "repeat": [(3, "aabb\n")]
+    }
+
+
+def test_scan_matches_grep():
+    checks = {
+        "errors": ["-i ^error", "-v ignore"],
+        "warnings": ["^Warning"],
+        "timing": ["-e -slack", "-v met"],
+    }
+    lines = [
+        "ERROR: broken",
+        "error: ignore me",
+        "Warning: check this",
+        "Info: -slack violated",
+        "Info: -slack met",
+        "Info: nothing"
+    ]
+
+    _, found = LogScanner(None, checks).scan(_log(lines))
+
+    for suffix, args in checks.items():
+        expect = []
+        for num, line in enumerate(lines, start=1):
+            for arg in args:
+                line = utils.grep(None, arg, line)
+            if line is not None:
+                expect.append((num, f"{line}\n"))
+        assert [(num, line) for num, line in found[suffix]] == expect
+
+
+def test_scan_faster_than_grep():
+    checks = {
+        "errors": ["^Error", "-v ignore"],
+        "warnings": ["^Warning"],
+        "drc": ["DRC violation"],
+    }
+    lines = []
+    for n in range(50000):
+        if n % 1000 == 0:
+            lines.append(f"Error: failed step {n}")
+        elif n % 100 == 0:
+            lines.append(f"Warning: check {n}")
+        else:
+            lines.append(f"Info: processing item {n} of the design")
+    log = "".join(f"{line}\n" for line in lines)
+
+    start = time.perf_counter()
+    baseline = {suffix: 0 for suffix in checks}
+    for line in io.StringIO(log):
+        for suffix, args in checks.items():
+            match = line
+            for arg in args:
+                match = utils.grep(None, arg, match)
+            if match:
+                baseline[suffix] += 1
+    grep_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _, found = LogScanner(None, checks).scan(io.StringIO(log))
+    scan_time = time.perf_counter() - start
+
+    assert {suffix: len(matches) for suffix, matches in found.items()} == baseline
+    assert scan_time < grep_time
@@ -2,7 +2,7 @@ import pytest
 
 from siliconcompiler.utils import \
     truncate_text, safecompare, get_cores, \
-    get_plugins
+    get_plugins, grep, compile_grep
 
 
 @pytest.mark.parametrize("text", (
@@ -151,3 +151,22 @@ def test_get_plugin():
     assert len(get_plugins("path_resolver")) > 0
 
     assert len(get_plugins("path_resolver", "https")) == 1
+
+
+@pytest.mark.parametrize("args,line,expect", [
+    ("error", "this is an error", "this is an error"),
+    ("error", "this is a warning", None),
+    ("-v error", "this is an error", None),
+    ("-v error", "this is a warning", "this is a warning"),
+    ("-e -error", "this is a -error", "this is a -error"),
+    ("error", None, None),
+])
+def test_grep(args, line, expect):
+    assert grep(None, args, line) == expect
+
+
+def test_compile_grep():
+    regex, invert = compile_grep(None, "-v ^warning")
+    assert invert
+    assert regex.search("warning: test")
+    assert not regex.search("error: test")